@@ -15,6 +15,7 @@ from pystac import (
     StacIO,
     TemporalExtent,
 )
+from pystac.stac_io import JSONProfile
 
 from ._base import Bench
 from ._util import get_data_path
@@ -103,6 +104,38 @@ class WriteCatalogBench(Bench):
     def time_normalize_and_save(self) -> None:
         self.catalog.normalize_and_save(self.temporary_directory.name)
 
+    def time_normalize_and_save_max_workers(self) -> None:
+        self.catalog.normalize_and_save(self.temporary_directory.name, max_workers=8)
+
+
+class JSONProfileBench(Bench):
+    params = [json_profile.value for json_profile in JSONProfile]
+    param_names = ["json_profile"]
+
+    def setup(self, json_profile: str) -> None:
+        self.catalog = make_large_catalog()
+        self.temporary_directory = TemporaryDirectory()
+
+    def teardown(self, json_profile: str) -> None:
+        shutil.rmtree(self.temporary_directory.name)
+
+    def time_normalize_and_save(self, json_profile: str) -> None:
+        self.catalog.normalize_and_save(
+            self.temporary_directory.name, json_profile=json_profile
+        )
+
+    def track_size(self, json_profile: str) -> int:
+        """Total size in bytes of the saved catalog."""
+        self.catalog.normalize_and_save(
+            self.temporary_directory.name, json_profile=json_profile
+        )
+        return sum(
+            path.stat().st_size
+            for path in Path(self.temporary_directory.name).rglob("*.json")
+        )
+
+    track_size.unit = "bytes"  # type: ignore[attr-defined]
+
 
 def make_large_catalog() -> Catalog:
     catalog = Catalog("an-id", "a description")
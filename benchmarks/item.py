@@ -1,4 +1,5 @@
 import json
+import math
 import os
 import shutil
 import tempfile
@@ -28,6 +29,26 @@ class ItemBench(Bench):
             self.item_dict = json.load(src)
         self.item = Item.from_file(self.item_path)
 
+        # a detailed multipolygon footprint, where copying the geometry dominates
+        self.large_geometry_dict = {
+            **self.item_dict,
+            "geometry": {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [
+                        [
+                            [float(x + i), float(math.sin(x / 100) + i)]
+                            for x in range(1000)
+                        ]
+                    ]
+                    for i in range(20)
+                ],
+            },
+        }
+        self.large_geometry_item = Item.from_dict_copy_on_write(
+            self.large_geometry_dict
+        )
+
     def teardown(self) -> None:
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
@@ -39,6 +60,19 @@ class ItemBench(Bench):
         """Deserialize an Item from dictionary."""
         _ = Item.from_dict(self.item_dict)
 
+    def time_item_from_dict_large_geometry(self) -> None:
+        """Deserialize an Item with a large geometry from dictionary."""
+        _ = Item.from_dict(self.large_geometry_dict)
+
+    def time_item_from_dict_large_geometry_copy_on_write(self) -> None:
+        """Deserialize an Item with a large geometry from dictionary, sharing the
+        geometry with the dictionary."""
+        _ = Item.from_dict_copy_on_write(self.large_geometry_dict)
+
+    def time_item_clone_large_geometry_copy_on_write(self) -> None:
+        """Clone an Item whose large geometry is shared with its dictionary."""
+        _ = self.large_geometry_item.clone()
+
     def time_item_to_dict(self) -> None:
         """Serialize an Item to a dictionary."""
         self.item.to_dict(include_self_link=True)
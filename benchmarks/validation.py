@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from pystac import Item
+from pystac.validation import CompiledSTACValidator, JsonSchemaSTACValidator
+
+from ._base import Bench
+
+
+class ValidationBench(Bench):
+    params = ["jsonschema", "compiled"]
+    param_names = ["validator"]
+
+    def setup(self, validator: str) -> None:
+        # an item without extensions, validated against the bundled schemas only
+        self.item = Item.from_file(
+            Path(__file__).parents[1]
+            / "tests"
+            / "data-files"
+            / "item"
+            / "sample-item.json"
+        )
+        if validator == "compiled":
+            self.validator: JsonSchemaSTACValidator = CompiledSTACValidator()
+        else:
+            self.validator = JsonSchemaSTACValidator()
+        # Schemas are fetched and compiled on first use
+        self.item.validate(validator=self.validator)
+
+    def time_validate_item(self, validator: str) -> None:
+        self.item.validate(validator=self.validator)
@@ -22,6 +22,7 @@ __all__ = [
     "MediaType",
     "RelType",
     "StacIO",
+    "AsyncStacIO",
     "STACObject",
     "STACObjectType",
     "Link",
@@ -36,6 +37,7 @@ __all__ = [
     "CommonMetadata",
     "RangeSummary",
     "Item",
+    "LazyItem",
     "Asset",
     "ItemAssetDefinition",
     "ItemCollection",
@@ -70,7 +72,7 @@ from pystac.version import (
 )
 from pystac.media_type import MediaType
 from pystac.rel_type import RelType
-from pystac.stac_io import StacIO
+from pystac.stac_io import AsyncStacIO, StacIO
 from pystac.stac_object import STACObject, STACObjectType
 from pystac.link import Link, HIERARCHICAL_LINKS
 from pystac.catalog import Catalog, CatalogType
@@ -83,7 +85,7 @@ from pystac.collection import (
 from pystac.common_metadata import CommonMetadata
 from pystac.summaries import RangeSummary, Summaries
 from pystac.asset import Asset
-from pystac.item import Item
+from pystac.item import Item, LazyItem
 from pystac.item_assets import ItemAssetDefinition
 from pystac.item_collection import ItemCollection
 from pystac.provider import ProviderRole, Provider
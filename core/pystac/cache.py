@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from collections import ChainMap
+import weakref
+from collections import ChainMap, OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
 from copy import copy
+from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
 import pystac
@@ -35,6 +38,197 @@ def get_cache_key(stac_object: STACObject) -> tuple[str, bool]:
         return "/".join(ids), False
 
 
+class CacheStats:
+    """Hit, miss and eviction counters of a :class:`ResolvedObjectCache`."""
+
+    hits: int
+    """Number of lookups that found a cached object."""
+
+    misses: int
+    """Number of lookups that did not find a cached object."""
+
+    evictions: int
+    """Number of Items dropped from the cache by its :class:`CachePolicy`."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<CacheStats hits={self.hits} misses={self.misses} "
+            f"evictions={self.evictions}>"
+        )
+
+
+class CachePolicy:
+    """Determines how a :class:`ResolvedObjectCache` holds on to Items.
+
+    Catalogs and Collections are always strongly cached, as they tie the STAC
+    hierarchy together and are few in number; the policy only applies to Items. The
+    default policy caches every Item until it is removed. Subclasses can override
+    :meth:`create_item_store` to bound the cache.
+    """
+
+    def create_item_store(
+        self, on_evict: Callable[[], None]
+    ) -> MutableMapping[str, STACObject]:
+        """Creates the mapping of cache keys to Items.
+
+        Args:
+            on_evict : Callback that the store must call each time it drops an
+                Item on its own accord.
+
+        Returns:
+            MutableMapping[str, STACObject]: An empty mapping.
+        """
+        return {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}>"
+
+
+class LRUCachePolicy(CachePolicy):
+    """Caches at most ``max_items`` Items, evicting the least recently used Item
+    when the limit is exceeded.
+
+    Args:
+        max_items : Maximum number of Items to hold per cache key type.
+    """
+
+    max_items: int
+
+    def __init__(self, max_items: int):
+        if max_items < 1:
+            raise ValueError("max_items must be a positive integer")
+        self.max_items = max_items
+
+    def create_item_store(
+        self, on_evict: Callable[[], None]
+    ) -> MutableMapping[str, STACObject]:
+        return _LRUItemStore(self.max_items, on_evict)
+
+    def __repr__(self) -> str:
+        return f"<LRUCachePolicy max_items={self.max_items}>"
+
+
+class WeakRefCachePolicy(CachePolicy):
+    """Holds Items through weak references, so that an Item is evicted as soon as
+    nothing else (for example a resolved :class:`~pystac.Link`) refers to it."""
+
+    def create_item_store(
+        self, on_evict: Callable[[], None]
+    ) -> MutableMapping[str, STACObject]:
+        return _WeakItemStore(on_evict)
+
+
+class _LRUItemStore(MutableMapping[str, "STACObject"]):
+    def __init__(self, max_items: int, on_evict: Callable[[], None]):
+        self._data: OrderedDict[str, STACObject] = OrderedDict()
+        self._max_items = max_items
+        self._on_evict = on_evict
+
+    def __getitem__(self, key: str) -> STACObject:
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: str, value: STACObject) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_items:
+            self._data.popitem(last=False)
+            self._on_evict()
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _WeakItemStore(MutableMapping[str, "STACObject"]):
+    def __init__(self, on_evict: Callable[[], None]):
+        self._data: dict[str, weakref.ref[STACObject]] = {}
+        self._on_evict = on_evict
+
+    def __getitem__(self, key: str) -> STACObject:
+        value = self._data[key]()
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: STACObject) -> None:
+        self_ref = weakref.ref(self)
+
+        def remove(ref: weakref.ref[STACObject]) -> None:
+            store = self_ref()
+            if store is not None and store._data.get(key) is ref:
+                del store._data[key]
+                store._on_evict()
+
+        self._data[key] = weakref.ref(value, remove)
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([key for key, ref in self._data.items() if ref() is not None])
+
+    def __len__(self) -> int:
+        return sum(1 for ref in self._data.values() if ref() is not None)
+
+
+class _ObjectStore(MutableMapping[str, "STACObject"]):
+    """Maps cache keys to objects, keeping Catalogs and Collections in a plain dict
+    and Items in a store created by a :class:`CachePolicy`."""
+
+    def __init__(
+        self,
+        items: MutableMapping[str, STACObject],
+        data: dict[str, STACObject] | None = None,
+    ):
+        self._containers: dict[str, STACObject] = {}
+        self._items = items
+        if data:
+            self.update(data)
+
+    def __getitem__(self, key: str) -> STACObject:
+        if key in self._containers:
+            return self._containers[key]
+        return self._items[key]
+
+    def __setitem__(self, key: str, value: STACObject) -> None:
+        if value.STAC_OBJECT_TYPE == pystac.STACObjectType.ITEM:
+            self._containers.pop(key, None)
+            self._items[key] = value
+        else:
+            self._items.pop(key, None)
+            self._containers[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._containers:
+            del self._containers[key]
+        else:
+            del self._items[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._containers or key in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return chain(list(self._containers), list(self._items))
+
+    def __len__(self) -> int:
+        return len(self._containers) + len(self._items)
+
+
 class ResolvedObjectCache:
     """This class tracks resolved objects tied to root catalogs.
     A STAC object is 'resolved' when it is a Python Object; a link
@@ -59,18 +253,26 @@ class ResolvedObjectCache:
             their cached object.
         ids_to_collections : Map of collection IDs
             to collections.
+        policy : The :class:`CachePolicy` that determines how long Items are
+            cached. Defaults to caching every Item until it is removed.
     """
 
-    id_keys_to_objects: dict[str, STACObject]
+    id_keys_to_objects: MutableMapping[str, STACObject]
     """Existing cache of a key made up of the STACObject and it's parents IDs mapped
     to the cached STACObject."""
 
-    hrefs_to_objects: dict[str, STACObject]
+    hrefs_to_objects: MutableMapping[str, STACObject]
     """STAC Object HREFs matched to their cached object."""
 
     ids_to_collections: dict[str, Collection]
     """Map of collection IDs to collections."""
 
+    policy: CachePolicy
+    """The policy that determines how long Items are cached."""
+
+    stats: CacheStats
+    """Hit, miss and eviction counters of this cache."""
+
     _collection_cache: ResolvedObjectCollectionCache | None
 
     def __init__(
@@ -78,13 +280,33 @@ class ResolvedObjectCache:
         id_keys_to_objects: dict[str, STACObject] | None = None,
         hrefs_to_objects: dict[str, STACObject] | None = None,
         ids_to_collections: dict[str, Collection] | None = None,
+        policy: CachePolicy | None = None,
     ):
-        self.id_keys_to_objects = id_keys_to_objects or {}
-        self.hrefs_to_objects = hrefs_to_objects or {}
+        self.stats = CacheStats()
+        self.policy = policy or CachePolicy()
+        self.id_keys_to_objects = self._create_store(id_keys_to_objects)
+        self.hrefs_to_objects = self._create_store(hrefs_to_objects)
         self.ids_to_collections = ids_to_collections or {}
 
         self._collection_cache = None
 
+    def _create_store(self, data: dict[str, STACObject] | None) -> _ObjectStore:
+        return _ObjectStore(self.policy.create_item_store(self._on_evict), data)
+
+    def _on_evict(self) -> None:
+        self.stats.evictions += 1
+
+    def set_policy(self, policy: CachePolicy) -> None:
+        """Sets the :class:`CachePolicy` of this cache, re-caching the currently
+        cached objects under the new policy.
+
+        Args:
+            policy : The new cache policy.
+        """
+        self.policy = policy
+        self.id_keys_to_objects = self._create_store(dict(self.id_keys_to_objects))
+        self.hrefs_to_objects = self._create_store(dict(self.hrefs_to_objects))
+
     def get_or_cache(self, obj: STACObject) -> STACObject:
         """Gets the STACObject that is the cached version of the given STACObject; or,
         if none exists, sets the cached object to the given object.
@@ -98,18 +320,15 @@ class ResolvedObjectCache:
             given object, or the given object.
         """
         key, is_href = get_cache_key(obj)
-        if is_href:
-            if key in self.hrefs_to_objects:
-                return self.hrefs_to_objects[key]
-            else:
-                self.cache(obj)
-                return obj
+        objects = self.hrefs_to_objects if is_href else self.id_keys_to_objects
+        cached = objects.get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            return cached
         else:
-            if key in self.id_keys_to_objects:
-                return self.id_keys_to_objects[key]
-            else:
-                self.cache(obj)
-                return obj
+            self.stats.misses += 1
+            self.cache(obj)
+            return obj
 
     def get(self, obj: STACObject) -> STACObject | None:
         """Get the cached object that has the same cache key as the given object.
@@ -126,7 +345,7 @@ class ResolvedObjectCache:
         if is_href:
             return self.get_by_href(key)
         else:
-            return self.id_keys_to_objects.get(key)
+            return self._count(self.id_keys_to_objects.get(key))
 
     def get_by_href(self, href: str) -> STACObject | None:
         """Gets the cached object at href.
@@ -137,7 +356,14 @@ class ResolvedObjectCache:
         Returns:
             STACObject or None: Returns the STACObject if cached, otherwise None.
         """
-        return self.hrefs_to_objects.get(href)
+        return self._count(self.hrefs_to_objects.get(href))
+
+    def _count(self, obj: STACObject | None) -> STACObject | None:
+        if obj is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return obj
 
     def get_collection_by_id(self, id: str) -> Collection | None:
         """Retrieved a cached Collection by its ID.
@@ -205,7 +431,8 @@ class ResolvedObjectCache:
 
         The merged cache will give preference to the first argument; that is, if there
         are cached keys that exist in both the first and second cache, the object cached
-        in the first will be cached in the resulting merged ResolvedObjectCache.
+        in the first will be cached in the resulting merged ResolvedObjectCache. The
+        merged cache also keeps the policy and statistics of the first cache.
 
         Args:
             first : The first cache to merge. This cache will be
@@ -217,19 +444,19 @@ class ResolvedObjectCache:
         """
         merged = ResolvedObjectCache(
             id_keys_to_objects=dict(
-                ChainMap(
-                    copy(first.id_keys_to_objects), copy(second.id_keys_to_objects)
-                )
+                ChainMap(first.id_keys_to_objects, second.id_keys_to_objects)
             ),
             hrefs_to_objects=dict(
-                ChainMap(copy(first.hrefs_to_objects), copy(second.hrefs_to_objects))
+                ChainMap(first.hrefs_to_objects, second.hrefs_to_objects)
             ),
             ids_to_collections=dict(
                 ChainMap(
                     copy(first.ids_to_collections), copy(second.ids_to_collections)
                 )
             ),
+            policy=first.policy,
         )
+        merged.stats = first.stats
 
         merged._collection_cache = ResolvedObjectCollectionCache.merge(
             merged, first._collection_cache, second._collection_cache
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
 from copy import deepcopy
 from typing import (
     TYPE_CHECKING,
@@ -12,7 +12,8 @@ from typing import (
 
 import pystac
 import pystac.media_type
-from pystac.cache import ResolvedObjectCache
+from pystac.cache import CachePolicy, CacheStats, ResolvedObjectCache
+from pystac.compression import EXTENSIONS, Compression, get_compression_from_href
 from pystac.errors import STACError, STACTypeError
 from pystac.layout import (
     APILayoutStrategy,
@@ -20,13 +21,21 @@ from pystac.layout import (
     HrefLayoutStrategy,
     LayoutTemplate,
 )
-from pystac.link import Link
+from pystac.link import Link, _aresolve_links, _href_context_scope
 from pystac.serialization import (
     identify_stac_object,
     identify_stac_object_type,
     migrate_to_latest,
 )
+from pystac.spatial_index import DatetimeQuery, SpatialIndex, SpatialIndexEntry
+from pystac.stac_io import (
+    DefaultAsyncStacIO,
+    DefaultStacIO,
+    JSONProfile,
+    _writes_by_default,
+)
 from pystac.stac_object import STACObject, STACObjectType
+from pystac.temporal_index import TemporalIndex
 from pystac.utils import (
     HREF,
     StringEnum,
@@ -34,6 +43,7 @@ from pystac.utils import (
     is_absolute_href,
     make_absolute_href,
     make_relative_href,
+    safe_urlparse,
 )
 
 if TYPE_CHECKING:
@@ -41,6 +51,9 @@ if TYPE_CHECKING:
     from pystac.collection import Collection
     from pystac.extensions.ext import CatalogExt
     from pystac.item import Item
+    from pystac.stac_io import AsyncStacIO
+    from pystac.validation.report import ValidationFailure, ValidationReport
+    from pystac.validation.stac_validator import STACValidator
 
 #: Generalized version of :class:`Catalog`
 C = TypeVar("C", bound="Catalog")
@@ -174,6 +187,21 @@ class Catalog(STACObject):
     _fallback_strategy: HrefLayoutStrategy = BestPracticesLayoutStrategy()
     """Fallback layout strategy"""
 
+    _id_index_enabled: bool = False
+    """Whether recursive lookups by ID use an index of the catalog's descendants."""
+
+    _id_index: _IdIndex | None = None
+    """Index of descendants by ID, built by the first indexed recursive lookup."""
+
+    _item_link_index: _ItemLinkIndex | None = None
+    """Index of the item links of this catalog by absolute HREF, built by the first
+    :meth:`search` that reads an item of this catalog through a spatial or temporal
+    index."""
+
+    _hierarchy_version: int = 0
+    """Incremented on a root catalog whenever children or items are added to or
+    removed from any catalog under it, to invalidate indexes of descendants."""
+
     def __init__(
         self,
         id: str,
@@ -231,6 +259,58 @@ class Catalog(STACObject):
             CatalogType.SELF_CONTAINED,
         ]
 
+    def set_cache_policy(self, policy: CachePolicy) -> None:
+        """Sets the policy that determines how long Items resolved under this
+        catalog are held in its resolved object cache.
+
+        Catalogs and Collections are always cached. This should be called on the root
+        catalog, whose cache is shared by every object in the catalog; the policy is
+        kept when other catalogs are added under the root.
+
+        Args:
+            policy : The cache policy, e.g. a :class:`~pystac.cache.LRUCachePolicy` or
+                a :class:`~pystac.cache.WeakRefCachePolicy`.
+        """
+        self._resolved_objects.set_policy(policy)
+
+    def get_cache_stats(self) -> CacheStats:
+        """Returns the hit, miss and eviction counters of this catalog's resolved
+        object cache.
+
+        Returns:
+            CacheStats: The counters of the cache.
+        """
+        return self._resolved_objects.stats
+
+    def enable_id_index(self, enabled: bool = True) -> None:
+        """Enables or disables the use of an ID index for recursive lookups.
+
+        When enabled, the first call to :meth:`get_child`, :meth:`get_item` or
+        :meth:`get_items` with ``recursive=True`` walks this catalog once, resolving
+        every child and item, and indexes them by ID. Later recursive lookups use
+        the index instead of walking the catalog again, and return the same objects
+        in the same order as a walk would. The index is rebuilt after children or
+        items are added or removed with the methods of any catalog under the same
+        root. Changes to the ID of an indexed object, or direct modification of
+        :attr:`~pystac.STACObject.links`, are not tracked.
+
+        Args:
+            enabled : Whether to use the index. Defaults to ``True``.
+        """
+        self._id_index_enabled = enabled
+        self._id_index = None
+
+    def _get_id_index(self) -> _IdIndex:
+        root = self.get_root() or self
+        index = self._id_index
+        if index is None or not index.is_current(root):
+            index = self._id_index = _IdIndex(self, root)
+        return index
+
+    def _invalidate_id_indexes(self) -> None:
+        root = self.get_root() or self
+        root._hierarchy_version += 1
+
     def _get_strategy(self, strategy: HrefLayoutStrategy | None) -> HrefLayoutStrategy:
         if strategy is not None:
             return strategy
@@ -293,6 +373,7 @@ class Catalog(STACObject):
 
         child_link = Link.child(child, title=title)
         self.add_link(child_link)
+        self._invalidate_id_indexes()
         return child_link
 
     def add_children(
@@ -364,6 +445,7 @@ class Catalog(STACObject):
 
         item_link = Link.item(item, title=title)
         self.add_link(item_link)
+        self._invalidate_id_indexes()
         return item_link
 
     def add_items(
@@ -425,6 +507,8 @@ class Catalog(STACObject):
                     ),
                 )
             return next((c for c in children if c.id == id), None)
+        elif self._id_index_enabled:
+            return next(self._get_id_index().get_children(id), None)
         else:
             for root, _, _ in self.walk():
                 child = root.get_child(id, recursive=False)
@@ -432,16 +516,28 @@ class Catalog(STACObject):
                     return child
             return None
 
-    def get_children(self) -> Iterable[Catalog | Collection]:
+    def get_children(
+        self, max_workers: int | None = None, release: bool = False
+    ) -> Iterable[Catalog | Collection]:
         """Return all children of this catalog.
 
+        Args:
+            max_workers : If set, read unresolved children concurrently using a
+                pool of up to this many threads. See
+                :meth:`~pystac.STACObject.get_stac_objects`.
+            release : If ``True``, unresolve each child read from an HREF once the
+                consumer moves past it. See
+                :meth:`~pystac.STACObject.get_stac_objects`.
+
         Return:
             Iterable[Catalog or Collection]: Iterable of children whose parent
             is this catalog.
         """
         return map(
             lambda x: cast(pystac.Catalog | pystac.Collection, x),
-            self.get_stac_objects(pystac.RelType.CHILD),
+            self.get_stac_objects(
+                pystac.RelType.CHILD, max_workers=max_workers, release=release
+            ),
         )
 
     def get_collections(self) -> Iterable[Collection]:
@@ -500,6 +596,7 @@ class Catalog(STACObject):
                     child.set_parent(None)
                     child.set_root(None)
         self.links = new_links
+        self._invalidate_id_indexes()
 
     def get_item(self, id: str, recursive: bool = False) -> Item | None:
         """
@@ -528,6 +625,8 @@ class Catalog(STACObject):
         )
         if not recursive:
             return next((i for i in self.get_items() if i.id == id), None)
+        elif self._id_index_enabled:
+            return next(self._get_id_index().get_items(id), None)
         else:
             for root, _, _ in self.walk():
                 item = root.get_item(id, recursive=False)
@@ -535,7 +634,13 @@ class Catalog(STACObject):
                     return item
             return None
 
-    def get_items(self, *ids: str, recursive: bool = False) -> Iterator[Item]:
+    def get_items(
+        self,
+        *ids: str,
+        recursive: bool = False,
+        max_workers: int | None = None,
+        release: bool = False,
+    ) -> Iterator[Item]:
         """Return all items or specific items of this catalog.
 
         Args:
@@ -543,30 +648,153 @@ class Catalog(STACObject):
             recursive : If True, search this catalog and all children for the
                 item; otherwise, only search the items of this catalog. Defaults
                 to False.
+            max_workers : If set, read unresolved items and children concurrently
+                using a pool of up to this many threads, ahead of the consumer.
+                Items are still yielded in link order. See
+                :meth:`~pystac.STACObject.get_stac_objects`.
+            release : If ``True``, unresolve each item (and, if recursive, each
+                child) read from an HREF once the consumer moves past it, so that
+                memory use stays bounded while streaming through large catalogs. See
+                :meth:`~pystac.STACObject.get_stac_objects`.
 
         Return:
             Iterator[Item]: Generator of items whose parent is this catalog, and
                 (if recursive) all catalogs or collections connected to this catalog
                 through child links.
         """
-        from itertools import chain
+        if ids and recursive and self._id_index_enabled:
+            yield from self._get_id_index().get_items(*ids)
+            return
 
         items: Iterator[Item]
         if not recursive:
             items = map(
                 lambda x: cast(pystac.Item, x),
-                self.get_stac_objects(pystac.RelType.ITEM),
+                self.get_stac_objects(
+                    pystac.RelType.ITEM, max_workers=max_workers, release=release
+                ),
             )
         else:
-            items = chain(
-                self.get_items(recursive=False),
-                *(child.get_items(recursive=True) for child in self.get_children()),
-            )
+            items = self._get_items_recursively(max_workers, release)
         if ids:
             yield from (i for i in items if i.id in ids)
         else:
             yield from items
 
+    def _get_items_recursively(
+        self, max_workers: int | None, release: bool
+    ) -> Iterator[Item]:
+        """Yields the items of this catalog, then those of each child in turn, so
+        that with ``release`` a child is only released after its subtree has been
+        walked."""
+        yield from self.get_items(
+            recursive=False, max_workers=max_workers, release=release
+        )
+        for child in self.get_children(max_workers=max_workers, release=release):
+            yield from child._get_items_recursively(max_workers, release)
+
+    def search(
+        self,
+        bbox: Sequence[float] | None = None,
+        datetime: DatetimeQuery | None = None,
+        index: SpatialIndex | TemporalIndex | None = None,
+    ) -> Iterator[Item]:
+        """Returns the items of this catalog and all its children that match the
+        given bounding box and datetime.
+
+        Without an ``index``, every item is read and tested. With an index, only the
+        matching items are returned, reading those that are only known to the index
+        by HREF through the root's :class:`~pystac.StacIO`. Items read are resolved
+        as if from the item links of their parents, if those have been read, so
+        later searches and traversals return the same instances.
+
+        Args:
+            bbox : If set, only return items whose bounding box intersects this
+                bounding box.
+            datetime : If set, only return items whose datetime, or
+                ``start_datetime`` to ``end_datetime`` range, overlaps this datetime
+                or interval. See :data:`pystac.spatial_index.DatetimeQuery`.
+            index : Optional :class:`~pystac.spatial_index.SpatialIndex` or
+                :class:`~pystac.temporal_index.TemporalIndex` to answer the query
+                with, e.g. from :meth:`build_spatial_index` or
+                :meth:`build_temporal_index`, or read with :meth:`SpatialIndex.from_file
+                <pystac.spatial_index.SpatialIndex.from_file>`. The index determines
+                which items are searched.
+
+        Return:
+            Iterator[Item]: The matching items.
+        """
+        if index is None:
+            for item in self.get_items(recursive=True):
+                if SpatialIndexEntry.from_item(item).matches(bbox, datetime):
+                    yield item
+            return
+
+        root = self.get_root() or self
+        stac_io = root._stac_io or pystac.StacIO.default()
+        for target in index.search(bbox, datetime):
+            if isinstance(target, str):
+                obj = root._resolved_objects.get_by_href(target)
+                if obj is None:
+                    obj = stac_io.read_stac_object(target, root=root)
+                    obj.set_self_href(target)
+                    obj = root._resolved_objects.get_or_cache(obj)
+                    obj.set_root(root)
+                    self._resolve_item_link(root, obj, target)
+                yield cast(pystac.Item, obj)
+            else:
+                yield target
+
+    @staticmethod
+    def _resolve_item_link(root: Catalog, item: STACObject, href: str) -> None:
+        """Resolves the link to ``item``, read from ``href``, from its parent, if the
+        parent has been read, as if the item had been resolved from that link."""
+        parent_link = item.get_single_link(pystac.RelType.PARENT)
+        if parent_link is None:
+            return
+        parent: str | STACObject | None
+        if parent_link.is_resolved():
+            parent = parent_link.target
+        else:
+            parent = root._resolved_objects.get_by_href(
+                parent_link.get_absolute_href() or ""
+            )
+        if not isinstance(parent, Catalog):
+            return
+        index = parent._item_link_index
+        if index is None or not index.is_current(parent):
+            index = parent._item_link_index = _ItemLinkIndex(parent)
+        link = index.links.get(href)
+        if (
+            link is not None
+            and not link.is_resolved()
+            and link.get_absolute_href() == href
+        ):
+            # The item is cached, so this sets it as the link target without
+            # reading it again
+            link.resolve_stac_object(root=root)
+
+    def build_spatial_index(self) -> SpatialIndex:
+        """Reads all items of this catalog and all its children, and returns a
+        :class:`~pystac.spatial_index.SpatialIndex` over them to pass to
+        :meth:`search`. The index can be saved with :meth:`SpatialIndex.save
+        <pystac.spatial_index.SpatialIndex.save>` if every item has a self HREF.
+
+        Return:
+            SpatialIndex: The index over the items.
+        """
+        return SpatialIndex.from_items(self.get_items(recursive=True))
+
+    def build_temporal_index(self) -> TemporalIndex:
+        """Reads all items of this catalog and all its children, and returns a
+        :class:`~pystac.temporal_index.TemporalIndex` over their time ranges to pass
+        to :meth:`search`.
+
+        Return:
+            TemporalIndex: The index over the items.
+        """
+        return TemporalIndex.from_items(self.get_items(recursive=True))
+
     def clear_items(self) -> None:
         """Removes all items from this catalog.
 
@@ -580,6 +808,7 @@ class Catalog(STACObject):
                 item.set_root(None)
 
         self.links = [link for link in self.links if link.rel != pystac.RelType.ITEM]
+        self._invalidate_id_indexes()
 
     def remove_item(self, item_id: str) -> None:
         """Removes an item from this catalog.
@@ -601,6 +830,7 @@ class Catalog(STACObject):
                     item.set_parent(None)
                     item.set_root(None)
         self.links = new_links
+        self._invalidate_id_indexes()
 
     def get_all_items(self) -> Iterator[Item]:
         """
@@ -642,20 +872,25 @@ class Catalog(STACObject):
     def to_dict(
         self, include_self_link: bool = True, transform_hrefs: bool = True
     ) -> dict[str, Any]:
-        links = [
-            x
-            for x in self.links
-            if x.rel != pystac.RelType.ROOT or x.get_href(transform_hrefs) is not None
-        ]
-        if not include_self_link:
-            links = [x for x in links if x.rel != pystac.RelType.SELF]
+        with _href_context_scope():
+            links = [
+                x
+                for x in self.links
+                if x.rel != pystac.RelType.ROOT
+                or x.get_href(transform_hrefs) is not None
+            ]
+            if not include_self_link:
+                links = [x for x in links if x.rel != pystac.RelType.SELF]
+            link_dicts = [
+                link.to_dict(transform_href=transform_hrefs) for link in links
+            ]
 
         d: dict[str, Any] = {
             "type": self.STAC_OBJECT_TYPE.value.title(),
             "id": self.id,
             "stac_version": pystac.get_stac_version(),
             "description": self.description,
-            "links": [link.to_dict(transform_href=transform_hrefs) for link in links],
+            "links": link_dicts,
         }
 
         if self.stac_extensions:
@@ -715,6 +950,9 @@ class Catalog(STACObject):
         strategy: HrefLayoutStrategy | None = None,
         stac_io: pystac.StacIO | None = None,
         skip_unresolved: bool = False,
+        max_workers: int | None = None,
+        json_profile: JSONProfile | str | None = None,
+        compression: Compression | str | None = None,
     ) -> None:
         """Normalizes link HREFs to the given root_href, and saves the catalog.
 
@@ -740,11 +978,23 @@ class Catalog(STACObject):
                 Defaults to False. Because unresolved links are not saved, this
                 argument can be used to normalize and save only newly-added
                 objects.
+            max_workers : If set, write objects concurrently using a pool of up to
+                this many threads. See :meth:`Catalog.save <pystac.Catalog.save>`.
+            json_profile : If set, the :class:`~pystac.stac_io.JSONProfile` used to
+                format the saved files. See :meth:`Catalog.save <pystac.Catalog.save>`.
+            compression : If set, the :class:`~pystac.compression.Compression` of the
+                saved files. See :meth:`Catalog.save <pystac.Catalog.save>`.
         """
         self.normalize_hrefs(
             root_href, strategy=strategy, skip_unresolved=skip_unresolved
         )
-        self.save(catalog_type, stac_io=stac_io)
+        self.save(
+            catalog_type,
+            stac_io=stac_io,
+            max_workers=max_workers,
+            json_profile=json_profile,
+            compression=compression,
+        )
 
     def normalize_hrefs(
         self,
@@ -941,6 +1191,9 @@ class Catalog(STACObject):
         catalog_type: CatalogType | None = None,
         dest_href: str | None = None,
         stac_io: pystac.StacIO | None = None,
+        max_workers: int | None = None,
+        json_profile: JSONProfile | str | None = None,
+        compression: Compression | str | None = None,
     ) -> None:
         """Save this catalog and all it's children/item to files determined by the
         object's self link HREF or a specified path.
@@ -956,6 +1209,27 @@ class Catalog(STACObject):
             stac_io : Optional instance of :class:`~pystac.StacIO` to use. If not
                 provided, will use the instance set while reading in the catalog,
                 or the default instance if this is not available.
+            max_workers : If set, objects are written concurrently using a pool of
+                up to this many threads. All destination HREFs are computed up front
+                and, for local files written by a
+                :class:`~pystac.stac_io.DefaultStacIO`, every destination directory
+                is created once before writing. Objects
+                are still converted to dictionaries in the calling thread, so the
+                :class:`~pystac.StacIO` instance is the only object that must be
+                thread-safe. If ``None`` (the default), objects are written one at a
+                time.
+            json_profile : If set, the :class:`~pystac.stac_io.JSONProfile` used to
+                format the saved files, e.g. ``"compact"`` for files without
+                whitespace. Overrides the profile of the :class:`~pystac.StacIO`
+                for this call only.
+            compression : If set, every saved object is compressed with this
+                :class:`~pystac.compression.Compression` format, e.g. ``"gzip"``. The
+                extension of the format (e.g. ``.gz``) is appended to the self HREF of
+                each object while saving, so that links between saved objects point
+                at the compressed files, and the self HREFs are restored afterwards.
+                Only :class:`~pystac.stac_io.DefaultStacIO` compresses files
+                according to this extension; a warning is emitted for other
+                :class:`~pystac.StacIO` classes.
         Note:
             If the catalog type is ``CatalogType.ABSOLUTE_PUBLISHED``,
             all self links will be included, and hierarchical links be absolute URLs.
@@ -973,6 +1247,138 @@ class Catalog(STACObject):
         if catalog_type is not None:
             root.catalog_type = catalog_type
 
+        original_hrefs: list[tuple[STACObject, str]] = []
+        if compression is not None:
+            import warnings
+
+            if not isinstance(
+                stac_io or root._stac_io or pystac.StacIO.default(), DefaultStacIO
+            ):
+                warnings.warn(
+                    "Only DefaultStacIO compresses files according to their "
+                    "extension; other StacIO classes may write uncompressed files "
+                    "with a compression extension.",
+                    UserWarning,
+                )
+            original_hrefs = self._set_compression_extension(Compression(compression))
+
+        if json_profile is not None:
+            stac_io = (
+                stac_io or root._stac_io or pystac.StacIO.default()
+            ).with_json_profile(json_profile)
+
+        try:
+            # Link HREFs are derived from the same few roots and parents throughout
+            # the save, so memoize their computation
+            with _href_context_scope():
+                if max_workers is None:
+                    for obj, obj_dest_href, include_self_link in self._get_save_plan(
+                        dest_href
+                    ):
+                        obj.save_object(
+                            include_self_link=include_self_link,
+                            dest_href=obj_dest_href,
+                            stac_io=stac_io,
+                        )
+                else:
+                    if stac_io is None:
+                        stac_io = root._stac_io or pystac.StacIO.default()
+                    self._save_concurrently(dest_href, stac_io, max_workers)
+        finally:
+            # Like json_profile, compression only applies to this call
+            for obj, self_href in original_hrefs:
+                obj.set_self_href(self_href)
+        if catalog_type is not None:
+            self.catalog_type = catalog_type
+
+    def _set_compression_extension(
+        self, compression: Compression
+    ) -> list[tuple[STACObject, str]]:
+        """Replaces the compression extension, if any, of the self HREF of this
+        catalog and each resolved child and item with the extension of
+        ``compression``, returning each changed object with its previous self
+        HREF."""
+        extension = EXTENSIONS[compression]
+        original_hrefs = []
+        for obj, _, _ in list(self._get_save_plan()):
+            self_href = obj.get_self_href()
+            if self_href is None or self_href.endswith(extension):
+                continue
+            original_hrefs.append((obj, self_href))
+            current = get_compression_from_href(self_href)
+            if current is not None:
+                self_href = self_href[: -len(EXTENSIONS[current])]
+            obj.set_self_href(self_href + extension)
+        return original_hrefs
+
+    def _save_concurrently(
+        self, dest_href: str | None, stac_io: pystac.StacIO, max_workers: int
+    ) -> None:
+        from collections import deque
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        plan = [
+            (obj, self._get_save_dest_href(obj, obj_dest_href), include_self_link)
+            for obj, obj_dest_href, include_self_link in self._get_save_plan(dest_href)
+        ]
+
+        # Set if local files can be written without checking for their directory
+        local_writer: DefaultStacIO | None = None
+        if isinstance(stac_io, DefaultStacIO):
+            dirnames = {
+                os.path.dirname(safe_urlparse(obj_dest_href).path)
+                for _, obj_dest_href, _ in plan
+                if not _is_url(obj_dest_href)
+            }
+            for dirname in sorted(dirnames):
+                if dirname != "":
+                    os.makedirs(dirname, exist_ok=True)
+            if _writes_by_default(type(stac_io)):
+                local_writer = stac_io
+
+        # Bound the number of serialized objects waiting to be written
+        pending: deque[Future[None]] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for obj, obj_dest_href, include_self_link in plan:
+                if len(pending) >= 2 * max_workers:
+                    pending.popleft().result()
+                json_dict = obj.to_dict(include_self_link=include_self_link)
+                if local_writer is not None and not _is_url(obj_dest_href):
+                    pending.append(
+                        executor.submit(
+                            local_writer._save_json_to_path,
+                            safe_urlparse(obj_dest_href).path,
+                            json_dict,
+                        )
+                    )
+                else:
+                    pending.append(
+                        executor.submit(stac_io.save_json, obj_dest_href, json_dict)
+                    )
+            while pending:
+                pending.popleft().result()
+
+    @staticmethod
+    def _get_save_dest_href(obj: STACObject, dest_href: str | None) -> str:
+        if dest_href is None:
+            dest_href = obj.get_self_href()
+            if dest_href is None:
+                raise STACError(
+                    "Self HREF must be set before saving without an explicit dest_href."
+                )
+        return dest_href
+
+    def _get_save_plan(
+        self, dest_href: str | None = None
+    ) -> Iterator[tuple[STACObject, str | None, bool]]:
+        """Yields a ``(stac_object, dest_href, include_self_link)`` tuple for this
+        catalog and each resolved child and item, recursively, in the order in which
+        :meth:`Catalog.save` writes them. A ``dest_href`` of ``None`` means the object
+        is saved to its self HREF."""
+        root = self.get_root()
+        if root is None:
+            raise Exception("There is no root catalog")
+
         items_include_self_link = root.catalog_type in [CatalogType.ABSOLUTE_PUBLISHED]
 
         for child_link in self.get_child_links():
@@ -983,12 +1389,11 @@ class Catalog(STACObject):
                     child_dest_href = make_absolute_href(
                         rel_href, dest_href, start_is_dir=True
                     )
-                    child.save(
-                        dest_href=os.path.dirname(child_dest_href),
-                        stac_io=stac_io,
+                    yield from child._get_save_plan(
+                        dest_href=os.path.dirname(child_dest_href)
                     )
                 else:
-                    child.save(stac_io=stac_io)
+                    yield from child._get_save_plan()
 
         for item_link in self.get_item_links():
             if item_link.is_resolved():
@@ -998,15 +1403,9 @@ class Catalog(STACObject):
                     item_dest_href = make_absolute_href(
                         rel_href, dest_href, start_is_dir=True
                     )
-                    item.save_object(
-                        include_self_link=items_include_self_link,
-                        dest_href=item_dest_href,
-                        stac_io=stac_io,
-                    )
+                    yield item, item_dest_href, items_include_self_link
                 else:
-                    item.save_object(
-                        include_self_link=items_include_self_link, stac_io=stac_io
-                    )
+                    yield item, None, items_include_self_link
 
         include_self_link = False
         # include a self link if this is the root catalog
@@ -1024,16 +1423,75 @@ class Catalog(STACObject):
             catalog_dest_href = make_absolute_href(
                 rel_href, dest_href, start_is_dir=True
             )
-        self.save_object(
-            include_self_link=include_self_link,
-            dest_href=catalog_dest_href,
-            stac_io=stac_io,
-        )
+        yield self, catalog_dest_href, include_self_link
+
+    async def asave(
+        self,
+        catalog_type: CatalogType | None = None,
+        dest_href: str | None = None,
+        stac_io: AsyncStacIO | None = None,
+        max_concurrency: int = 10,
+    ) -> None:
+        """Asynchronous version of :meth:`Catalog.save`, which writes up to
+        ``max_concurrency`` objects concurrently.
+
+        Objects are serialized in the event loop's thread; only the writes are
+        awaited concurrently.
+
+        Args:
+            catalog_type : The catalog type that dictates the structure of
+                the catalog to save. Use a member of :class:`~pystac.CatalogType`.
+                If not supplied, the catalog_type of this catalog will be used.
+            dest_href : The location where the catalog is to be saved.
+                If not supplied, the catalog's self link HREF is used to determine
+                the location of the catalog file and children's files.
+            stac_io : Optional instance of :class:`~pystac.AsyncStacIO` to use. If not
+                provided, the blocking :class:`~pystac.StacIO` set while reading in
+                the catalog (or the default instance) is run in worker threads.
+            max_concurrency : The maximum number of concurrent writes. Defaults
+                to 10.
+        """
+        import asyncio
+
+        root = self.get_root()
+        if root is None:
+            raise Exception("There is no root catalog")
+
+        async_stac_io = self._get_async_stac_io(stac_io)
+        if catalog_type is not None:
+            root.catalog_type = catalog_type
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def save_json(href: str, json_dict: dict[str, Any]) -> None:
+            try:
+                await async_stac_io.save_json(href, json_dict)
+            finally:
+                semaphore.release()
+
+        tasks: list[asyncio.Task[None]] = []
+        try:
+            with _href_context_scope():
+                for obj, obj_dest_href, include_self_link in self._get_save_plan(
+                    dest_href
+                ):
+                    obj_dest_href = self._get_save_dest_href(obj, obj_dest_href)
+                    json_dict = obj.to_dict(include_self_link=include_self_link)
+                    await semaphore.acquire()
+                    tasks.append(
+                        asyncio.create_task(save_json(obj_dest_href, json_dict))
+                    )
+        finally:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
         if catalog_type is not None:
             self.catalog_type = catalog_type
 
     def walk(
-        self,
+        self, max_workers: int | None = None, release: bool = False
     ) -> Iterable[tuple[Catalog, Iterable[Catalog], Iterable[Item]]]:
         """Walks through children and items of catalogs.
 
@@ -1045,16 +1503,133 @@ class Catalog(STACObject):
 
         This has similar functionality to Python's :func:`os.walk`.
 
+        Args:
+            max_workers : If set, the children and items of each catalog are read
+                concurrently using a pool of up to this many threads, ahead of the
+                consumer. The walk order is unchanged. See
+                :meth:`~pystac.STACObject.get_stac_objects`.
+            release : If ``True``, items read from an HREF are unresolved once the
+                consumer moves past them, and children once their subtree has been
+                walked, so that memory use stays bounded while walking large
+                catalogs. Any in-memory changes to released objects are lost. See
+                :meth:`~pystac.STACObject.get_stac_objects`.
+
         Returns:
            Generator[(Catalog, Generator[Catalog], Generator[Item])]: A generator that
            yields a 3-tuple (parent_catalog, children, items).
         """
-        children = self.get_children()
-        items = self.get_items()
+        children = self.get_children(max_workers=max_workers)
+        items = self.get_items(max_workers=max_workers, release=release)
 
         yield self, children, items
-        for child in self.get_children():
-            yield from child.walk()
+        for child in self.get_children(max_workers=max_workers, release=release):
+            yield from child.walk(max_workers=max_workers, release=release)
+
+    async def awalk(
+        self,
+        stac_io: AsyncStacIO | None = None,
+        max_concurrency: int = 10,
+    ) -> AsyncIterator[tuple[Catalog, list[Catalog | Collection], list[Item]]]:
+        """Asynchronous version of :meth:`Catalog.walk`.
+
+        The children and items of each catalog are read concurrently, with up to
+        ``max_concurrency`` reads in flight, before the catalog is yielded. Unlike
+        :meth:`Catalog.walk`, the children and items are therefore lists.
+
+        Args:
+            stac_io : Optional instance of :class:`~pystac.AsyncStacIO` to use. If not
+                provided, the blocking :class:`~pystac.StacIO` set while reading in
+                the catalog (or the default instance) is run in worker threads.
+            max_concurrency : The maximum number of concurrent reads. Defaults to 10.
+
+        Returns:
+            AsyncIterator[(Catalog, list[Catalog], list[Item])]: An asynchronous
+            iterator that yields a 3-tuple (parent_catalog, children, items).
+        """
+        async_stac_io = self._get_async_stac_io(stac_io)
+        children = await self._aget_stac_objects(
+            pystac.RelType.CHILD, async_stac_io, max_concurrency
+        )
+        items = await self._aget_stac_objects(
+            pystac.RelType.ITEM, async_stac_io, max_concurrency
+        )
+
+        yield (
+            self,
+            cast(list[pystac.Catalog | pystac.Collection], children),
+            cast(list[pystac.Item], items),
+        )
+        for child in cast(list[Catalog], children):
+            async for result in child.awalk(
+                stac_io=async_stac_io, max_concurrency=max_concurrency
+            ):
+                yield result
+
+    async def aget_items(
+        self,
+        *ids: str,
+        recursive: bool = False,
+        stac_io: AsyncStacIO | None = None,
+        max_concurrency: int = 10,
+    ) -> AsyncIterator[Item]:
+        """Asynchronous version of :meth:`Catalog.get_items`.
+
+        The items (and, if ``recursive``, children) of each catalog are read
+        concurrently, with up to ``max_concurrency`` reads in flight.
+
+        Args:
+            *ids : The IDs of the items to include.
+            recursive : If True, search this catalog and all children for the
+                item; otherwise, only search the items of this catalog. Defaults
+                to False.
+            stac_io : Optional instance of :class:`~pystac.AsyncStacIO` to use. If not
+                provided, the blocking :class:`~pystac.StacIO` set while reading in
+                the catalog (or the default instance) is run in worker threads.
+            max_concurrency : The maximum number of concurrent reads. Defaults to 10.
+
+        Return:
+            AsyncIterator[Item]: Asynchronous iterator of items whose parent is this
+                catalog, and (if recursive) all catalogs or collections connected to
+                this catalog through child links.
+        """
+        async_stac_io = self._get_async_stac_io(stac_io)
+        for item in await self._aget_stac_objects(
+            pystac.RelType.ITEM, async_stac_io, max_concurrency
+        ):
+            if not ids or item.id in ids:
+                yield cast(pystac.Item, item)
+        if recursive:
+            for child in await self._aget_stac_objects(
+                pystac.RelType.CHILD, async_stac_io, max_concurrency
+            ):
+                async for item in cast(Catalog, child).aget_items(
+                    *ids,
+                    recursive=True,
+                    stac_io=async_stac_io,
+                    max_concurrency=max_concurrency,
+                ):
+                    yield item
+
+    async def _aget_stac_objects(
+        self,
+        rel: str | pystac.RelType,
+        stac_io: AsyncStacIO,
+        max_concurrency: int,
+    ) -> list[STACObject]:
+        links = await _aresolve_links(
+            (link for link in self.links if link.rel == rel),
+            root=self.get_root(),
+            stac_io=stac_io,
+            max_concurrency=max_concurrency,
+        )
+        return [cast(STACObject, link.target) for link in links]
+
+    def _get_async_stac_io(self, stac_io: AsyncStacIO | None) -> AsyncStacIO:
+        if stac_io is not None:
+            return stac_io
+        root = self.get_root()
+        sync_stac_io = root._stac_io if root is not None else None
+        return DefaultAsyncStacIO(sync_stac_io or self._stac_io)
 
     def fully_resolve(self) -> None:
         """Resolves every link in this catalog.
@@ -1104,6 +1679,84 @@ class Catalog(STACObject):
             n += 1
         return n
 
+    def validate_all_report(
+        self,
+        max_items: int | None = None,
+        recursive: bool = True,
+        validator: STACValidator | None = None,
+        max_workers: int | None = None,
+    ) -> ValidationReport:
+        """Validates each catalog, collection, item contained within this catalog,
+        like :meth:`validate_all`, but collects every failure into a report instead of
+        raising on the first invalid object.
+
+        Objects are serialized as they are walked, and validated against their core
+        schema and every extension schema. With ``max_workers``, validation happens
+        in a pool of processes while this process keeps walking the catalog.
+
+        Args:
+            max_items : The maximum number of STAC items to validate. Default
+                is None which means, validate them all.
+            recursive : Whether to validate catalog, collections, and items contained
+                within child objects.
+            validator : A custom validator to use. If omitted, the default validator
+                from :class:`~pystac.validation.RegisteredValidator` will be used.
+            max_workers : If set, objects are validated in a pool of up to this many
+                processes. If ``None`` (the default), objects are validated in this
+                process.
+
+        Returns:
+            ValidationReport : Every failure (with the HREF and ID of the object, the
+            schema URI and the best matching error) and throughput statistics.
+        """
+        from pystac.validation.report import ValidationFailure, validate_objects
+
+        objects = (
+            obj
+            if isinstance(obj, ValidationFailure)
+            else (obj.to_dict(), obj.get_self_href())
+            for obj in self._get_objects_to_validate(max_items, recursive)
+        )
+        # As in save, link HREFs are derived from the same few roots and parents
+        with _href_context_scope():
+            return validate_objects(
+                objects, validator=validator, max_workers=max_workers
+            )
+
+    def _get_objects_to_validate(
+        self, max_items: int | None, recursive: bool
+    ) -> Iterator[STACObject | ValidationFailure]:
+        """Yields the objects validated by :meth:`validate_all`, in the same
+        order, and a :class:`~pystac.validation.ValidationFailure` in place of each
+        linked object that cannot be read."""
+        from pystac.validation.report import ValidationFailure
+
+        num_items = 0
+
+        def resolve(catalog: Catalog, link: Link) -> STACObject | ValidationFailure:
+            try:
+                link.resolve_stac_object(root=catalog.get_root())
+                return cast(STACObject, link.target)
+            except Exception as e:
+                return ValidationFailure(link.get_absolute_href(), None, None, str(e))
+
+        def visit(catalog: Catalog) -> Iterator[STACObject | ValidationFailure]:
+            nonlocal num_items
+            yield catalog
+            for link in catalog.get_child_links():
+                child = resolve(catalog, link)
+                if recursive and isinstance(child, Catalog):
+                    yield from visit(child)
+                else:
+                    yield child
+            for link in catalog.get_item_links():
+                if max_items is not None and num_items >= max_items:
+                    break
+                yield resolve(catalog, link)
+                num_items += 1
+
+        return visit(self)
+
     def _object_links(self) -> list[str | pystac.RelType]:
         return [
             pystac.RelType.CHILD,
@@ -1241,7 +1894,8 @@ class Catalog(STACObject):
 
         catalog_type = CatalogType.determine_type(d)
 
-        if preserve_dict:
+        if preserve_dict and not migrate:
+            # Otherwise, d is already the copy made by migrate_to_latest
             d = deepcopy(d)
 
         id = d.pop("id")
@@ -1310,3 +1964,61 @@ class Catalog(STACObject):
             _raise_for_missing_ext(e)
 
         return CatalogExt(stac_object=self)
+
+
+class _ItemLinkIndex:
+    """Index of the item links of a catalog by absolute HREF, which is current as
+    long as no item link is added or removed and the catalog's self HREF does not
+    change."""
+
+    def __init__(self, catalog: Catalog):
+        self.links: dict[str, Link] = {}
+        for link in catalog.get_item_links():
+            href = link.get_absolute_href()
+            if href is not None:
+                self.links.setdefault(href, link)
+        self.item_links = catalog._get_links_with_rel(pystac.RelType.ITEM)
+        self.num_item_links = len(self.item_links)
+        self.self_href = catalog.get_self_href()
+
+    def is_current(self, catalog: Catalog) -> bool:
+        # The links of each rel are kept in a list that is replaced, rather than
+        # modified, when links are removed or reordered
+        item_links = catalog._get_links_with_rel(pystac.RelType.ITEM)
+        return (
+            item_links is self.item_links
+            and len(item_links) == self.num_item_links
+            and catalog.get_self_href() == self.self_href
+        )
+
+
+class _IdIndex:
+    """Index of the children and items under a catalog by ID, each in the order in
+    which :meth:`Catalog.walk` reaches them."""
+
+    def __init__(self, catalog: Catalog, root: Catalog):
+        self.children: dict[str, list[tuple[int, Catalog | Collection]]] = {}
+        self.items: dict[str, list[tuple[int, Item]]] = {}
+        position = 0
+        for _, children, items in catalog.walk():
+            for child in children:
+                self.children.setdefault(child.id, []).append((position, child))
+                position += 1
+            for item in items:
+                self.items.setdefault(item.id, []).append((position, item))
+                position += 1
+        self.root = root
+        self.version = root._hierarchy_version
+
+    def is_current(self, root: Catalog) -> bool:
+        return root is self.root and root._hierarchy_version == self.version
+
+    def get_children(self, id: str) -> Iterator[Catalog | Collection]:
+        return (child for _, child in self.children.get(id, ()) if child.id == id)
+
+    def get_items(self, *ids: str) -> Iterator[Item]:
+        entries = sorted(
+            (entry for id in set(ids) for entry in self.items.get(id, ())),
+            key=lambda entry: entry[0],
+        )
+        return (item for _, item in entries if item.id in ids)
@@ -647,7 +647,8 @@ class Collection(Catalog, Assets):
 
         catalog_type = CatalogType.determine_type(d)
 
-        if preserve_dict:
+        if preserve_dict and not migrate:
+            # Otherwise, d is already the copy made by migrate_to_latest
             d = deepcopy(d)
 
         id = d.pop("id")
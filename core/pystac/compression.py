@@ -0,0 +1,155 @@
+"""Transparent compression of the files read and written by
+:class:`~pystac.stac_io.DefaultStacIO`.
+
+Compressed files are recognized by their first bytes when read, and by the
+extension of their HREF (``.gz`` or ``.zst``) when written. Gzip is supported by the
+standard library; zstd requires the `zstandard
+<https://pypi.org/project/zstandard/>`__ package.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+from typing import IO, Any, cast
+
+from pystac.utils import StringEnum
+
+# Is zstandard available?
+try:
+    import zstandard
+except ImportError:
+    HAS_ZSTANDARD = False
+else:
+    HAS_ZSTANDARD = True
+
+
+class Compression(StringEnum):
+    """A compression format of STAC files."""
+
+    GZIP = "gzip"
+    """Gzip, with the ``.gz`` extension."""
+
+    ZSTD = "zstd"
+    """Zstandard, with the ``.zst`` extension. Requires the ``zstandard`` package."""
+
+
+EXTENSIONS: dict[Compression, str] = {
+    Compression.GZIP: ".gz",
+    Compression.ZSTD: ".zst",
+}
+"""The file extension of each compression format."""
+
+MAGIC_BYTES: dict[Compression, bytes] = {
+    Compression.GZIP: b"\x1f\x8b",
+    Compression.ZSTD: b"\x28\xb5\x2f\xfd",
+}
+"""The bytes that files of each compression format start with."""
+
+MAX_MAGIC_LENGTH = max(len(magic) for magic in MAGIC_BYTES.values())
+
+
+def get_compression_from_href(href: str) -> Compression | None:
+    """Returns the compression format of a file from the extension of its HREF, or
+    ``None`` if the HREF does not have the extension of a compression format.
+
+    Args:
+        href : The HREF of the file.
+    """
+    for compression, extension in EXTENSIONS.items():
+        if href.endswith(extension):
+            return compression
+    return None
+
+
+def get_compression_from_bytes(data: bytes) -> Compression | None:
+    """Returns the compression format of a file from its first bytes, or ``None``
+    if they are not the magic bytes of a compression format.
+
+    Args:
+        data : The contents of the file, or at least its first
+            :data:`MAX_MAGIC_LENGTH` bytes.
+    """
+    for compression, magic in MAGIC_BYTES.items():
+        if data.startswith(magic):
+            return compression
+    return None
+
+
+def compress(data: bytes, compression: Compression | str) -> bytes:
+    """Compresses ``data`` with the given compression format.
+
+    Gzip output does not include a modification time, so that compressing the
+    same data always produces the same bytes.
+
+    Args:
+        data : The bytes to compress.
+        compression : The compression format to use.
+    """
+    compression = Compression(compression)
+    if compression == Compression.GZIP:
+        return gzip.compress(data, mtime=0)
+    result: bytes = _zstandard().ZstdCompressor().compress(data)
+    return result
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompresses ``data`` if it starts with the magic bytes of a compression
+    format, or returns it unchanged otherwise.
+
+    Args:
+        data : The bytes to decompress.
+    """
+    compression = get_compression_from_bytes(data)
+    if compression is None:
+        return data
+    if compression == Compression.GZIP:
+        return gzip.decompress(data)
+    result: bytes = _zstandard().ZstdDecompressor().decompressobj().decompress(data)
+    return result
+
+
+def open_decompressed(f: IO[bytes]) -> IO[bytes]:
+    """Wraps a binary file so that reading it returns decompressed bytes if the file
+    starts with the magic bytes of a compression format. Otherwise, the file is
+    returned unchanged, or buffered if it is not seekable (e.g. an HTTP response).
+
+    Args:
+        f : The file to wrap, positioned at its start.
+    """
+    if f.seekable():
+        compression = get_compression_from_bytes(f.read(MAX_MAGIC_LENGTH))
+        f.seek(0)
+    else:
+        # Peeking leaves the magic bytes in the buffer, to be read again
+        f = cast(IO[bytes], io.BufferedReader(cast(io.RawIOBase, f)))
+        compression = get_compression_from_bytes(
+            f.peek(MAX_MAGIC_LENGTH)[:MAX_MAGIC_LENGTH]  # type: ignore[attr-defined]
+        )
+    if compression is None:
+        return f
+    if compression == Compression.GZIP:
+        return cast(IO[bytes], gzip.GzipFile(fileobj=f, mode="rb"))
+    reader: IO[bytes] = _zstandard().ZstdDecompressor().stream_reader(f)
+    return reader
+
+
+def open_compressed(f: IO[bytes], compression: Compression | str) -> IO[bytes]:
+    """Wraps a binary file so that the bytes written to it are compressed with the
+    given compression format. The returned file must be closed before ``f``.
+
+    Args:
+        f : The file to wrap.
+        compression : The compression format to use.
+    """
+    compression = Compression(compression)
+    if compression == Compression.GZIP:
+        return cast(IO[bytes], gzip.GzipFile(fileobj=f, mode="wb", mtime=0))
+    writer: IO[bytes] = _zstandard().ZstdCompressor().stream_writer(f)
+    return writer
+
+
+def _zstandard() -> Any:
+    if not HAS_ZSTANDARD:
+        raise ImportError("Cannot use zstd compression, requires zstandard package")
+    return zstandard
@@ -121,11 +121,19 @@ class STACValidationError(Exception):
         source : Source of the exception. Type will be determined by the
             validation implementation. For the default JsonSchemaValidator this will be
             ``jsonschema.ValidationError``.
+        schema_uri : Optional URI of the schema that the object failed to validate
+            against.
     """
 
-    def __init__(self, message: str, source: Any | None = None):
+    def __init__(
+        self,
+        message: str,
+        source: Any | None = None,
+        schema_uri: str | None = None,
+    ):
         super().__init__(message)
         self.source = source
+        self.schema_uri = schema_uri
 
 
 class DeprecatedWarning(FutureWarning):
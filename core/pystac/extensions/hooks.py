@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 import pystac
 from pystac.extensions.base import VERSION_REGEX
 from pystac.serialization.identify import STACJSONDescription, STACVersionID
+from pystac.version import STACVersion
 
 if TYPE_CHECKING:
     from pystac.stac_object import STACObject
@@ -65,9 +66,10 @@ class ExtensionHooks(ABC):
         """Migrate a STAC Object in dict format from a previous version.
         The base implementation will update the stac_extensions to the latest
         schema ID. This method will only be called for STAC objects that have been
-        identified as a previous version of STAC. Implementations should directly
-        manipulate the obj dict. Remember to call super() in order to change out
-        the old 'stac_extension' entry with the latest schema URI.
+        identified as a previous version of STAC, or that are of the current version
+        of STAC and list this extension (see :meth:`has_extension`). Implementations
+        should directly manipulate the obj dict. Remember to call super() in order to
+        change out the old 'stac_extension' entry with the latest schema URI.
         """
         # Migrate schema versions
         for prev_id in self.prev_extension_ids:
@@ -82,10 +84,12 @@ class ExtensionHooks(ABC):
 
 class RegisteredExtensionHooks:
     hooks: dict[str, ExtensionHooks]
+    _claimed: dict[str, frozenset[str]]
 
     def __init__(self, hooks: Iterable[ExtensionHooks] = ()):
         self.hooks = {e.schema_uri: e for e in hooks}
         self._discovered = False
+        self._claimed = {}
 
     def _discover(self) -> None:
         """Register hooks advertised via the ``pystac.extensions`` entry point group.
@@ -96,6 +100,7 @@ class RegisteredExtensionHooks:
         if self._discovered:
             return
         self._discovered = True
+        self._claimed.clear()
         import warnings
         from importlib.metadata import entry_points
 
@@ -113,10 +118,12 @@ class RegisteredExtensionHooks:
             )
 
         self.hooks[e_id] = hooks
+        self._claimed.clear()
 
     def remove_extension_hooks(self, extension_id: str) -> None:
         if extension_id in self.hooks:
             del self.hooks[extension_id]
+            self._claimed.clear()
 
     def get_extended_object_links(self, obj: STACObject) -> list[str | pystac.RelType]:
         self._discover()
@@ -135,10 +142,38 @@ class RegisteredExtensionHooks:
         self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
     ) -> None:
         self._discover()
-        for hooks in self.hooks.values():
+        if version == STACVersion.DEFAULT_STAC_VERSION:
+            # Objects of the current version only need migrating by the hooks of
+            # the extensions they list, and most objects list none
+            hooks_to_apply: Iterable[ExtensionHooks] = self._get_claiming_hooks(
+                info.extensions
+            )
+        else:
+            hooks_to_apply = self.hooks.values()
+        for hooks in hooks_to_apply:
             if info.object_type in hooks._get_stac_object_types():
                 hooks.migrate(obj, version, info)
 
+    def _get_claiming_hooks(self, extension_ids: Iterable[str]) -> list[ExtensionHooks]:
+        """Returns the hooks, in order, of the extensions that have one of
+        ``extension_ids`` (see :meth:`ExtensionHooks.has_extension`). Which hooks
+        have each ID is cached until hooks are added or removed."""
+        claiming: set[str] = set()
+        for extension_id in extension_ids:
+            schema_uris = self._claimed.get(extension_id)
+            if schema_uris is None:
+                obj = {"stac_extensions": [extension_id]}
+                schema_uris = frozenset(
+                    schema_uri
+                    for schema_uri, hooks in self.hooks.items()
+                    if hooks.has_extension(obj)
+                )
+                self._claimed[extension_id] = schema_uris
+            claiming |= schema_uris
+        if not claiming:
+            return []
+        return [hooks for uri, hooks in self.hooks.items() if uri in claiming]
+
     def get_deprecation_message(self, obj: STACObject) -> str | None:
         self._discover()
         for hooks in self.hooks.values():
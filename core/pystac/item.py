@@ -9,7 +9,7 @@ from pystac.asset import Asset, Assets
 from pystac.catalog import Catalog
 from pystac.collection import Collection
 from pystac.errors import DeprecatedWarning
-from pystac.link import Link
+from pystac.link import Link, _href_context_scope, _LinkList
 from pystac.serialization import (
     identify_stac_object,
     identify_stac_object_type,
@@ -20,12 +20,15 @@ from pystac.utils import (
     datetime_to_str,
     is_absolute_href,
     make_absolute_href,
+    make_posix_style,
     make_relative_href,
+    map_opt,
     str_to_datetime,
 )
 
 #: Generalized version of :class:`Item`
 T = TypeVar("T", bound="Item")
+L = TypeVar("L", bound="LazyItem")
 
 if TYPE_CHECKING:
     # avoids conflicts since there are also kwargs and attrs called `datetime`
@@ -90,11 +93,6 @@ class Item(STACObject, Assets):
     extra_fields: dict[str, Any]
     """Extra fields that are part of the top-level JSON fields the Item."""
 
-    geometry: dict[str, Any] | None
-    """Defines the full footprint of the asset represented by this item, formatted
-    according to `RFC 7946, section 3.1 (GeoJSON)
-    <https://tools.ietf.org/html/rfc7946>`_."""
-
     id: str
     """Provider identifier. Unique within the STAC."""
 
@@ -113,6 +111,11 @@ class Item(STACObject, Assets):
     operations. This is set when an item is read by a StacIO instance.
     """
 
+    _geometry: dict[str, Any] | None
+    _geometry_shared: bool = False
+    """Whether :attr:`_geometry` is shared with the dict the Item was read from, or
+    with other Items, and must be copied before it is handed out."""
+
     STAC_OBJECT_TYPE = STACObjectType.ITEM
 
     def __init__(
@@ -179,6 +182,21 @@ class Item(STACObject, Assets):
     def __repr__(self) -> str:
         return f"<Item id={self.id}>"
 
+    @property
+    def geometry(self) -> dict[str, Any] | None:
+        """Defines the full footprint of the asset represented by this item, formatted
+        according to `RFC 7946, section 3.1 (GeoJSON)
+        <https://tools.ietf.org/html/rfc7946>`_."""
+        if self._geometry_shared:
+            self._geometry = deepcopy(self._geometry)
+            self._geometry_shared = False
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, v: dict[str, Any] | None) -> None:
+        self._geometry = v
+        self._geometry_shared = False
+
     def __getstate__(self) -> dict[str, Any]:
         """Ensure that pystac does not encode too much information when pickling"""
         d = self.__dict__.copy()
@@ -198,10 +216,14 @@ class Item(STACObject, Assets):
         """Ensure that pystac knows how to decode the pickled object"""
         d = state.copy()
 
-        d["links"] = [
+        if "geometry" in d:
+            # Pickled before the geometry could be shared
+            d["_geometry"] = d.pop("geometry")
+
+        d["links"] = _LinkList(
             Link.from_dict(link).set_owner(self) if isinstance(link, dict) else link
             for link in d["links"]
-        ]
+        )
 
         self.__dict__ = d
 
@@ -356,26 +378,21 @@ class Item(STACObject, Assets):
     def to_dict(
         self, include_self_link: bool = True, transform_hrefs: bool = True
     ) -> dict[str, Any]:
-        links = self.links
-        if not include_self_link:
-            links = [x for x in links if x.rel != pystac.RelType.SELF]
-
-        assets = {k: v.to_dict() for k, v in self.assets.items()}
-
-        if self.datetime is not None:
-            self.properties["datetime"] = datetime_to_str(self.datetime)
-        else:
-            self.properties["datetime"] = None
+        link_dicts = self._links_to_dict(include_self_link, transform_hrefs)
+        assets = self._assets_to_dict()
+        self._update_datetime_property()
 
         d: dict[str, Any] = {
             "type": "Feature",
             "stac_version": pystac.get_stac_version(),
             "stac_extensions": self.stac_extensions if self.stac_extensions else [],
             "id": self.id,
+            # Copies a geometry shared with the dict the Item was read from, which
+            # mutating the returned dict must not change
             "geometry": self.geometry,
             "bbox": self.bbox if self.bbox is not None else [],
             "properties": self.properties,
-            "links": [link.to_dict(transform_href=transform_hrefs) for link in links],
+            "links": link_dicts,
             "assets": assets,
         }
 
@@ -386,16 +403,34 @@ class Item(STACObject, Assets):
             d[key] = self.extra_fields[key]
 
         # This field is prohibited if there's no geometry
-        if not self.geometry:
+        if not self._geometry:
             d.pop("bbox")
 
         return d
 
+    def _links_to_dict(
+        self, include_self_link: bool, transform_hrefs: bool
+    ) -> list[dict[str, Any]]:
+        links = self.links
+        if not include_self_link:
+            links = [x for x in links if x.rel != pystac.RelType.SELF]
+        with _href_context_scope():
+            return [link.to_dict(transform_href=transform_hrefs) for link in links]
+
+    def _assets_to_dict(self) -> dict[str, dict[str, Any]]:
+        return {k: v.to_dict() for k, v in self.assets.items()}
+
+    def _update_datetime_property(self) -> None:
+        if self.datetime is not None:
+            self.properties["datetime"] = datetime_to_str(self.datetime)
+        else:
+            self.properties["datetime"] = None
+
     def clone(self) -> Item:
         cls = self.__class__
         clone = cls(
             id=self.id,
-            geometry=deepcopy(self.geometry),
+            geometry=None if self._geometry_shared else deepcopy(self._geometry),
             bbox=copy(self.bbox),
             datetime=copy(self.datetime),
             properties=deepcopy(self.properties),
@@ -404,6 +439,9 @@ class Item(STACObject, Assets):
             assets={k: asset.clone() for k, asset in self.assets.items()},
             extra_fields=deepcopy(self.extra_fields),
         )
+        if self._geometry_shared:
+            clone._geometry = self._geometry
+            clone._geometry_shared = True
         for link in self.links:
             clone.add_link(link.clone())
 
@@ -423,15 +461,69 @@ class Item(STACObject, Assets):
         root: Catalog | None = None,
         migrate: bool = True,
         preserve_dict: bool = True,
+    ) -> T:
+        return cls._from_dict(d, href, root, migrate, preserve_dict)
+
+    @classmethod
+    def from_dict_copy_on_write(
+        cls: type[T],
+        d: dict[str, Any],
+        href: str | None = None,
+        root: Catalog | None = None,
+        migrate: bool = True,
+    ) -> T:
+        """Parses an Item from the passed in dictionary like :meth:`from_dict`,
+        without copying its geometry, which is usually its largest part.
+
+        The Item shares the geometry of ``d`` until it is accessed through
+        :attr:`geometry` or :meth:`to_dict`, which copy it first. Clones of the Item
+        share it too, so the geometry of ``d`` must not be modified in place while
+        the Item is in use. The rest of ``d`` is copied and not mutated.
+
+        Args:
+            d : The dict to parse.
+            href : Optional href that is the file location of the object being
+                parsed.
+            root : Optional root catalog for this object.
+                If provided, the root of the returned STACObject will be set
+                to this parameter.
+            migrate: By default, STAC objects and extensions are migrated to
+                their latest supported version. Set this to False to disable
+                this behavior.
+
+        Returns:
+            Item: The Item parsed from this dict.
+        """
+        return cls._from_dict(d, href, root, migrate, True, copy_on_write=True)
+
+    @classmethod
+    def _from_dict(
+        cls: type[T],
+        d: dict[str, Any],
+        href: str | None,
+        root: Catalog | None,
+        migrate: bool,
+        preserve_dict: bool,
+        copy_on_write: bool = False,
     ) -> T:
         import warnings
 
-        if preserve_dict:
-            d = deepcopy(d)
+        shared_geometry = None
+        if preserve_dict and copy_on_write and isinstance(d.get("geometry"), dict):
+            # Identification and migration never read the geometry, so it is left
+            # out of the copies they make and handed to the Item as is
+            shared_geometry = d["geometry"]
+            d = {k: v for k, v in d.items() if k != "geometry"}
 
         if migrate:
+            # migrate_to_latest returns a copy, so d needs no other copy
             info = identify_stac_object(d)
             d = migrate_to_latest(d, info)
+        elif preserve_dict:
+            d = deepcopy(d)
+
+        if shared_geometry is not None:
+            d["geometry"] = shared_geometry
 
         if not cls.matches_object_type(d):
             raise pystac.STACTypeError(d, cls)
@@ -477,6 +569,9 @@ class Item(STACObject, Assets):
             if href is None or link.get("rel", None) != RelType.SELF:
                 item.add_link(Link.from_dict(link))
 
+        if shared_geometry is not None:
+            item._geometry_shared = True
+
         if root:
             item.set_root(root)
 
@@ -533,3 +628,189 @@ class Item(STACObject, Assets):
             _raise_for_missing_ext(e)
 
         return ItemExt(stac_object=self)
+
+
+class LazyItem(Item):
+    """An :class:`Item` that is parsed from a dict on demand.
+
+    :meth:`LazyItem.from_dict` only reads the top-level fields of the dict. The
+    :attr:`links`, :attr:`assets` and :attr:`datetime` of the Item are created from
+    the dict when they are first accessed, so reading e.g. the ``id``, ``bbox`` or
+    :attr:`properties` of many Items is cheap. :meth:`to_dict` reuses the dicts of
+    the parts that were never accessed.
+
+    Passing a ``root`` to :meth:`from_dict` and most link operations, such as
+    :meth:`get_self_href`, create the links. Once created, a part behaves exactly
+    as in an :class:`Item`, and a LazyItem can be used wherever an Item is expected.
+    """
+
+    _raw_links: list[dict[str, Any]] | None = None
+    _raw_assets: dict[str, dict[str, Any]] | None = None
+    _raw_href: str | None = None
+
+    @property
+    def links(self) -> list[Link]:
+        """A list of :class:`~pystac.Link` objects representing all links associated
+        with this Item."""
+        if "links" not in self.__dict__:
+            self._load_links()
+        return cast(list[Link], self.__dict__["links"])
+
+    @links.setter
+    def links(self, v: list[Link]) -> None:
+        self.__dict__["links"] = v
+        self._raw_links = None
+
+    @property
+    def assets(self) -> dict[str, Asset]:
+        """Dictionary of :class:`~pystac.Asset` objects, each with a unique key."""
+        if "assets" not in self.__dict__:
+            self._load_assets()
+        return cast(dict[str, Asset], self.__dict__["assets"])
+
+    @assets.setter
+    def assets(self, v: dict[str, Asset]) -> None:
+        self.__dict__["assets"] = v
+        self._raw_assets = None
+
+    @property
+    def datetime(self) -> Datetime | None:
+        """Datetime associated with this item. If ``None``, then
+        :attr:`~pystac.CommonMetadata.start_datetime` and
+        :attr:`~pystac.CommonMetadata.end_datetime` in
+        :attr:`~pystac.Item.common_metadata` will supply the datetime range of the
+        Item."""
+        if "datetime" not in self.__dict__:
+            self.__dict__["datetime"] = map_opt(
+                str_to_datetime, self.properties.get("datetime")
+            )
+        return cast("Datetime | None", self.__dict__["datetime"])
+
+    @datetime.setter
+    def datetime(self, v: Datetime | None) -> None:
+        self.__dict__["datetime"] = v
+
+    def _load_links(self) -> None:
+        raw_links = self._raw_links or []
+        href = self._raw_href
+        self.links = []
+        self._raw_href = None
+        if href is not None:
+            self.set_self_href(href)
+        for link in raw_links:
+            if href is None or link.get("rel", None) != RelType.SELF:
+                self.add_link(Link.from_dict(link))
+
+    def _load_assets(self) -> None:
+        raw_assets = self._raw_assets or {}
+        self.assets = {}
+        for k, v in raw_assets.items():
+            self.add_asset(k, Asset.from_dict(v))
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Create every part, so that the state is the same as an Item's
+        _ = self.links, self.assets, self.datetime
+        return super().__getstate__()
+
+    def _links_to_dict(
+        self, include_self_link: bool, transform_hrefs: bool
+    ) -> list[dict[str, Any]]:
+        if "links" in self.__dict__ or self._raw_href is not None:
+            return super()._links_to_dict(include_self_link, transform_hrefs)
+        # Without a root or self HREF, the HREFs would not be transformed
+        return [
+            _posix_style_copy(link)
+            for link in self._raw_links or []
+            if include_self_link or link.get("rel") != RelType.SELF
+        ]
+
+    def _assets_to_dict(self) -> dict[str, dict[str, Any]]:
+        if "assets" in self.__dict__:
+            return super()._assets_to_dict()
+        return {k: _posix_style_copy(v) for k, v in (self._raw_assets or {}).items()}
+
+    def _update_datetime_property(self) -> None:
+        # The property is only out of date if the datetime has been accessed
+        if "datetime" in self.__dict__:
+            super()._update_datetime_property()
+        else:
+            self.properties.setdefault("datetime", None)
+
+    @classmethod
+    def from_dict(
+        cls: type[L],
+        d: dict[str, Any],
+        href: str | None = None,
+        root: Catalog | None = None,
+        migrate: bool = True,
+        preserve_dict: bool = True,
+    ) -> L:
+        import warnings
+
+        if migrate:
+            # migrate_to_latest returns a copy, so d needs no other copy
+            info = identify_stac_object(d)
+            d = migrate_to_latest(d, info)
+        elif preserve_dict:
+            d = deepcopy(d)
+
+        if not cls.matches_object_type(d):
+            raise pystac.STACTypeError(d, cls)
+
+        properties = d.get("properties", {})
+        if properties.get("datetime") is None and (
+            "start_datetime" not in properties or "end_datetime" not in properties
+        ):
+            raise STACError(
+                "Invalid Item: If datetime is None, "
+                "a start_datetime and end_datetime "
+                "must be supplied."
+            )
+
+        item = cls.__new__(cls)
+        item.id = d["id"]
+        item.geometry = d.get("geometry")
+        item.bbox = d.get("bbox")
+        item.properties = properties
+        item.stac_extensions = d.get("stac_extensions") or []
+        item.collection_id = d.get("collection")
+        item.collection = None
+        item.extra_fields = {
+            k: v for k, v in d.items() if k not in _LAZY_ITEM_KNOWN_FIELDS
+        }
+        item._raw_links = d.get("links", [])
+        item._raw_assets = d.get("assets", {})
+        item._raw_href = href
+
+        if root:
+            item.set_root(root)
+
+        message = pystac.EXTENSION_HOOKS.get_deprecation_message(item)
+        if message is not None:
+            warnings.warn(message, DeprecatedWarning)
+
+        return item
+
+
+_LAZY_ITEM_KNOWN_FIELDS = {
+    "id",
+    "geometry",
+    "bbox",
+    "stac_extensions",
+    "collection",
+    "links",
+    "assets",
+    "properties",
+    "type",
+    "stac_version",
+}
+
+
+def _posix_style_copy(d: dict[str, Any]) -> dict[str, Any]:
+    """Copies a serialized link or asset, with its HREF in posix style as if it had
+    been read with :meth:`Link.from_dict <pystac.Link.from_dict>` or
+    :meth:`Asset.from_dict <pystac.Asset.from_dict>`."""
+    d = dict(d)
+    if isinstance(d.get("href"), str):
+        d["href"] = make_posix_style(d["href"])
+    return d
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable, Iterator
+from collections.abc import Collection, Iterable, Iterator, Sequence
 from typing import (
+    TYPE_CHECKING,
     Any,
     TypeAlias,
     TypeVar,
 )
 
 import pystac
-from pystac.errors import STACTypeError
+from pystac.errors import STACError, STACTypeError
 from pystac.serialization.identify import identify_stac_object_type
+from pystac.spatial_index import DatetimeQuery, SpatialIndex, SpatialIndexEntry
+from pystac.temporal_index import TemporalIndex
 from pystac.utils import HREF, is_absolute_href, make_absolute_href, make_posix_style
 
+if TYPE_CHECKING:
+    from pystac.item_table import ItemTable
+
 ItemLike: TypeAlias = pystac.Item | dict[str, Any]
 
 #: Generalized version of :class:`ItemCollection`
@@ -143,6 +149,55 @@ class ItemCollection(Collection[pystac.Item]):
             **self.extra_fields,
         }
 
+    def filter(
+        self,
+        bbox: Sequence[float] | None = None,
+        datetime: DatetimeQuery | None = None,
+        index: SpatialIndex | TemporalIndex | None = None,
+    ) -> ItemCollection:
+        """Returns a new :class:`ItemCollection` with the items of this instance that
+        match the given bounding box and datetime. The items are not cloned, and
+        :attr:`extra_fields` are not carried over.
+
+        Args:
+            bbox : If set, only keep items whose bounding box intersects this
+                bounding box.
+            datetime : If set, only keep items whose datetime, or
+                ``start_datetime`` to ``end_datetime`` range, overlaps this datetime
+                or interval. See :data:`pystac.spatial_index.DatetimeQuery`.
+            index : Optional :class:`~pystac.spatial_index.SpatialIndex` or
+                :class:`~pystac.temporal_index.TemporalIndex` over the items of this
+                instance, created with their ``from_items`` method, to answer
+                repeated queries without testing every item.
+        """
+        if index is None:
+            items = [
+                item
+                for item in self.items
+                if SpatialIndexEntry.from_item(item).matches(bbox, datetime)
+            ]
+        else:
+            items = []
+            for target in index.search(bbox, datetime):
+                if not isinstance(target, pystac.Item):
+                    raise STACError(
+                        "ItemCollection.filter requires an index of Items, not HREFs"
+                    )
+                items.append(target)
+        return ItemCollection(items, clone_items=False)
+
+    def to_table(self, properties: Iterable[str] | None = None) -> ItemTable:
+        """Returns a columnar :class:`~pystac.item_table.ItemTable` of the items of
+        this instance, for vectorized filtering, sorting, grouping and extent
+        calculation. The items are not cloned. Requires NumPy.
+
+        Args:
+            properties : The names of the Item properties to store as columns.
+        """
+        from pystac.item_table import ItemTable
+
+        return ItemTable.from_items(self.items, properties=properties)
+
     def _repr_html_(self) -> str:
         from html import escape
 
@@ -213,6 +268,69 @@ class ItemCollection(Collection[pystac.Item]):
 
         return cls.from_dict(d, preserve_dict=False)
 
+    @classmethod
+    def iter_file(
+        cls, href: HREF, stac_io: pystac.StacIO | None = None
+    ) -> Iterator[pystac.Item]:
+        """Reads the Items of a newline-delimited JSON file, with one Item per line,
+        one at a time. Blank lines are skipped.
+
+        Lines are read through :meth:`StacIO.read_text_lines
+        <pystac.StacIO.read_text_lines>`, so with :class:`~pystac.stac_io.DefaultStacIO`
+        only the current Item is held in memory.
+
+        Arguments:
+            href : Path to the file.
+            stac_io : A :class:`~pystac.StacIO` instance to use for file I/O
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+
+        href = make_posix_style(href)
+        if not is_absolute_href(href):
+            href = make_absolute_href(href)
+
+        for line in stac_io.read_text_lines(href):
+            if line.strip():
+                yield pystac.Item.from_dict(
+                    stac_io.json_loads(line), preserve_dict=False
+                )
+
+    @staticmethod
+    def write_ndjson(
+        dest_href: HREF,
+        items: Iterable[ItemLike],
+        stac_io: pystac.StacIO | None = None,
+    ) -> None:
+        """Writes Items to a newline-delimited JSON file, with one Item per line,
+        that can be read back with :meth:`iter_file`.
+
+        Lines are written through :meth:`StacIO.write_text_lines
+        <pystac.StacIO.write_text_lines>`, so with
+        :class:`~pystac.stac_io.DefaultStacIO` each Item is serialized and written as
+        it is produced by ``items``, e.g. by a generator, and the Items are never all
+        held in memory.
+
+        Args:
+            dest_href : Location to which the file will be saved.
+            items : The :class:`~pystac.Item` instances or Item dictionaries to
+                write, e.g. an :class:`ItemCollection`.
+            stac_io: Optional :class:`~pystac.StacIO` instance to use. If not provided,
+                will use the default instance.
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+
+        def lines() -> Iterator[str]:
+            for item in items:
+                if isinstance(item, pystac.Item):
+                    d = item.to_dict(transform_hrefs=False)
+                else:
+                    d = item
+                yield stac_io.json_dumps_line(d) + "\n"
+
+        stac_io.write_text_lines(dest_href, lines())
+
     def save_object(
         self,
         dest_href: str,
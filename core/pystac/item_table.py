@@ -0,0 +1,462 @@
+"""Columnar, NumPy-backed view of a collection of STAC Items."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime as Datetime
+from datetime import timedelta, timezone
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+import pystac
+from pystac.spatial_index import DatetimeQuery, _get_interval, _get_rects
+from pystac.utils import str_to_datetime
+
+try:
+    import numpy as np
+except ImportError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from pystac.item import Item
+    from pystac.item_collection import ItemCollection
+
+ItemLike: TypeAlias = "Item | dict[str, Any]"
+
+#: The names of the columns that every :class:`ItemTable` has. Any other column name
+#: refers to one of the :attr:`ItemTable.properties`.
+CORE_COLUMNS = ("id", "collection", "datetime", "start_datetime", "end_datetime")
+
+_EPOCH = Datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class ItemTable:
+    """An immutable, columnar table of STAC Items, backed by NumPy arrays.
+
+    Each row of the table is an Item. The ids, bounding boxes, datetimes, collection
+    ids and a selection of properties are stored as one array per column, so that
+    filtering by bounding box or datetime, sorting, grouping and computing an extent
+    are vectorized and do not touch the Items. The Items, or the dictionaries they
+    were read from, are kept alongside and are only converted to
+    :class:`~pystac.Item` by :meth:`get_item`, :meth:`to_items` and
+    :meth:`to_item_collection`.
+
+    Datetimes are stored as ``datetime64[us]`` arrays, i.e. int64 microseconds
+    since the UTC epoch, with ``NaT`` for missing values. Naive datetimes are taken
+    to be in UTC.
+
+    To use this class, you'll need to install PySTAC with NumPy:
+
+    .. code-block:: shell
+
+        pip install pystac[numpy]
+
+    Args:
+        sources : The :class:`~pystac.Item` instances or Item dictionaries of each
+            row. They are neither cloned nor modified.
+        ids : The ``id`` of each Item.
+        bboxes : An N×4 array of the ``(min x, min y, max x, max y)`` bounding box
+            of each Item, with NaN for Items that have no bounding box.
+        datetimes : The ``datetime`` of each Item.
+        start_datetimes : The ``start_datetime`` of each Item.
+        end_datetimes : The ``end_datetime`` of each Item.
+        collection_ids : The ``collection`` of each Item, or ``None``.
+        properties : Additional columns, keyed by property name.
+
+    Examples:
+
+        Keep the Items of 2020 with less than 10% cloud cover
+
+        >>> table = ItemTable.from_items(items, properties=["eo:cloud_cover"])
+        >>> table = table.filter(datetime="2020-01-01T00:00:00Z/2021-01-01T00:00:00Z")
+        >>> table = table.take(table.properties["eo:cloud_cover"] < 10)
+        >>> item_collection = table.to_item_collection()
+    """
+
+    ids: npt.NDArray[np.object_]
+    """The ``id`` of each Item."""
+
+    bboxes: npt.NDArray[np.float64]
+    """The N×4 ``(min x, min y, max x, max y)`` bounding box of each Item. 3D bounding
+    boxes are stored on x and y only. Rows are NaN for Items without a bounding
+    box."""
+
+    datetimes: npt.NDArray[np.datetime64]
+    """The ``datetime`` of each Item."""
+
+    start_datetimes: npt.NDArray[np.datetime64]
+    """The ``start_datetime`` of each Item."""
+
+    end_datetimes: npt.NDArray[np.datetime64]
+    """The ``end_datetime`` of each Item."""
+
+    collection_ids: npt.NDArray[np.object_]
+    """The ``collection`` of each Item, or ``None``."""
+
+    properties: dict[str, npt.NDArray[Any]]
+    """Additional columns, keyed by property name."""
+
+    _sources: list[ItemLike]
+
+    def __init__(
+        self,
+        sources: Sequence[ItemLike],
+        ids: Iterable[str],
+        bboxes: npt.ArrayLike,
+        datetimes: npt.ArrayLike,
+        start_datetimes: npt.ArrayLike,
+        end_datetimes: npt.ArrayLike,
+        collection_ids: Iterable[str | None],
+        properties: dict[str, npt.ArrayLike] | None = None,
+    ):
+        if not HAS_NUMPY:
+            raise ImportError("Cannot instantiate, requires numpy package")
+
+        self._sources = list(sources)
+        self.ids = _object_array(ids)
+        self.bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        self.datetimes = np.asarray(datetimes, dtype="datetime64[us]")
+        self.start_datetimes = np.asarray(start_datetimes, dtype="datetime64[us]")
+        self.end_datetimes = np.asarray(end_datetimes, dtype="datetime64[us]")
+        self.collection_ids = _object_array(collection_ids)
+        self.properties = {
+            name: np.asarray(values) for name, values in (properties or {}).items()
+        }
+
+        n = len(self._sources)
+        for name in CORE_COLUMNS:
+            if len(self.column(name)) != n:
+                raise ValueError(
+                    f"Column {name!r} has {len(self.column(name))} rows, expected {n}"
+                )
+        if len(self.bboxes) != n:
+            raise ValueError(f"Column 'bbox' has {len(self.bboxes)} rows, expected {n}")
+        for name, values in self.properties.items():
+            if len(values) != n:
+                raise ValueError(
+                    f"Property {name!r} has {len(values)} rows, expected {n}"
+                )
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __iter__(self) -> Iterator[Item]:
+        return (self.get_item(i) for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"<ItemTable rows={len(self)} properties={list(self.properties)}>"
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[ItemLike],
+        properties: Iterable[str] | None = None,
+    ) -> ItemTable:
+        """Creates a table from Items or Item dictionaries, such as the
+        ``features`` of an Item Collection dictionary. Dictionaries are read
+        directly, without creating :class:`~pystac.Item` instances.
+
+        Args:
+            items : The :class:`~pystac.Item` instances or Item dictionaries.
+            properties : The names of the Item properties to store as columns. An
+                Item that does not have a property has ``None`` or NaN in its
+                column.
+        """
+        if not HAS_NUMPY:
+            raise ImportError("Cannot instantiate, requires numpy package")
+
+        sources = list(items)
+        names = list(properties or [])
+        n = len(sources)
+        ids: list[str] = [""] * n
+        bboxes = np.full((n, 4), np.nan)
+        datetimes = np.empty(n, dtype=np.int64)
+        starts = np.empty(n, dtype=np.int64)
+        ends = np.empty(n, dtype=np.int64)
+        collection_ids: list[str | None] = [None] * n
+        values: dict[str, list[Any]] = {name: [None] * n for name in names}
+
+        for i, source in enumerate(sources):
+            if isinstance(source, pystac.Item):
+                ids[i] = source.id
+                bbox = source.bbox
+                collection_ids[i] = source.collection_id
+                props = source.properties
+                datetimes[i] = _to_microseconds(source.datetime)
+            else:
+                ids[i] = source["id"]
+                bbox = source.get("bbox")
+                collection_ids[i] = source.get("collection")
+                props = source.get("properties") or {}
+                datetimes[i] = _str_to_microseconds(props.get("datetime"))
+            if bbox is not None:
+                if len(bbox) == 6:
+                    bboxes[i] = bbox[0], bbox[1], bbox[3], bbox[4]
+                else:
+                    bboxes[i] = bbox
+            starts[i] = _str_to_microseconds(props.get("start_datetime"))
+            ends[i] = _str_to_microseconds(props.get("end_datetime"))
+            for name in names:
+                values[name][i] = props.get(name)
+
+        return cls(
+            sources,
+            ids=ids,
+            bboxes=bboxes,
+            datetimes=datetimes.view("datetime64[us]"),
+            start_datetimes=starts.view("datetime64[us]"),
+            end_datetimes=ends.view("datetime64[us]"),
+            collection_ids=collection_ids,
+            properties={name: _to_column(values[name]) for name in names},
+        )
+
+    def column(self, name: str) -> npt.NDArray[Any]:
+        """Returns a column by name: one of :data:`CORE_COLUMNS`, or the name of
+        one of the :attr:`properties`.
+
+        Raises:
+            KeyError : If there is no such column.
+        """
+        if name == "id":
+            return self.ids
+        elif name == "collection":
+            return self.collection_ids
+        elif name == "datetime":
+            return self.datetimes
+        elif name == "start_datetime":
+            return self.start_datetimes
+        elif name == "end_datetime":
+            return self.end_datetimes
+        elif name in self.properties:
+            return self.properties[name]
+        raise KeyError(f"ItemTable has no column {name!r}")
+
+    def take(self, indices: npt.ArrayLike) -> ItemTable:
+        """Returns a new table with the given rows.
+
+        Args:
+            indices : The integer positions of the rows to keep, in order, or a
+                boolean mask with one value per row.
+        """
+        indices = np.asarray(indices)
+        if indices.dtype == np.bool_:
+            indices = np.flatnonzero(indices)
+        return ItemTable(
+            [self._sources[i] for i in indices.tolist()],
+            ids=self.ids[indices],
+            bboxes=self.bboxes[indices],
+            datetimes=self.datetimes[indices],
+            start_datetimes=self.start_datetimes[indices],
+            end_datetimes=self.end_datetimes[indices],
+            collection_ids=self.collection_ids[indices],
+            properties={name: v[indices] for name, v in self.properties.items()},
+        )
+
+    def mask(
+        self,
+        bbox: Sequence[float] | None = None,
+        datetime: DatetimeQuery | None = None,
+    ) -> npt.NDArray[np.bool_]:
+        """Returns a boolean array that is ``True`` for the rows that match the
+        given query. See :meth:`filter`."""
+        matches = np.ones(len(self), dtype=np.bool_)
+        if bbox is not None:
+            min_x, min_y, max_x, max_y = self.bboxes.T
+            crosses = min_x > max_x
+            intersects = np.zeros(len(self), dtype=np.bool_)
+            for q_min_x, q_min_y, q_max_x, q_max_y in _get_rects(bbox):
+                # An Item that crosses the antimeridian covers [min x, 180] and
+                # [-180, max x]
+                in_x = np.where(
+                    crosses,
+                    (min_x <= q_max_x) | (max_x >= q_min_x),
+                    (min_x <= q_max_x) & (max_x >= q_min_x),
+                )
+                intersects |= in_x & (min_y <= q_max_y) & (max_y >= q_min_y)
+            matches &= intersects
+        if datetime is not None:
+            query_start, query_end = _get_interval(datetime)
+            starts = np.where(
+                np.isnat(self.start_datetimes), self.datetimes, self.start_datetimes
+            )
+            ends = np.where(
+                np.isnat(self.end_datetimes), self.datetimes, self.end_datetimes
+            )
+            if query_start is not None:
+                start = np.datetime64(_to_microseconds(query_start), "us")
+                matches &= np.isnat(ends) | (ends >= start)
+            if query_end is not None:
+                end = np.datetime64(_to_microseconds(query_end), "us")
+                matches &= np.isnat(starts) | (starts <= end)
+        return matches
+
+    def filter(
+        self,
+        bbox: Sequence[float] | None = None,
+        datetime: DatetimeQuery | None = None,
+    ) -> ItemTable:
+        """Returns a new table with the rows that match the given bounding box and
+        datetime, with the same semantics as
+        :meth:`ItemCollection.filter <pystac.ItemCollection.filter>`.
+
+        Args:
+            bbox : If set, only keep rows whose bounding box intersects this
+                bounding box.
+            datetime : If set, only keep rows whose datetime, or
+                ``start_datetime`` to ``end_datetime`` range, overlaps this datetime
+                or interval. See :data:`pystac.spatial_index.DatetimeQuery`.
+        """
+        return self.take(self.mask(bbox, datetime))
+
+    def sort(self, by: str, reverse: bool = False) -> ItemTable:
+        """Returns a new table sorted by a column. The sort is stable, and missing
+        values are sorted last.
+
+        Args:
+            by : The name of the column to sort by. See :meth:`column`.
+            reverse : If ``True``, sort in descending order. Missing values are
+                then sorted first.
+        """
+        values = self.column(by)
+        if values.dtype == np.object_:
+            order = np.array(
+                sorted(range(len(values)), key=lambda i: _object_sort_key(values[i])),
+                dtype=np.intp,
+            )
+        else:
+            order = np.argsort(values, kind="stable")
+        if reverse:
+            order = order[::-1]
+        return self.take(order)
+
+    def groupby(self, by: str) -> dict[Any, ItemTable]:
+        """Splits this table by the values of a column.
+
+        Args:
+            by : The name of the column to group by. See :meth:`column`.
+
+        Returns:
+            dict[Any, ItemTable]: A table for each distinct value of the column,
+            keyed by that value as a Python object, in sorted order of the values.
+            Rows keep their relative order.
+        """
+        values = self.column(by)
+        if values.dtype == np.object_:
+            keys = sorted(set(values.tolist()), key=_object_sort_key)
+            codes = {key: code for code, key in enumerate(keys)}
+            inverse = np.fromiter(
+                (codes[v] for v in values.tolist()), dtype=np.intp, count=len(values)
+            )
+        else:
+            unique, inverse = np.unique(values, return_inverse=True)
+            keys = unique.tolist()
+        inverse = inverse.reshape(-1)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(keys) + 1))
+        return {
+            key: self.take(order[bounds[code] : bounds[code + 1]])
+            for code, key in enumerate(keys)
+        }
+
+    def extent(self, extra_fields: dict[str, Any] | None = None) -> pystac.Extent:
+        """Computes the extent of the rows of this table. The result is the same
+        as :meth:`Extent.from_items <pystac.Extent.from_items>` on the Items.
+
+        Args:
+            extra_fields : Optional dictionary containing additional top-level
+                fields defined on the Extent object.
+        """
+        bboxes = self.bboxes[~np.isnan(self.bboxes).any(axis=1)]
+        if len(bboxes):
+            bbox = [
+                float(bboxes[:, 0].min()),
+                float(bboxes[:, 1].min()),
+                float(bboxes[:, 2].max()),
+                float(bboxes[:, 3].max()),
+            ]
+        else:
+            bbox = [math.inf, math.inf, -math.inf, -math.inf]
+        starts = np.concatenate([self.datetimes, self.start_datetimes])
+        ends = np.concatenate([self.datetimes, self.end_datetimes])
+        starts = starts[~np.isnat(starts)]
+        ends = ends[~np.isnat(ends)]
+        return pystac.Extent(
+            spatial=pystac.SpatialExtent([bbox]),
+            temporal=pystac.TemporalExtent(
+                [
+                    [
+                        _from_datetime64(starts.min()) if len(starts) else None,
+                        _from_datetime64(ends.max()) if len(ends) else None,
+                    ]
+                ]
+            ),
+            extra_fields=extra_fields,
+        )
+
+    def get_item(self, index: int) -> Item:
+        """Returns the Item of a row. Items that were given as dictionaries are
+        created with :meth:`Item.from_dict <pystac.Item.from_dict>` on each call,
+        without modifying the dictionary.
+
+        Args:
+            index : The position of the row.
+        """
+        source = self._sources[index]
+        if isinstance(source, pystac.Item):
+            return source
+        return pystac.Item.from_dict(source)
+
+    def to_items(self) -> list[Item]:
+        """Returns the Items of all rows. See :meth:`get_item`."""
+        return [self.get_item(i) for i in range(len(self))]
+
+    def to_item_collection(self) -> ItemCollection:
+        """Returns an :class:`~pystac.ItemCollection` of the Items of all rows. The
+        Items are not cloned."""
+        return pystac.ItemCollection(self.to_items(), clone_items=False)
+
+
+def _object_array(values: Iterable[Any]) -> npt.NDArray[np.object_]:
+    # Keeps values as Python objects, so that None is preserved and sequences are
+    # not turned into extra dimensions
+    values = list(values)
+    array = np.empty(len(values), dtype=np.object_)
+    array[:] = values
+    return array
+
+
+def _to_column(values: list[Any]) -> npt.NDArray[Any]:
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, bool) for v in present):
+        if len(present) == len(values):
+            return np.array(values, dtype=np.bool_)
+    elif present and all(isinstance(v, (int, float)) for v in present):
+        if len(present) == len(values) and all(isinstance(v, int) for v in present):
+            return np.array(values, dtype=np.int64)
+        return np.array([math.nan if v is None else v for v in values], np.float64)
+    return _object_array(values)
+
+
+def _object_sort_key(value: Any) -> tuple[bool, Any]:
+    return (value is None, value)
+
+
+def _to_microseconds(dt: Datetime | None) -> int:
+    if dt is None:
+        return int(np.datetime64("NaT", "us").view(np.int64))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _str_to_microseconds(value: str | None) -> int:
+    return _to_microseconds(None if value is None else str_to_datetime(value))
+
+
+def _from_datetime64(value: np.datetime64) -> Datetime:
+    return _EPOCH + int(value.astype("datetime64[us]").view(np.int64)) * _MICROSECOND
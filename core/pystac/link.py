@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import pystac
 from pystac.errors import STACError
@@ -9,21 +12,31 @@ from pystac.utils import (
     HREF as HREF,
 )
 from pystac.utils import (
+    _is_absolute_href_parsed,
+    _make_relative_href_parsed,
     is_absolute_href,
     make_absolute_href,
     make_posix_style,
     make_relative_href,
+    safe_urlparse,
 )
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from urllib.parse import ParseResult as URLParseResult
+
     from pystac.catalog import Catalog
     from pystac.collection import Collection
     from pystac.extensions.ext import LinkExt
     from pystac.item import Item
+    from pystac.stac_io import AsyncStacIO
     from pystac.stac_object import STACObject
 
     PathLike = os.PathLike[str]
 
+    #: A link whose target is being read by :func:`_resolve_links_concurrently`
+    _PendingLink = tuple["Link", str, pystac.StacIO, Future[dict[str, Any]]]
+
 else:
     PathLike = os.PathLike
 
@@ -172,24 +185,22 @@ class Link(PathLike):
         else:
             href = self._target_href
 
-        if (
-            transform_href
-            and href
-            and is_absolute_href(href)
-            and self.owner
-            and self.owner.get_root()
-        ):
-            root = self.owner.get_root()
-            rel_links = [
-                *HIERARCHICAL_LINKS,
-                *pystac.EXTENSION_HOOKS.get_extended_object_links(self.owner),
-            ]
-            # if a hierarchical link with an owner and root, and relative catalog
-            if root and root.is_relative():
-                if self.rel in rel_links or root.target_in_hierarchy(self.target):
-                    owner_href = self.owner.get_self_href()
-                    if owner_href is not None:
-                        href = make_relative_href(href, owner_href)
+        if transform_href and href and self.owner:
+            context = _href_context.get()
+            if context is not None:
+                return context.transform_href(self, self.owner, href)
+            if is_absolute_href(href):
+                root = self.owner.get_root()
+                # if a hierarchical link with an owner and root, and relative catalog
+                if root and root.is_relative():
+                    rel_links = [
+                        *HIERARCHICAL_LINKS,
+                        *pystac.EXTENSION_HOOKS.get_extended_object_links(self.owner),
+                    ]
+                    if self.rel in rel_links or root.target_in_hierarchy(self.target):
+                        owner_href = self.owner.get_self_href()
+                        if owner_href is not None:
+                            href = make_relative_href(href, owner_href)
 
         return href
 
@@ -296,59 +307,84 @@ class Link(PathLike):
         if self._target_object:
             pass
         elif self._target_href:
-            target_href = self._target_href
-
-            # If it's a relative link, base it off the parent.
-            if not is_absolute_href(target_href):
-                if self.owner is None:
-                    raise pystac.STACError(
-                        "Relative path {} encountered "
-                        "without owner or start_href.".format(target_href)
-                    )
-                start_href = self.owner.get_self_href()
-
-                if start_href is None:
-                    raise pystac.STACError(
-                        "Relative path {} encountered "
-                        'without owner "self" link set.'.format(target_href)
-                    )
-
-                target_href = make_absolute_href(target_href, start_href)
+            target_href = self._get_resolvable_href()
             obj = None
-
-            stac_io: pystac.StacIO | None = None
-
             if root is not None:
                 obj = root._resolved_objects.get_by_href(target_href)
-                stac_io = root._stac_io
-            if stac_io is None and self.owner and hasattr(self.owner, "_stac_io"):
-                stac_io = self.owner._stac_io
 
             if obj is None:
-                if stac_io is None:
-                    if self.owner is not None:
-                        if isinstance(self.owner, pystac.Catalog):
-                            stac_io = self.owner._stac_io
-                        elif self.rel != pystac.RelType.ROOT:
-                            owner_root = self.owner.get_root()
-                            if owner_root is not None:
-                                stac_io = owner_root._stac_io
-                    if stac_io is None:
-                        stac_io = pystac.StacIO.default()
+                stac_io = self._get_stac_io(root)
                 try:
                     obj = stac_io.read_stac_object(target_href, root=root)
                 except Exception as e:
                     raise STACError(
                         f"HREF: '{target_href}' does not resolve to a STAC object"
                     ) from e
-                obj.set_self_href(target_href)
-                if root is not None:
-                    obj = root._resolved_objects.get_or_cache(obj)
-                    obj.set_root(root)
+                obj = self._cache_resolved_object(obj, target_href, root)
             self._target_object = obj
         else:
             raise ValueError("Cannot resolve STAC object without a target")
 
+        self._set_target_parent()
+        return self
+
+    def _get_resolvable_href(self) -> str:
+        """Returns the absolute HREF that the target of this (unresolved) link
+        should be read from."""
+        target_href = cast(str, self._target_href)
+
+        # If it's a relative link, base it off the parent.
+        if not is_absolute_href(target_href):
+            if self.owner is None:
+                raise pystac.STACError(
+                    "Relative path {} encountered without owner or start_href.".format(
+                        target_href
+                    )
+                )
+            start_href = self.owner.get_self_href()
+
+            if start_href is None:
+                raise pystac.STACError(
+                    "Relative path {} encountered "
+                    'without owner "self" link set.'.format(target_href)
+                )
+
+            target_href = make_absolute_href(target_href, start_href)
+        return target_href
+
+    def _get_stac_io(self, root: Catalog | None = None) -> pystac.StacIO:
+        """Returns the :class:`~pystac.StacIO` instance used to read the target of
+        this link."""
+        stac_io: pystac.StacIO | None = None
+        if root is not None:
+            stac_io = root._stac_io
+        if stac_io is None and self.owner and hasattr(self.owner, "_stac_io"):
+            stac_io = self.owner._stac_io
+
+        if stac_io is None:
+            if self.owner is not None:
+                if isinstance(self.owner, pystac.Catalog):
+                    stac_io = self.owner._stac_io
+                elif self.rel != pystac.RelType.ROOT:
+                    owner_root = self.owner.get_root()
+                    if owner_root is not None:
+                        stac_io = owner_root._stac_io
+            if stac_io is None:
+                stac_io = pystac.StacIO.default()
+        return stac_io
+
+    def _cache_resolved_object(
+        self, obj: STACObject, target_href: str, root: Catalog | None
+    ) -> STACObject:
+        """Sets the self HREF of a newly read target object and ties it to the
+        root's resolved object cache, returning the cached instance."""
+        obj.set_self_href(target_href)
+        if root is not None:
+            obj = root._resolved_objects.get_or_cache(obj)
+            obj.set_root(root)
+        return obj
+
+    def _set_target_parent(self) -> None:
         if (
             self.owner
             and self.rel in [pystac.RelType.CHILD, pystac.RelType.ITEM]
@@ -360,7 +396,13 @@ class Link(PathLike):
             if self._target_object._allow_parent_to_override_href:
                 self._target_object.set_parent(self.owner)
 
-        return self
+    def _release(self, root: Catalog | None = None) -> None:
+        """Drops the target object of a link that can be resolved again from its
+        HREF, evicting the object from ``root``'s resolved object cache."""
+        if self._target_object is not None and self._target_href is not None:
+            if root is not None:
+                root._resolved_objects.remove(self._target_object)
+            self._target_object = None
 
     def is_resolved(self) -> bool:
         """Determines if the link's target is a resolved STACObject.
@@ -533,3 +575,340 @@ class Link(PathLike):
             _raise_for_missing_ext(e)
 
         return LinkExt(stac_object=self)
+
+
+class _HrefContext:
+    """Memoizes what :meth:`Link.get_href` derives from link owners (their roots,
+    hierarchical rels, and parsed HREFs) over one serialization pass, during which
+    the catalog must not be modified. See :func:`_href_context_scope`."""
+
+    def __init__(self) -> None:
+        self.roots: dict[STACObject, Catalog | None] = {}
+        self.rel_keys: dict[STACObject, frozenset[str]] = {}
+        self.hierarchies: dict[Catalog, set[str | STACObject]] = {}
+        self.parsed_hrefs: dict[str, URLParseResult] = {}
+
+    def parse(self, href: str) -> URLParseResult:
+        parsed = self.parsed_hrefs.get(href)
+        if parsed is None:
+            parsed = self.parsed_hrefs[href] = safe_urlparse(href)
+        return parsed
+
+    def transform_href(self, link: Link, owner: STACObject, href: str) -> str:
+        if not _is_absolute_href_parsed(self.parse(href)):
+            return href
+
+        if owner in self.roots:
+            root = self.roots[owner]
+        else:
+            root = self.roots[owner] = owner.get_root()
+        if root is None or not root.is_relative():
+            return href
+
+        rel_keys = self.rel_keys.get(owner)
+        if rel_keys is None:
+            rel_keys = self.rel_keys[owner] = frozenset(
+                _rel_key(rel)
+                for rel in [
+                    *HIERARCHICAL_LINKS,
+                    *pystac.EXTENSION_HOOKS.get_extended_object_links(owner),
+                ]
+            )
+        if _rel_key(link.rel) not in rel_keys:
+            # Equivalent to root.target_in_hierarchy(link.target), but traverses the
+            # hierarchy only once for all links
+            hierarchy = self.hierarchies.get(root)
+            if hierarchy is None:
+                hierarchy = self.hierarchies[root] = root._get_hierarchy_targets()
+            if link.target not in hierarchy:
+                return href
+
+        owner_href = owner.get_self_href()
+        if owner_href is None:
+            return href
+        source_href = make_posix_style(href)
+        return _make_relative_href_parsed(
+            source_href,
+            self.parse(source_href),
+            self.parse(make_posix_style(owner_href)),
+        )
+
+
+_href_context: ContextVar[_HrefContext | None] = ContextVar(
+    "_href_context", default=None
+)
+
+
+@contextmanager
+def _href_context_scope() -> Iterator[_HrefContext]:
+    """Memoizes link HREF computations until the block exits. Nested scopes share
+    the outermost context."""
+    context = _href_context.get()
+    if context is not None:
+        yield context
+        return
+    context = _HrefContext()
+    token = _href_context.set(context)
+    try:
+        yield context
+    finally:
+        _href_context.reset(token)
+
+
+_NO_LINKS: list[Link] = []
+
+
+def _rel_key(rel: str | pystac.RelType) -> str:
+    # RelType members hash by name, so index links by the plain string value
+    return str.__str__(rel)
+
+
+class _LinkList(list[Link]):
+    """The list of links of a :class:`~pystac.STACObject`, which indexes its links
+    by ``rel`` on the first lookup so that later lookups do not scan every link.
+
+    Appending and extending update the index; any other change to the list discards
+    it, to be rebuilt by the next lookup. Changing the ``rel`` of a link that is
+    already in the list is not tracked.
+    """
+
+    _by_rel: dict[str, list[Link]] | None = None
+
+    def __reduce__(self) -> tuple[type[_LinkList], tuple[list[Link]]]:
+        return (_LinkList, (list(self),))
+
+    def with_rel(self, rel: str | pystac.RelType) -> list[Link]:
+        """Returns the links with the given ``rel``, in list order. The returned list
+        is owned by the index and must not be modified."""
+        by_rel = self._by_rel
+        if by_rel is None:
+            by_rel = {}
+            for link in self:
+                by_rel.setdefault(_rel_key(link.rel), []).append(link)
+            self._by_rel = by_rel
+        return by_rel.get(_rel_key(rel), _NO_LINKS)
+
+    def _invalidate(self) -> None:
+        self._by_rel = None
+
+    def append(self, link: Link) -> None:
+        super().append(link)
+        if self._by_rel is not None:
+            self._by_rel.setdefault(_rel_key(link.rel), []).append(link)
+
+    def extend(self, links: Iterable[Link]) -> None:
+        links = list(links)
+        super().extend(links)
+        if self._by_rel is not None:
+            for link in links:
+                self._by_rel.setdefault(_rel_key(link.rel), []).append(link)
+
+    def __iadd__(self, links: Iterable[Link]) -> _LinkList:  # type: ignore[override,misc]
+        self.extend(links)
+        return self
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if self._by_rel is not None and isinstance(index, int):
+            old = self[index]
+            bucket = self._by_rel.get(_rel_key(old.rel), [])
+            if _rel_key(old.rel) == _rel_key(value.rel) and old in bucket:
+                bucket[bucket.index(old)] = value
+            else:
+                self._invalidate()
+        else:
+            self._invalidate()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        self._invalidate()
+        super().__delitem__(index)
+
+    def __imul__(self, n: Any) -> _LinkList:  # type: ignore[misc]
+        self._invalidate()
+        return super().__imul__(n)
+
+    def insert(self, index: Any, link: Link) -> None:
+        self._invalidate()
+        super().insert(index, link)
+
+    def remove(self, link: Link) -> None:
+        self._invalidate()
+        super().remove(link)
+
+    def pop(self, index: Any = -1) -> Link:
+        self._invalidate()
+        return super().pop(index)
+
+    def clear(self) -> None:
+        self._invalidate()
+        super().clear()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._invalidate()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self._invalidate()
+        super().reverse()
+
+
+def _resolve_links_concurrently(
+    links: Iterable[Link], root: Catalog | None, max_workers: int
+) -> Iterator[Link]:
+    """Resolves links, reading the JSON of their targets in a thread pool ahead of
+    the consumer.
+
+    Links are yielded, resolved, in the order they are given. Up to ``max_workers``
+    unresolved links beyond the one being consumed are read concurrently using
+    :meth:`StacIO.read_json <pystac.StacIO.read_json>`; deserialization, and any
+    updates to the root's :class:`~pystac.cache.ResolvedObjectCache`, happen in the
+    consuming thread, so the :class:`~pystac.StacIO` instance is the only object
+    that must be thread-safe.
+
+    Args:
+        links : The links to resolve.
+        root : Optional root of the catalog for these links. If provided, the
+            root's resolved object cache is used to search for previously resolved
+            instances of the STAC objects, and newly resolved objects are cached.
+        max_workers : The maximum number of threads used to read link targets.
+
+    Returns:
+        Iterator[Link]: The given links, each resolved.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    def submit(executor: ThreadPoolExecutor, link: Link) -> Link | _PendingLink:
+        if link.is_resolved() or link._target_href is None:
+            return link
+        try:
+            target_href = link._get_resolvable_href()
+        except STACError:
+            # Raise when the link is reached by the consumer
+            return link
+        if root is not None and root._resolved_objects.get_by_href(target_href):
+            return link
+        stac_io = link._get_stac_io(root)
+        return (
+            link,
+            target_href,
+            stac_io,
+            executor.submit(stac_io.read_json, target_href),
+        )
+
+    links_iter = iter(links)
+    pending: deque[Link | _PendingLink] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for link in links_iter:
+                pending.append(submit(executor, link))
+                if len(pending) > max_workers:
+                    break
+            while pending:
+                entry = pending.popleft()
+                next_link = next(links_iter, None)
+                if next_link is not None:
+                    pending.append(submit(executor, next_link))
+
+                if isinstance(entry, Link):
+                    yield entry.resolve_stac_object(root=root)
+                    continue
+
+                link, target_href, stac_io, future = entry
+                if not link.is_resolved():
+                    obj = None
+                    if root is not None:
+                        obj = root._resolved_objects.get_by_href(target_href)
+                    if obj is None:
+                        try:
+                            obj = stac_io.stac_object_from_dict(
+                                future.result(),
+                                href=target_href,
+                                root=root,
+                                preserve_dict=False,
+                            )
+                        except Exception as e:
+                            raise STACError(
+                                f"HREF: '{target_href}' does not resolve to a STAC "
+                                "object"
+                            ) from e
+                        obj = link._cache_resolved_object(obj, target_href, root)
+                    link._target_object = obj
+                yield link.resolve_stac_object(root=root)
+        finally:
+            for entry in pending:
+                if not isinstance(entry, Link):
+                    entry[3].cancel()
+
+
+async def _aresolve_links(
+    links: Iterable[Link],
+    root: Catalog | None,
+    stac_io: AsyncStacIO,
+    max_concurrency: int,
+) -> list[Link]:
+    """Resolves links, reading the JSON of their targets concurrently with an
+    :class:`~pystac.AsyncStacIO`.
+
+    At most ``max_concurrency`` targets are read at the same time. Deserialization,
+    and any updates to the root's :class:`~pystac.cache.ResolvedObjectCache`, happen
+    once all reads have completed.
+
+    Args:
+        links : The links to resolve.
+        root : Optional root of the catalog for these links. If provided, the
+            root's resolved object cache is used to search for previously resolved
+            instances of the STAC objects, and newly resolved objects are cached.
+        stac_io : The :class:`~pystac.AsyncStacIO` used to read link targets.
+        max_concurrency : The maximum number of concurrent reads.
+
+    Returns:
+        list[Link]: The given links, each resolved.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def read_json(target_href: str) -> dict[str, Any]:
+        async with semaphore:
+            return await stac_io.read_json(target_href)
+
+    links = list(links)
+    to_read: list[tuple[Link, str]] = []
+    for link in links:
+        if link.is_resolved() or link._target_href is None:
+            continue
+        try:
+            target_href = link._get_resolvable_href()
+        except STACError:
+            # Raised below by resolve_stac_object
+            continue
+        if root is not None and root._resolved_objects.get_by_href(target_href):
+            continue
+        to_read.append((link, target_href))
+
+    results = await asyncio.gather(
+        *(read_json(target_href) for _, target_href in to_read),
+        return_exceptions=True,
+    )
+    for (link, target_href), result in zip(to_read, results):
+        if link.is_resolved():
+            continue
+        obj = None
+        if root is not None:
+            obj = root._resolved_objects.get_by_href(target_href)
+        if obj is None:
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                obj = stac_io.stac_object_from_dict(
+                    result, href=target_href, root=root, preserve_dict=False
+                )
+            except Exception as e:
+                raise STACError(
+                    f"HREF: '{target_href}' does not resolve to a STAC object"
+                ) from e
+            obj = link._cache_resolved_object(obj, target_href, root)
+        link._target_object = obj
+
+    return [link.resolve_stac_object(root=root) for link in links]
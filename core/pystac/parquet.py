@@ -0,0 +1,547 @@
+"""Reading and writing STAC Items as
+`stac-geoparquet <https://github.com/stac-utils/stac-geoparquet>`_ files.
+
+Each Item is a row. The ``type``, ``stac_version``, ``stac_extensions``, ``id``,
+``links``, ``assets`` and ``collection`` fields of the Item are columns, the geometry
+is a WKB-encoded ``geometry`` column described by the GeoParquet ``geo`` metadata,
+the bounding box is a ``bbox`` struct column of ``xmin``, ``ymin``, ``xmax`` and
+``ymax`` (plus ``zmin`` and ``zmax`` for 3D bounding boxes), and every property is
+its own column, with datetime properties stored as UTC timestamps. Any other
+top-level field of an Item is also a column, and is read back as a property.
+
+To use this module, you'll need to install PySTAC with pyarrow:
+
+.. code-block:: shell
+
+    pip install pystac[parquet]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime as Datetime
+from datetime import timezone
+from typing import TYPE_CHECKING, Any
+
+import pystac
+from pystac.errors import STACError
+from pystac.spatial_index import (
+    DatetimeQuery,
+    SpatialIndexEntry,
+    _get_interval,
+    _get_rects,
+)
+from pystac.utils import HREF, datetime_to_str, make_posix_style, str_to_datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    HAS_PYARROW = False
+else:
+    HAS_PYARROW = True
+
+if TYPE_CHECKING:
+    from pyarrow.fs import FileSystem
+
+    from pystac.item import Item
+
+#: The version of the stac-geoparquet specification that is written
+STAC_GEOPARQUET_VERSION = "1.0.0"
+
+#: The version of the GeoParquet specification that is written
+GEOPARQUET_VERSION = "1.1.0"
+
+DEFAULT_ROW_GROUP_SIZE = 10_000
+
+#: Item fields that are stored in their own column rather than as properties
+CORE_COLUMNS = (
+    "type",
+    "stac_version",
+    "stac_extensions",
+    "id",
+    "geometry",
+    "bbox",
+    "links",
+    "assets",
+    "collection",
+)
+
+#: Properties that are stored as timestamps
+DATETIME_PROPERTIES = (
+    "datetime",
+    "start_datetime",
+    "end_datetime",
+    "created",
+    "updated",
+)
+
+_BBOX_FIELDS = {
+    4: ("xmin", "ymin", "xmax", "ymax"),
+    6: ("xmin", "ymin", "zmin", "xmax", "ymax", "zmax"),
+}
+
+# Columns that are always read, when present, so that Items can be created
+_REQUIRED_COLUMNS = ("id", "datetime", "start_datetime", "end_datetime")
+
+
+def write_items(
+    dest_href: HREF,
+    items: Iterable[Item | dict[str, Any]],
+    schema: pa.Schema | None = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    filesystem: FileSystem | None = None,
+) -> None:
+    """Writes Items to a stac-geoparquet file.
+
+    Items are converted and written one row group at a time, so that ``items`` can be
+    a generator, e.g. :meth:`Catalog.get_items(recursive=True)
+    <pystac.Catalog.get_items>`, and the Items are never all held in memory.
+
+    The Parquet schema must be known before the first row group is written. If
+    ``schema`` is not given, it is inferred from all the Items when ``items`` is a
+    sequence, such as a list or an :class:`~pystac.ItemCollection`, and otherwise
+    from the Items of the first row group. Use :func:`infer_schema` to infer the
+    schema of an iterable ahead of time.
+
+    Args:
+        dest_href : Location to which the file will be saved.
+        items : The :class:`~pystac.Item` instances or Item dictionaries to write.
+        schema : Optional Parquet schema of the rows.
+        row_group_size : The maximum number of Items in each row group. Smaller
+            row groups let :func:`read_items` skip more of the file when filtering,
+            at the cost of a larger file.
+        filesystem : Optional :py:class:`pyarrow.fs.FileSystem` to write to.
+            Defaults to the local file system.
+
+    Raises:
+        STACError : If the schema was given or inferred from the first row group,
+            and an Item has a field or type that does not fit it.
+    """
+    if not HAS_PYARROW:
+        raise ImportError("write_items requires the pyarrow package")
+
+    # A schema that was given or inferred from only the first row group may not
+    # fit later Items; Table.from_pylist would silently drop fields that it lacks
+    check_schema = True
+    if schema is None and isinstance(items, Sequence):
+        schema = infer_schema(items)
+        check_schema = False
+
+    writer: pq.ParquetWriter | None = None
+    try:
+        for records in _batched(map(_to_record, items), row_group_size):
+            if schema is None:
+                schema = _schema_of(records)
+            elif check_schema:
+                _check_schema(records, schema)
+            if writer is None:
+                schema = _with_geo_metadata(schema)
+                writer = pq.ParquetWriter(
+                    _to_path(dest_href), schema, filesystem=filesystem
+                )
+            table = pa.Table.from_pylist(records, schema=schema)
+            writer.write_table(table, row_group_size=row_group_size)
+        if writer is None:
+            # No items; write an empty file
+            schema = _with_geo_metadata(schema or pa.schema([("id", pa.string())]))
+            writer = pq.ParquetWriter(
+                _to_path(dest_href), schema, filesystem=filesystem
+            )
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def infer_schema(items: Iterable[Item | dict[str, Any]]) -> pa.Schema:
+    """Infers the Parquet schema that fits all the given Items, for
+    :func:`write_items`.
+
+    Args:
+        items : The :class:`~pystac.Item` instances or Item dictionaries.
+    """
+    if not HAS_PYARROW:
+        raise ImportError("infer_schema requires the pyarrow package")
+
+    schemas = [
+        _schema_of(records)
+        for records in _batched(map(_to_record, items), DEFAULT_ROW_GROUP_SIZE)
+    ]
+    if not schemas:
+        return pa.schema([("id", pa.string())])
+    return pa.unify_schemas(schemas, promote_options="permissive")
+
+
+def read_items(
+    href: HREF,
+    columns: Sequence[str] | None = None,
+    bbox: Sequence[float] | None = None,
+    datetime: DatetimeQuery | None = None,
+    filesystem: FileSystem | None = None,
+) -> Iterator[Item]:
+    """Reads the Items of a stac-geoparquet file, one batch of rows at a time.
+
+    Row groups whose column statistics show that none of their Items can match
+    ``bbox`` or ``datetime`` are not read. The Items of the other row groups are
+    then tested one by one, with the same semantics as
+    :meth:`ItemCollection.filter <pystac.ItemCollection.filter>`.
+
+    Args:
+        href : Path to the file.
+        columns : If set, only read these columns, e.g. ``["geometry",
+            "eo:cloud_cover"]``. The ``id``, ``datetime``, ``start_datetime`` and
+            ``end_datetime`` columns are always read. Fields of the Items whose
+            columns are not read are left empty.
+        bbox : If set, only read Items whose bounding box intersects this bounding
+            box.
+        datetime : If set, only read Items whose datetime, or ``start_datetime`` to
+            ``end_datetime`` range, overlaps this datetime or interval. See
+            :data:`pystac.spatial_index.DatetimeQuery`.
+        filesystem : Optional :py:class:`pyarrow.fs.FileSystem` to read from.
+            Defaults to the local file system.
+    """
+    if not HAS_PYARROW:
+        raise ImportError("read_items requires the pyarrow package")
+
+    with pq.ParquetFile(_to_path(href), filesystem=filesystem) as parquet_file:
+        names = parquet_file.schema_arrow.names
+        if columns is not None:
+            required = [*_REQUIRED_COLUMNS, *(["bbox"] if bbox is not None else [])]
+            columns = [name for name in names if name in columns or name in required]
+        row_groups = [
+            i
+            for i in range(parquet_file.metadata.num_row_groups)
+            if _may_match(parquet_file.metadata.row_group(i), bbox, datetime)
+        ]
+        if not row_groups:
+            return
+        for batch in parquet_file.iter_batches(row_groups=row_groups, columns=columns):
+            for record in batch.to_pylist():
+                item = pystac.Item.from_dict(_from_record(record), preserve_dict=False)
+                if (bbox is None and datetime is None) or SpatialIndexEntry.from_item(
+                    item
+                ).matches(bbox, datetime):
+                    yield item
+
+
+def _to_path(href: HREF) -> str:
+    return make_posix_style(os.fspath(href))
+
+
+def _batched(
+    records: Iterable[dict[str, Any]], size: int
+) -> Iterator[list[dict[str, Any]]]:
+    batch: list[dict[str, Any]] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _with_geo_metadata(schema: pa.Schema) -> pa.Schema:
+    metadata = dict(schema.metadata or {})
+    if "geometry" in schema.names:
+        covering = {}
+        if "bbox" in schema.names:
+            covering = {
+                "covering": {
+                    "bbox": {
+                        name: ["bbox", name]
+                        for name in ("xmin", "ymin", "xmax", "ymax")
+                    }
+                }
+            }
+        metadata[b"geo"] = json.dumps(
+            {
+                "version": GEOPARQUET_VERSION,
+                "primary_column": "geometry",
+                "columns": {
+                    "geometry": {"encoding": "WKB", "geometry_types": [], **covering}
+                },
+            }
+        ).encode("utf-8")
+    metadata[b"stac-geoparquet"] = json.dumps(
+        {"version": STAC_GEOPARQUET_VERSION}
+    ).encode("utf-8")
+    return schema.with_metadata(metadata)
+
+
+def _schema_of(records: list[dict[str, Any]]) -> pa.Schema:
+    # Table.from_pylist only infers the columns from the keys of the first record
+    return pa.schema(list(pa.array(records).type))
+
+
+def _check_schema(records: list[dict[str, Any]], schema: pa.Schema) -> None:
+    try:
+        batch_schema = _schema_of(records)
+        unified = pa.unify_schemas([schema, batch_schema], promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        raise STACError(
+            f"Items do not fit the Parquet schema, pass a schema from infer_schema: {e}"
+        ) from e
+    if not unified.equals(schema):
+        raise STACError(
+            "Items have fields or types that are not in the Parquet schema, pass a "
+            "schema from infer_schema"
+        )
+
+
+def _to_record(item: Item | dict[str, Any]) -> dict[str, Any]:
+    if isinstance(item, pystac.Item):
+        d = item.to_dict(include_self_link=True, transform_hrefs=False)
+    else:
+        d = item
+    record: dict[str, Any] = {}
+    for key, value in d.items():
+        if key == "properties":
+            continue
+        elif key == "geometry":
+            record[key] = None if value is None else _to_wkb(value)
+        elif key == "bbox":
+            record[key] = dict(zip(_BBOX_FIELDS[len(value)], value))
+        elif key == "assets" and not value:
+            # Parquet cannot store a struct without fields
+            record[key] = None
+        else:
+            record[key] = value
+    for key, value in (d.get("properties") or {}).items():
+        if key in record:
+            raise STACError(
+                f"Item {d.get('id')} has a property {key!r} that conflicts with a "
+                "top-level field"
+            )
+        if key in DATETIME_PROPERTIES and isinstance(value, str):
+            value = str_to_datetime(value).astimezone(timezone.utc)
+        record[key] = value
+    return record
+
+
+def _from_record(record: dict[str, Any]) -> dict[str, Any]:
+    d: dict[str, Any] = {
+        "type": "Feature",
+        "stac_version": pystac.get_stac_version(),
+        "geometry": None,
+        "links": [],
+        "assets": {},
+    }
+    properties: dict[str, Any] = {}
+    for key, value in record.items():
+        if key == "geometry":
+            d[key] = None if value is None else _from_wkb(value)
+        elif key == "bbox":
+            if value is not None:
+                fields = _BBOX_FIELDS[6 if value.get("zmin") is not None else 4]
+                d[key] = [value[name] for name in fields]
+        elif key in ("links", "assets"):
+            if value is not None:
+                d[key] = _drop_nulls(value)
+        elif key in CORE_COLUMNS:
+            if value is not None:
+                d[key] = value
+        elif isinstance(value, Datetime):
+            properties[key] = datetime_to_str(value)
+        elif value is not None or key == "datetime":
+            properties[key] = _drop_nulls(value)
+    d["properties"] = properties
+    return d
+
+
+def _drop_nulls(value: Any) -> Any:
+    # Struct columns have a field for every key of every row, which is null in the
+    # rows that do not have that key
+    if isinstance(value, dict):
+        return {k: _drop_nulls(v) for k, v in value.items() if v is not None}
+    elif isinstance(value, list):
+        return [_drop_nulls(v) for v in value]
+    return value
+
+
+def _may_match(
+    row_group: pq.RowGroupMetaData,
+    bbox: Sequence[float] | None,
+    datetime: DatetimeQuery | None,
+) -> bool:
+    stats: dict[str, Any] = {}
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        if column.is_stats_set and column.statistics.has_min_max:
+            stats[column.path_in_schema] = column.statistics
+    if bbox is not None and all(
+        f"bbox.{name}" in stats for name in ("xmin", "ymin", "xmax", "ymax")
+    ):
+        min_x = stats["bbox.xmin"].min
+        min_y = stats["bbox.ymin"].min
+        max_x = stats["bbox.xmax"].max
+        max_y = stats["bbox.ymax"].max
+        if not any(
+            # An Item that crosses the antimeridian has xmin > xmax and matches if
+            # either of them is in range, so x alone only excludes a row group if
+            # both are out of range
+            q_min_y <= max_y
+            and q_max_y >= min_y
+            and (min_x <= q_max_x or max_x >= q_min_x)
+            for q_min_x, q_min_y, q_max_x, q_max_y in _get_rects(bbox)
+        ):
+            return False
+    if datetime is not None:
+        query_start, query_end = _get_interval(datetime)
+        starts = _bound(stats, row_group, ("start_datetime", "datetime"), "min")
+        ends = _bound(stats, row_group, ("end_datetime", "datetime"), "max")
+        if query_end is not None and starts is not None and starts > query_end:
+            return False
+        if query_start is not None and ends is not None and ends < query_start:
+            return False
+    return True
+
+
+def _bound(
+    stats: dict[str, Any],
+    row_group: pq.RowGroupMetaData,
+    names: tuple[str, str],
+    attribute: str,
+) -> Datetime | None:
+    # Returns the min or max of the given columns, or None if some Item may have
+    # neither of them, in which case its time range is open on that side
+    values = []
+    has_all = False
+    for name in names:
+        if name not in stats:
+            continue
+        values.append(_as_utc(getattr(stats[name], attribute)))
+        if stats[name].null_count == 0:
+            has_all = True
+    if not values or not has_all:
+        return None
+    return min(values) if attribute == "min" else max(values)
+
+
+def _as_utc(value: Datetime) -> Datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+_WKB_TYPES = {
+    "Point": 1,
+    "LineString": 2,
+    "Polygon": 3,
+    "MultiPoint": 4,
+    "MultiLineString": 5,
+    "MultiPolygon": 6,
+    "GeometryCollection": 7,
+}
+_WKB_NAMES = {code: name for name, code in _WKB_TYPES.items()}
+
+
+def _to_wkb(geometry: dict[str, Any]) -> bytes:
+    """Encodes a GeoJSON geometry as little-endian ISO WKB."""
+    parts: list[bytes] = []
+    _write_wkb(geometry, parts)
+    return b"".join(parts)
+
+
+def _write_wkb(geometry: dict[str, Any], parts: list[bytes]) -> None:
+    kind = geometry["type"]
+    code = _WKB_TYPES[kind]
+    if kind == "GeometryCollection":
+        geometries = geometry["geometries"]
+        parts.append(struct.pack("<BII", 1, code, len(geometries)))
+        for child in geometries:
+            _write_wkb(child, parts)
+        return
+    coordinates = geometry["coordinates"]
+    dims = _dimensions(coordinates)
+    header_code = code + 1000 if dims == 3 else code
+    if kind == "Point":
+        parts.append(struct.pack("<BI", 1, header_code))
+        if coordinates:
+            parts.append(struct.pack(f"<{dims}d", *coordinates))
+        else:
+            # An empty point is encoded as NaN coordinates
+            parts.append(struct.pack("<2d", float("nan"), float("nan")))
+    elif kind == "LineString":
+        parts.append(struct.pack("<BI", 1, header_code))
+        _write_points(coordinates, dims, parts)
+    elif kind == "Polygon":
+        parts.append(struct.pack("<BII", 1, header_code, len(coordinates)))
+        for ring in coordinates:
+            _write_points(ring, dims, parts)
+    else:
+        child_kind = kind[len("Multi") :]
+        parts.append(struct.pack("<BII", 1, header_code, len(coordinates)))
+        for child in coordinates:
+            _write_wkb({"type": child_kind, "coordinates": child}, parts)
+
+
+def _write_points(points: list[list[float]], dims: int, parts: list[bytes]) -> None:
+    parts.append(struct.pack("<I", len(points)))
+    parts.append(
+        struct.pack(f"<{len(points) * dims}d", *(c for p in points for c in p[:dims]))
+    )
+
+
+def _dimensions(coordinates: Any) -> int:
+    while coordinates and isinstance(coordinates[0], list):
+        coordinates = coordinates[0]
+    return 3 if len(coordinates) == 3 else 2
+
+
+def _from_wkb(wkb: bytes) -> dict[str, Any]:
+    """Decodes WKB, in either byte order and with ISO or EWKB-style Z flags, as a
+    GeoJSON geometry."""
+    geometry, _ = _read_wkb(memoryview(wkb), 0)
+    return geometry
+
+
+def _read_wkb(wkb: memoryview, offset: int) -> tuple[dict[str, Any], int]:
+    order = "<" if wkb[offset] == 1 else ">"
+    (code,) = struct.unpack_from(f"{order}I", wkb, offset + 1)
+    offset += 5
+    dims = 2
+    if code & 0x80000000:
+        dims = 3
+    code &= 0x0FFFFFFF
+    if code > 1000:
+        if code // 1000 in (1, 3):
+            dims = 3
+        if code // 1000 in (2, 3):
+            raise STACError("WKB geometries with M coordinates are not supported")
+        code %= 1000
+    kind = _WKB_NAMES[code]
+
+    def read_points(offset: int) -> tuple[list[list[float]], int]:
+        (n,) = struct.unpack_from(f"{order}I", wkb, offset)
+        values = struct.unpack_from(f"{order}{n * dims}d", wkb, offset + 4)
+        points = [list(values[i : i + dims]) for i in range(0, n * dims, dims)]
+        return points, offset + 4 + n * dims * 8
+
+    if kind == "Point":
+        point = list(struct.unpack_from(f"{order}{dims}d", wkb, offset))
+        offset += dims * 8
+        if all(c != c for c in point):
+            point = []
+        return {"type": kind, "coordinates": point}, offset
+    if kind == "LineString":
+        points, offset = read_points(offset)
+        return {"type": kind, "coordinates": points}, offset
+    (n,) = struct.unpack_from(f"{order}I", wkb, offset)
+    offset += 4
+    if kind == "Polygon":
+        rings = []
+        for _ in range(n):
+            ring, offset = read_points(offset)
+            rings.append(ring)
+        return {"type": kind, "coordinates": rings}, offset
+    children = []
+    for _ in range(n):
+        child, offset = _read_wkb(wkb, offset)
+        children.append(child)
+    if kind == "GeometryCollection":
+        return {"type": kind, "geometries": children}, offset
+    return {"type": kind, "coordinates": [c["coordinates"] for c in children]}, offset
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from typing import TYPE_CHECKING, Any
 
 import pystac
@@ -45,40 +45,49 @@ class STACVersionID:
 
     def __init__(self, version_string: str) -> None:
         self.version_string = version_string
-
-        # Account for RC or beta releases in version
-        version_parts = version_string.split("-")
-        self.version_core = version_parts[0]
-        if len(version_parts) == 1:
-            self.version_prerelease = None
-        else:
-            self.version_prerelease = "-".join(version_parts[1:])
+        self.version_core, self.version_prerelease = _split_version(version_string)
 
     def __str__(self) -> str:
         return self.version_string
 
     def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, STACVersionID):
-            other = STACVersionID(str(other))
-        return str(self) == str(other)
+        if isinstance(other, STACVersionID):
+            other = other.version_string
+        return self.version_string == str(other)
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
     def __lt__(self, other: object) -> bool:
-        if not isinstance(other, STACVersionID):
-            other = STACVersionID(str(other))
-        if self.version_core < other.version_core:
+        if isinstance(other, STACVersionID):
+            other_core, other_prerelease = (
+                other.version_core,
+                other.version_prerelease,
+            )
+        else:
+            other_core, other_prerelease = _split_version(str(other))
+        if self.version_core < other_core:
             return True
-        elif self.version_core > other.version_core:
+        elif self.version_core > other_core:
             return False
         else:
             return self.version_prerelease is not None and (
-                other.version_prerelease is None
-                or other.version_prerelease > self.version_prerelease
+                other_prerelease is None or other_prerelease > self.version_prerelease
             )
 
 
+@lru_cache(maxsize=256)
+def _split_version(version_string: str) -> tuple[str, str | None]:
+    """Splits a version into its core and prerelease parts, e.g. ``1.0.0-rc.1``
+    into ``("1.0.0", "rc.1")``. Cached, as objects are mostly of a few versions."""
+    # Account for RC or beta releases in version
+    version_core, separator, version_prerelease = version_string.partition("-")
+    return version_core, version_prerelease if separator else None
+
+
+_INTRODUCED_TYPE_ATTRIBUTE = STACVersionID("1.0.0-rc.1")
+
+
 class STACVersionRange:
     """Defines a range of STAC versions."""
 
@@ -229,8 +238,7 @@ def identify_stac_object_type(json_dict: dict[str, Any]) -> STACObjectType | Non
     obj_type = json_dict.get("type")
 
     # Try to identify using 'type' property for v1.0.0-rc.1 and higher
-    introduced_type_attribute = STACVersionID("1.0.0-rc.1")
-    if stac_version is not None and stac_version >= introduced_type_attribute:
+    if stac_version is not None and stac_version >= _INTRODUCED_TYPE_ATTRIBUTE:
         # Since v1.0.0-rc.1 requires a "type" field for all STAC objects, any object
         # that is missing this attribute is not a valid STAC object.
         if obj_type is None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import pystac
@@ -87,6 +88,7 @@ def _get_object_migrations() -> dict[
     }
 
 
+@lru_cache(maxsize=None)
 def _get_removed_extension_migrations() -> dict[
     str,
     tuple[
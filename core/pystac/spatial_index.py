@@ -0,0 +1,420 @@
+"""In-memory spatial index over the bounding boxes and datetimes of STAC Items."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from datetime import datetime as Datetime
+from datetime import timezone
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+import pystac
+from pystac.errors import STACError
+from pystac.utils import (
+    HREF,
+    datetime_to_str,
+    is_absolute_href,
+    make_absolute_href,
+    make_posix_style,
+    make_relative_href,
+    map_opt,
+    str_to_datetime,
+)
+
+if TYPE_CHECKING:
+    from pystac.item import Item
+
+#: A datetime to match, or an interval given as a ``(start, end)`` tuple or as an
+#: RFC 3339 interval string such as ``"2020-01-01T00:00:00Z/.."``. An end that is
+#: ``None``, ``".."`` or empty leaves the interval open on that side.
+DatetimeQuery: TypeAlias = Datetime | tuple[Datetime | None, Datetime | None] | str
+
+#: ``(min x, min y, max x, max y)``
+_Rect: TypeAlias = tuple[float, float, float, float]
+_Interval: TypeAlias = tuple[Datetime | None, Datetime | None]
+
+#: The ``type`` of a serialized :class:`SpatialIndex`
+SPATIAL_INDEX_TYPE = "pystac:spatial-index"
+
+DEFAULT_NODE_CAPACITY = 16
+
+
+class SpatialIndexEntry:
+    """An entry of a :class:`SpatialIndex`.
+
+    Args:
+        target : The indexed :class:`~pystac.Item`, or the HREF of the Item.
+        bbox : The bounding box of the Item, or ``None`` if it has no geometry.
+        start_datetime : The inclusive start of the Item's time range, or ``None``
+            if it is open-ended.
+        end_datetime : The inclusive end of the Item's time range, or ``None`` if it
+            is open-ended.
+    """
+
+    target: Item | str
+    """The indexed :class:`~pystac.Item`, or the HREF of the Item."""
+
+    bbox: list[float] | None
+    """The bounding box of the Item."""
+
+    start_datetime: Datetime | None
+    """The inclusive start of the Item's time range."""
+
+    end_datetime: Datetime | None
+    """The inclusive end of the Item's time range."""
+
+    def __init__(
+        self,
+        target: Item | str,
+        bbox: Sequence[float] | None,
+        start_datetime: Datetime | None = None,
+        end_datetime: Datetime | None = None,
+    ):
+        self.target = target
+        self.bbox = None if bbox is None else list(bbox)
+        self.start_datetime = _as_aware(start_datetime)
+        self.end_datetime = _as_aware(end_datetime)
+
+    def __repr__(self) -> str:
+        return f"<SpatialIndexEntry target={self.target} bbox={self.bbox}>"
+
+    @classmethod
+    def from_item(cls, item: Item) -> SpatialIndexEntry:
+        """Creates an entry for an Item from its ``bbox``, and from its
+        ``start_datetime`` and ``end_datetime`` or else its ``datetime``."""
+        start = item.common_metadata.start_datetime
+        end = item.common_metadata.end_datetime
+        return cls(
+            item,
+            item.bbox,
+            item.datetime if start is None else start,
+            item.datetime if end is None else end,
+        )
+
+    def matches(
+        self,
+        bbox: Sequence[float] | None = None,
+        datetime: DatetimeQuery | None = None,
+    ) -> bool:
+        """Tests this entry against a query, without an index. See
+        :meth:`SpatialIndex.search`."""
+        if bbox is not None:
+            if self.bbox is None:
+                return False
+            rects = _get_rects(self.bbox)
+            if not any(_intersects(a, b) for a in rects for b in _get_rects(bbox)):
+                return False
+        if datetime is not None:
+            start, end = _get_interval(datetime)
+            return _overlaps(self.start_datetime, self.end_datetime, start, end)
+        return True
+
+    def to_dict(self, base_href: str | None = None) -> dict[str, Any]:
+        """Serializes this entry, whose Item must have a self HREF.
+
+        Args:
+            base_href : If set, the Item HREF is made relative to this HREF.
+        """
+        if isinstance(self.target, str):
+            href: str | None = self.target
+        else:
+            href = self.target.get_self_href()
+        if href is None:
+            raise STACError(
+                f"Cannot serialize the spatial index entry of {self.target}, "
+                "which has no self HREF."
+            )
+        if base_href is not None:
+            href = make_relative_href(href, base_href)
+        return {
+            "href": href,
+            "bbox": self.bbox,
+            "start_datetime": map_opt(datetime_to_str, self.start_datetime),
+            "end_datetime": map_opt(datetime_to_str, self.end_datetime),
+        }
+
+    @classmethod
+    def from_dict(
+        cls, d: dict[str, Any], base_href: str | None = None
+    ) -> SpatialIndexEntry:
+        """Deserializes an entry, whose target will be the Item HREF.
+
+        Args:
+            base_href : If set, a relative Item HREF is resolved against this HREF.
+        """
+        href = d["href"]
+        if base_href is not None:
+            href = make_absolute_href(href, base_href)
+        return cls(
+            href,
+            d.get("bbox"),
+            map_opt(str_to_datetime, d.get("start_datetime")),
+            map_opt(str_to_datetime, d.get("end_datetime")),
+        )
+
+
+class _Node:
+    __slots__ = ("rect", "children", "is_leaf")
+
+    def __init__(self, rect: _Rect, children: list[Any], is_leaf: bool):
+        self.rect = rect
+        #: ``(rect, entry index)`` tuples for a leaf node, else child nodes
+        self.children = children
+        self.is_leaf = is_leaf
+
+
+class SpatialIndex:
+    """An immutable, in-memory R-tree over the bounding boxes of STAC Items that
+    answers bounding box and datetime queries without testing every Item.
+
+    The tree is bulk-loaded with the Sort-Tile-Recursive (STR) algorithm. Bounding
+    boxes that cross the antimeridian (``min x > max x``) are supported, and only the
+    horizontal extent of 3D bounding boxes is indexed. Items without a bounding box
+    only match queries without a ``bbox``.
+
+    An index can be saved next to a catalog with :meth:`save` and read again with
+    :meth:`from_file`, without having to read any Items; the targets of a read index
+    are the Item HREFs.
+
+    Args:
+        entries : The entries to index.
+        node_capacity : The maximum number of children of a node in the tree.
+    """
+
+    entries: list[SpatialIndexEntry]
+    """The indexed entries, in the order in which they were given."""
+
+    node_capacity: int
+    """The maximum number of children of a node in the tree."""
+
+    _root: _Node | None
+
+    def __init__(
+        self,
+        entries: Iterable[SpatialIndexEntry],
+        node_capacity: int = DEFAULT_NODE_CAPACITY,
+    ):
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+        self.entries = list(entries)
+        self.node_capacity = node_capacity
+
+        leaves = [
+            (rect, i)
+            for i, entry in enumerate(self.entries)
+            if entry.bbox is not None
+            for rect in _get_rects(entry.bbox)
+        ]
+        self._root = _build_tree(leaves, node_capacity) if leaves else None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"<SpatialIndex entries={len(self.entries)}>"
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[Item], node_capacity: int = DEFAULT_NODE_CAPACITY
+    ) -> SpatialIndex:
+        """Creates an index over the given Items.
+
+        Args:
+            items : The Items to index.
+            node_capacity : The maximum number of children of a node in the tree.
+        """
+        return cls(map(SpatialIndexEntry.from_item, items), node_capacity)
+
+    def search(
+        self,
+        bbox: Sequence[float] | None = None,
+        datetime: DatetimeQuery | None = None,
+    ) -> list[Item | str]:
+        """Returns the targets of the entries that match the given query, in the
+        order of :attr:`entries`.
+
+        Args:
+            bbox : If set, only match entries whose bounding box intersects this
+                bounding box, including on its boundary.
+            datetime : If set, only match entries whose time range overlaps this
+                datetime or interval. See :data:`DatetimeQuery`.
+
+        Returns:
+            list[Item | str]: The matching Items or Item HREFs.
+        """
+        if bbox is None:
+            indices: Iterable[int] = range(len(self.entries))
+        else:
+            indices = sorted(self._intersecting(bbox))
+        if datetime is not None:
+            start, end = _get_interval(datetime)
+            indices = [
+                i
+                for i in indices
+                if _overlaps(
+                    self.entries[i].start_datetime,
+                    self.entries[i].end_datetime,
+                    start,
+                    end,
+                )
+            ]
+        return [self.entries[i].target for i in indices]
+
+    def _intersecting(self, bbox: Sequence[float]) -> set[int]:
+        found: set[int] = set()
+        if self._root is None:
+            return found
+        for rect in _get_rects(bbox):
+            stack = [self._root]
+            while stack:
+                node = stack.pop()
+                if not _intersects(node.rect, rect):
+                    continue
+                if node.is_leaf:
+                    found.update(i for r, i in node.children if _intersects(r, rect))
+                else:
+                    stack.extend(node.children)
+        return found
+
+    def to_dict(self, base_href: str | None = None) -> dict[str, Any]:
+        """Serializes this index. Every Item must have a self HREF.
+
+        Args:
+            base_href : If set, Item HREFs are made relative to this HREF.
+        """
+        return {
+            "type": SPATIAL_INDEX_TYPE,
+            "node_capacity": self.node_capacity,
+            "entries": [entry.to_dict(base_href) for entry in self.entries],
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any], base_href: str | None = None) -> SpatialIndex:
+        """Deserializes an index, whose targets will be Item HREFs.
+
+        Args:
+            base_href : If set, relative Item HREFs are resolved against this HREF.
+        """
+        if d.get("type") != SPATIAL_INDEX_TYPE:
+            raise STACError(f"Not a serialized spatial index: type={d.get('type')}")
+        return cls(
+            (SpatialIndexEntry.from_dict(e, base_href) for e in d["entries"]),
+            d.get("node_capacity", DEFAULT_NODE_CAPACITY),
+        )
+
+    def save(self, dest_href: HREF, stac_io: pystac.StacIO | None = None) -> None:
+        """Saves this index to a JSON file, with Item HREFs relative to the file.
+
+        Args:
+            dest_href : Location to which the file will be saved.
+            stac_io : Optional :class:`~pystac.StacIO` instance to use. If not
+                provided, will use the default instance.
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+        dest_href = make_absolute_href(make_posix_style(dest_href))
+        stac_io.save_json(dest_href, self.to_dict(base_href=dest_href))
+
+    @classmethod
+    def from_file(
+        cls, href: HREF, stac_io: pystac.StacIO | None = None
+    ) -> SpatialIndex:
+        """Reads an index saved with :meth:`save`. The targets of its entries are
+        absolute Item HREFs.
+
+        Args:
+            href : Path to the file.
+            stac_io : Optional :class:`~pystac.StacIO` instance to use. If not
+                provided, will use the default instance.
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+        href = make_posix_style(href)
+        if not is_absolute_href(href):
+            href = make_absolute_href(href)
+        return cls.from_dict(stac_io.read_json(href), base_href=href)
+
+
+def _build_tree(leaves: list[tuple[_Rect, int]], capacity: int) -> _Node:
+    nodes = _pack(leaves, capacity, is_leaf=True)
+    while len(nodes) > 1:
+        nodes = _pack([(node.rect, node) for node in nodes], capacity, is_leaf=False)
+    return nodes[0]
+
+
+def _pack(
+    children: list[tuple[_Rect, Any]], capacity: int, is_leaf: bool
+) -> list[_Node]:
+    # Sort-Tile-Recursive: sort by x into vertical slices, then by y within each
+    # slice, and group runs of ``capacity`` children into nodes
+    node_count = math.ceil(len(children) / capacity)
+    slice_size = math.ceil(math.sqrt(node_count)) * capacity
+    children = sorted(children, key=lambda child: child[0][0] + child[0][2])
+    nodes = []
+    for i in range(0, len(children), slice_size):
+        vertical_slice = sorted(
+            children[i : i + slice_size], key=lambda child: child[0][1] + child[0][3]
+        )
+        for j in range(0, len(vertical_slice), capacity):
+            group = vertical_slice[j : j + capacity]
+            rect = (
+                min(r[0] for r, _ in group),
+                min(r[1] for r, _ in group),
+                max(r[2] for r, _ in group),
+                max(r[3] for r, _ in group),
+            )
+            nodes.append(
+                _Node(rect, group if is_leaf else [c for _, c in group], is_leaf)
+            )
+    return nodes
+
+
+def _get_rects(bbox: Sequence[float]) -> list[_Rect]:
+    if len(bbox) == 6:
+        min_x, min_y, max_x, max_y = bbox[0], bbox[1], bbox[3], bbox[4]
+    elif len(bbox) == 4:
+        min_x, min_y, max_x, max_y = bbox
+    else:
+        raise ValueError(f"Invalid bbox, expected 4 or 6 values: {bbox}")
+    if min_x > max_x:
+        # Crosses the antimeridian
+        return [(min_x, min_y, 180.0, max_y), (-180.0, min_y, max_x, max_y)]
+    return [(min_x, min_y, max_x, max_y)]
+
+
+def _intersects(a: _Rect, b: _Rect) -> bool:
+    return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+
+def _as_aware(dt: Datetime | None) -> Datetime | None:
+    # Naive datetimes are taken to be in UTC, so that they can be compared
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _get_interval(datetime: DatetimeQuery) -> _Interval:
+    if isinstance(datetime, Datetime):
+        return _as_aware(datetime), _as_aware(datetime)
+    if isinstance(datetime, str):
+        if "/" not in datetime:
+            dt = str_to_datetime(datetime)
+            return _as_aware(dt), _as_aware(dt)
+        start_str, end_str = datetime.split("/", 1)
+        return (
+            None if start_str in ("", "..") else _as_aware(str_to_datetime(start_str)),
+            None if end_str in ("", "..") else _as_aware(str_to_datetime(end_str)),
+        )
+    start, end = datetime
+    return _as_aware(start), _as_aware(end)
+
+
+def _overlaps(
+    start: Datetime | None,
+    end: Datetime | None,
+    query_start: Datetime | None,
+    query_end: Datetime | None,
+) -> bool:
+    return (end is None or query_start is None or end >= query_start) and (
+        start is None or query_end is None or start <= query_end
+    )
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import functools
+import io
 import json
 import os
+import threading
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from copy import copy
+from typing import IO, TYPE_CHECKING, Any, cast
 
 import pystac
+from pystac.compression import (
+    compress,
+    decompress,
+    get_compression_from_href,
+    open_compressed,
+    open_decompressed,
+)
 from pystac.serialization import (
     identify_stac_object,
     identify_stac_object_type,
     merge_common_properties,
     migrate_to_latest,
 )
-from pystac.utils import HREF, _is_url, safe_urlparse
+from pystac.utils import HREF, StringEnum, _is_url, safe_urlparse
 
 # Use orjson if available
 try:
@@ -30,15 +42,52 @@ else:
     HAS_URLLIB3 = True
 
 if TYPE_CHECKING:
+    from urllib3 import PoolManager
+
     from pystac.catalog import Catalog
     from pystac.stac_object import STACObject
 
 
+class JSONProfile(StringEnum):
+    """How :meth:`StacIO.json_dumps` formats the JSON of the objects it writes."""
+
+    PRETTY = "pretty"
+    """Indented by two spaces. This is the default."""
+
+    COMPACT = "compact"
+    """Without any whitespace. Files are smaller and faster to write, and are meant
+    to be read by machines."""
+
+    SORTED = "sorted"
+    """Indented by two spaces, with the keys of every object sorted, so that files
+    written from the same data are byte-for-byte identical."""
+
+
 class StacIO(ABC):
     _default_io: Callable[[], StacIO] | None = None
 
-    def __init__(self, headers: dict[str, str] | None = None):
+    json_profile: JSONProfile = JSONProfile.PRETTY
+    """The :class:`JSONProfile` used by :meth:`json_dumps`."""
+
+    def __init__(
+        self,
+        headers: dict[str, str] | None = None,
+        json_profile: JSONProfile | str = JSONProfile.PRETTY,
+    ):
         self.headers = headers or {}
+        self.json_profile = JSONProfile(json_profile)
+
+    def with_json_profile(self, json_profile: JSONProfile | str) -> StacIO:
+        """Returns a shallow copy of this instance that uses the given
+        :class:`JSONProfile`. The copy shares everything else with this instance,
+        such as its headers and connection pool.
+
+        Args:
+            json_profile : The JSON profile of the copy.
+        """
+        stac_io = copy(self)
+        stac_io.json_profile = JSONProfile(json_profile)
+        return stac_io
 
     @abstractmethod
     def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
@@ -85,7 +134,74 @@ class StacIO(ABC):
         """
         raise NotImplementedError
 
-    def json_loads(self, txt: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+    def read_bytes(self, source: HREF, *args: Any, **kwargs: Any) -> bytes:
+        """Read the raw, UTF-8 encoded contents of the given URI.
+
+        :meth:`read_json` uses this method instead of :meth:`read_text` when it is
+        implemented by a class that does not also override how text or JSON is read,
+        so that the contents can be parsed without first being decoded to a string.
+
+        The default implementation encodes the result of :meth:`read_text`.
+        Implementations should override this method if they can read bytes directly.
+
+        Args:
+            source : The source to read from.
+            *args : Additional positional arguments to be passed to
+                :meth:`StacIO.read_text`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`StacIO.read_text`.
+
+        Returns:
+            bytes: The contents of the file at the location specified by the uri.
+        """
+        return self.read_text(source, *args, **kwargs).encode("utf-8")
+
+    def read_text_lines(self, source: HREF, *args: Any, **kwargs: Any) -> Iterator[str]:
+        """Read the lines of text from the given URI, e.g. of a newline-delimited
+        JSON file.
+
+        The default implementation reads the whole file with :meth:`read_text` and
+        splits it into lines. Implementations may override this method to yield
+        lines as they are read, so that the whole file is never held in memory.
+
+        Args:
+            source : The source to read from.
+            *args : Additional positional arguments to be passed to
+                :meth:`StacIO.read_text`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`StacIO.read_text`.
+
+        Returns:
+            Iterator[str]: The lines of the file. Line endings may or may not be
+            included.
+        """
+        return iter(self.read_text(source, *args, **kwargs).splitlines())
+
+    def write_text_lines(
+        self,
+        dest: HREF,
+        lines: Iterable[str],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Write the given lines of text to a file at the given URI.
+
+        The default implementation joins the lines and writes them with
+        :meth:`write_text`. Implementations may override this method to write each
+        line as it is produced by ``lines``, so that the whole file is never held in
+        memory.
+
+        Args:
+            dest : The destination to write to.
+            lines : The lines to write, each ending with a newline.
+            *args : Additional positional arguments to be passed to
+                :meth:`StacIO.write_text`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`StacIO.write_text`.
+        """
+        self.write_text(dest, "".join(lines), *args, **kwargs)
+
+    def json_loads(self, txt: str | bytes, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """Method used internally by :class:`StacIO` instances to deserialize a
         dictionary from a JSON string.
 
@@ -96,7 +212,9 @@ class StacIO(ABC):
 
         Args:
 
-            txt : The JSON string to deserialize to a dictionary.
+            txt : The JSON string, or UTF-8 encoded bytes, to deserialize to a
+                dictionary. Bytes are only passed by :meth:`read_json` if this
+                method is not overridden (see :meth:`read_bytes`).
         """
         result: dict[str, Any]
         if orjson is not None:
@@ -114,16 +232,45 @@ class StacIO(ABC):
         not used by the default implementation, but may be used by subclass
         implementations.
 
+        The output is formatted according to :attr:`json_profile`.
+
         Args:
 
             json_dict : The dictionary to serialize
         """
+        json_profile = self.json_profile
         if orjson is not None:
-            return orjson.dumps(json_dict, option=orjson.OPT_INDENT_2, **kwargs).decode(
-                "utf-8"
+            if json_profile == JSONProfile.COMPACT:
+                option = 0
+            elif json_profile == JSONProfile.SORTED:
+                option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            else:
+                option = orjson.OPT_INDENT_2
+            return orjson.dumps(json_dict, option=option, **kwargs).decode("utf-8")
+        else:
+            if json_profile == JSONProfile.COMPACT:
+                return json.dumps(json_dict, *args, separators=(",", ":"), **kwargs)
+            return json.dumps(
+                json_dict,
+                *args,
+                indent=2,
+                sort_keys=json_profile == JSONProfile.SORTED,
+                **kwargs,
             )
+
+    def json_dumps_line(self, json_dict: dict[str, Any]) -> str:
+        """Method used internally by :class:`StacIO` instances to serialize a
+        dictionary to a single line of JSON, without a trailing newline, for
+        newline-delimited JSON files.
+
+        Args:
+
+            json_dict : The dictionary to serialize
+        """
+        if orjson is not None:
+            return orjson.dumps(json_dict).decode("utf-8")
         else:
-            return json.dumps(json_dict, *args, indent=2, **kwargs)
+            return json.dumps(json_dict, separators=(",", ":"))
 
     def stac_object_from_dict(
         self,
@@ -159,25 +306,27 @@ class StacIO(ABC):
             )
 
         info = identify_stac_object(d)
+        # The migrated dict is a copy, which from_dict neither migrates nor copies
+        # again
         d = migrate_to_latest(d, info)
 
         if info.object_type == pystac.STACObjectType.CATALOG:
             catalog = pystac.Catalog.from_dict(
-                d, href=href_str, root=root, migrate=True, preserve_dict=preserve_dict
+                d, href=href_str, root=root, migrate=False, preserve_dict=False
             )
             catalog._stac_io = self
             return catalog
 
         if info.object_type == pystac.STACObjectType.COLLECTION:
             collection = pystac.Collection.from_dict(
-                d, href=href_str, root=root, migrate=True, preserve_dict=preserve_dict
+                d, href=href_str, root=root, migrate=False, preserve_dict=False
             )
             collection._stac_io = self
             return collection
 
         if info.object_type == pystac.STACObjectType.ITEM:
             item = pystac.Item.from_dict(
-                d, href=href_str, root=root, migrate=True, preserve_dict=preserve_dict
+                d, href=href_str, root=root, migrate=False, preserve_dict=False
             )
             item._stac_io = self
             return item
@@ -190,17 +339,24 @@ class StacIO(ABC):
         See :func:`StacIO.read_text <pystac.StacIO.read_text>` for usage of
         str vs Link as a parameter.
 
+        The contents are read with :meth:`StacIO.read_bytes` if it is implemented
+        more specifically than :meth:`StacIO.read_text` and
+        :meth:`StacIO.json_loads`, which avoids decoding them to a string before
+        parsing. Otherwise they are read with :meth:`StacIO.read_text`.
+
         Args:
             source : The source from which to read.
             *args : Additional positional arguments to be passed to
-                :meth:`StacIO.read_text`.
+                :meth:`StacIO.read_bytes` or :meth:`StacIO.read_text`.
             **kwargs : Additional keyword arguments to be passed to
-                :meth:`StacIO.read_text`.
+                :meth:`StacIO.read_bytes` or :meth:`StacIO.read_text`.
 
         Returns:
             dict: A dict representation of the JSON contained in the file at the
             given source.
         """
+        if _reads_bytes(type(self)):
+            return self.json_loads(self.read_bytes(source, *args, **kwargs))
         txt = self.read_text(source, *args, **kwargs)
         return self.json_loads(txt)
 
@@ -271,6 +427,74 @@ class StacIO(ABC):
         return cls._default_io()
 
 
+_READ_BYTES_METHODS = ("read_bytes", "read_bytes_from_href")
+_READ_TEXT_METHODS = ("read_text", "read_text_from_href", "json_loads")
+
+
+@functools.cache
+def _reads_bytes(cls: type[StacIO]) -> bool:
+    """Whether :meth:`StacIO.read_json` should read instances of ``cls`` as bytes.
+
+    This is the case if the most derived class that defines any method used to read
+    JSON defines a method that reads bytes. Subclasses that only customize reading
+    text (e.g. by overriding :meth:`DefaultStacIO.read_text_from_href`) or parsing
+    strings keep being read as text.
+    """
+    for klass in cls.__mro__:
+        attributes = vars(klass)
+        if any(name in attributes for name in _READ_BYTES_METHODS):
+            return True
+        if any(name in attributes for name in _READ_TEXT_METHODS):
+            return False
+    return False
+
+
+_WRITE_METHODS = ("save_json", "write_text", "write_text_to_href")
+
+
+@functools.cache
+def _writes_by_default(cls: type[DefaultStacIO]) -> bool:
+    """Whether instances of ``cls`` write JSON as :class:`DefaultStacIO` does, i.e.
+    whether no subclass overrides a method used to write JSON, so that files can be
+    written with :meth:`DefaultStacIO._save_json_to_path`."""
+    for klass in cls.__mro__:
+        if klass is DefaultStacIO:
+            return True
+        if any(name in vars(klass) for name in _WRITE_METHODS):
+            return False
+    return False
+
+
+_READ_TEXT_LINES_METHODS = ("read_text_lines", "read_text_lines_from_href")
+_WRITE_TEXT_LINES_METHODS = ("write_text_lines", "write_text_lines_to_href")
+
+
+@functools.cache
+def _streams_text_lines(
+    cls: type[DefaultStacIO],
+    line_methods: tuple[str, ...],
+    text_methods: tuple[str, ...],
+) -> bool:
+    """Whether instances of ``cls`` read or write lines of text as
+    :class:`DefaultStacIO` does, by opening the file or URL themselves.
+
+    This is not the case if a subclass overrides a method in ``text_methods`` (e.g.
+    :meth:`DefaultStacIO.read_text_from_href`, to read from another kind of
+    storage) without also overriding a method in ``line_methods``. Such instances
+    fall back to the :class:`StacIO` implementation, which goes through the text
+    methods.
+    """
+    for klass in cls.__mro__:
+        if klass is DefaultStacIO:
+            return True
+        attributes = vars(klass)
+        if any(name in attributes for name in line_methods):
+            return True
+        if any(name in attributes for name in text_methods):
+            return False
+    return True
+
+
 class DefaultStacIO(StacIO):
     def read_text(self, source: HREF, *_: Any, **__: Any) -> str:
         """A concrete implementation of :meth:`StacIO.read_text
@@ -288,52 +512,163 @@ class DefaultStacIO(StacIO):
         if available) to open the file and read the contents; otherwise, :func:`open`
         will be used to open a local file.
 
+        Files compressed with one of the formats of
+        :class:`~pystac.compression.Compression` are decompressed, regardless of
+        the extension of ``href``.
+
         Args:
 
             href : The URI of the file to open.
         """
         href_contents: str
         if _is_url(href):
-            import logging
-            from urllib.error import HTTPError
-            from urllib.request import Request, urlopen
-
-            logger = logging.getLogger(__name__)
-            try:
-                logger.debug(f"GET {href} Headers: {self.headers}")
-                if HAS_URLLIB3:
-                    http = urllib3.PoolManager()
-                    with http.request(
-                        "GET",
-                        href,
-                        headers={
-                            "User-Agent": f"pystac/{pystac.__version__}",
-                            **self.headers,
-                        },
-                        preload_content=False,  # type: ignore
-                    ) as f:
-                        if f.status >= 400:
-                            raise HTTPError(href, f.status, f.reason, f.headers, None)
-                        href_contents = f.read().decode("utf-8")
-                else:
-                    req = Request(
-                        href,
-                        headers={
-                            "User-Agent": f"pystac/{pystac.__version__}",
-                            **self.headers,
-                        },
-                    )
-                    with urlopen(req) as f:
-                        href_contents = f.read().decode("utf-8")
-
-            except HTTPError as e:
-                raise Exception(f"Could not read uri {href}") from e
+            href_contents = self.read_bytes_from_href(href).decode("utf-8")
         else:
             href = safe_urlparse(href).path
-            with open(href, encoding="utf-8") as f:
-                href_contents = f.read()
+            with (
+                open(href, "rb") as f,
+                io.TextIOWrapper(open_decompressed(f), encoding="utf-8") as text,
+            ):
+                href_contents = text.read()
         return href_contents
 
+    def read_bytes(self, source: HREF, *_: Any, **__: Any) -> bytes:
+        """A concrete implementation of :meth:`StacIO.read_bytes
+        <pystac.StacIO.read_bytes>`. Converts the ``source`` argument to a string (if it
+        is not already) and delegates to :meth:`DefaultStacIO.read_bytes_from_href`
+        for opening and reading the file."""
+        href = str(os.fspath(source))
+        return self.read_bytes_from_href(href)
+
+    def read_bytes_from_href(self, href: str) -> bytes:
+        """Reads the contents of a file as bytes, without decoding them.
+
+        Uses the same means as :meth:`read_text_from_href` to open the file, and
+        likewise decompresses compressed files. Local files are read unbuffered,
+        with a single read sized to the file.
+
+        Args:
+
+            href : The URI of the file to open.
+        """
+        if _is_url(href):
+            with self._open_url(
+                href, self._get_pool_manager(), preload_content=False
+            ) as f:
+                contents = f.read()
+        else:
+            href = safe_urlparse(href).path
+            with open(href, "rb", buffering=0) as f:
+                contents = f.read()
+        return decompress(contents)
+
+    def read_text_lines(self, source: HREF, *args: Any, **kwargs: Any) -> Iterator[str]:
+        """A concrete implementation of :meth:`StacIO.read_text_lines
+        <pystac.StacIO.read_text_lines>`. Converts the ``source`` argument to a string
+        (if it is not already) and delegates to
+        :meth:`DefaultStacIO.read_text_lines_from_href` for opening and reading the
+        file.
+
+        If a subclass overrides :meth:`read_text` or :meth:`read_text_from_href`, but
+        not how lines are read, the lines are read with the overridden method
+        instead, as by :meth:`StacIO.read_text_lines`."""
+        if not _streams_text_lines(
+            type(self), _READ_TEXT_LINES_METHODS, ("read_text", "read_text_from_href")
+        ):
+            return super().read_text_lines(source, *args, **kwargs)
+        href = str(os.fspath(source))
+        return self.read_text_lines_from_href(href)
+
+    def read_text_lines_from_href(self, href: str) -> Iterator[str]:
+        """Reads the lines of a UTF-8 file as they are iterated over, without
+        reading the whole file first.
+
+        Uses the same means as :meth:`read_text_from_href` to open the file.
+        Compressed files are decompressed as they are read. The file stays open until
+        the iterator is exhausted or closed.
+
+        Args:
+
+            href : The URI of the file to open.
+        """
+        f: AbstractContextManager[IO[bytes]]
+        if _is_url(href):
+            f = self._open_url(href, self._get_pool_manager(), preload_content=False)
+        else:
+            f = open(safe_urlparse(href).path, "rb")
+        with (
+            f as raw,
+            io.TextIOWrapper(open_decompressed(raw), encoding="utf-8") as text,
+        ):
+            yield from text
+
+    def _get_pool_manager(self) -> PoolManager | None:
+        """Returns the :py:class:`urllib3.PoolManager` used for a single read, or
+        ``None`` if urllib3 is not installed.
+
+        A new pool manager is created for every request; see
+        :class:`PooledStacIO` for an implementation that reuses connections.
+        """
+        return urllib3.PoolManager() if HAS_URLLIB3 else None
+
+    @contextmanager
+    def _open_url(
+        self,
+        href: str,
+        pool_manager: PoolManager | None,
+        preload_content: bool,
+        **request_kwargs: Any,
+    ) -> Iterator[IO[bytes]]:
+        """Sends a GET request for ``href``, and yields a file of the body of the
+        response, which is neither decoded nor decompressed.
+
+        Args:
+            href : The URL to read.
+            pool_manager : The :py:class:`urllib3.PoolManager` to send the request
+                with. If ``None``, :func:`urllib.request.urlopen` is used.
+            preload_content : Whether the whole body is read before the file is
+                yielded, e.g. so that urllib3 retries failures while reading it.
+                Otherwise, the body is streamed as the file is read.
+            request_kwargs : Additional keyword arguments of
+                :py:meth:`urllib3.PoolManager.request`, e.g. ``retries``.
+
+        Raises:
+            Exception: If the server responds with an HTTP error.
+        """
+        import logging
+        from urllib.error import HTTPError
+        from urllib.request import Request, urlopen
+
+        logger = logging.getLogger(__name__)
+        headers = {"User-Agent": f"pystac/{pystac.__version__}", **self.headers}
+        try:
+            logger.debug(f"GET {href} Headers: {self.headers}")
+            if pool_manager is not None:
+                with pool_manager.request(  # type: ignore[no-untyped-call]
+                    "GET",
+                    href,
+                    headers=headers,
+                    preload_content=preload_content,
+                    **request_kwargs,
+                ) as response:
+                    if response.status >= 400:
+                        raise HTTPError(
+                            href,
+                            response.status,
+                            response.reason,
+                            response.headers,
+                            None,
+                        )
+                    if preload_content:
+                        yield io.BytesIO(response.data)
+                    else:
+                        yield cast(IO[bytes], response)
+            else:
+                with urlopen(Request(href, headers=headers)) as response:
+                    yield response
+        except HTTPError as e:
+            raise Exception(f"Could not read uri {href}") from e
+
     def write_text(self, dest: HREF, txt: str, *_: Any, **__: Any) -> None:
         """A concrete implementation of :meth:`StacIO.write_text
         <pystac.StacIO.write_text>`. Converts the ``dest`` argument to a string (if it
@@ -347,7 +682,9 @@ class DefaultStacIO(StacIO):
         """Writes text to file using UTF-8 encoding.
 
         This implementation uses :func:`open` and therefore can only write to the local
-        file system.
+        file system. If ``href`` has the extension of a
+        :class:`~pystac.compression.Compression` format (e.g. ``.json.gz``), the
+        file is compressed with that format.
 
         Args:
 
@@ -359,9 +696,245 @@ class DefaultStacIO(StacIO):
         href = safe_urlparse(href).path
         dirname = os.path.dirname(href)
         if dirname != "" and not os.path.isdir(dirname):
-            os.makedirs(dirname)
-        with open(href, "w", encoding="utf-8") as f:
-            f.write(txt)
+            os.makedirs(dirname, exist_ok=True)
+        self._write_text_to_path(href, txt)
+
+    def _write_text_to_path(self, path: str, txt: str) -> None:
+        """Writes text to a local path whose directory already exists, compressing
+        it according to the extension of ``path``."""
+        compression = get_compression_from_href(path)
+        if compression is None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(txt)
+        else:
+            with open(path, "wb") as f:
+                f.write(compress(txt.encode("utf-8"), compression))
+
+    def _save_json_to_path(self, path: str, json_dict: dict[str, Any]) -> None:
+        """Like :meth:`StacIO.save_json`, for a local path whose directory already
+        exists, e.g. when :meth:`Catalog.save <pystac.Catalog.save>` has created
+        every directory up front."""
+        self._write_text_to_path(path, self.json_dumps(json_dict))
+
+    def write_text_lines(
+        self, dest: HREF, lines: Iterable[str], *args: Any, **kwargs: Any
+    ) -> None:
+        """A concrete implementation of :meth:`StacIO.write_text_lines
+        <pystac.StacIO.write_text_lines>`. Converts the ``dest`` argument to a string
+        (if it is not already) and delegates to
+        :meth:`DefaultStacIO.write_text_lines_to_href` for opening and writing the
+        file.
+
+        If a subclass overrides :meth:`write_text` or :meth:`write_text_to_href`,
+        but not how lines are written, the lines are joined and written with the
+        overridden method instead, as by :meth:`StacIO.write_text_lines`."""
+        if not _streams_text_lines(
+            type(self), _WRITE_TEXT_LINES_METHODS, ("write_text", "write_text_to_href")
+        ):
+            return super().write_text_lines(dest, lines, *args, **kwargs)
+        href = str(os.fspath(dest))
+        return self.write_text_lines_to_href(href, lines)
+
+    def write_text_lines_to_href(self, href: str, lines: Iterable[str]) -> None:
+        """Writes lines of text to file using UTF-8 encoding, as they are produced
+        by ``lines``.
+
+        This implementation uses :func:`open` and therefore can only write to the local
+        file system. Like :meth:`write_text_to_href`, files are compressed according
+        to the extension of ``href``.
+
+        Args:
+
+            href : The path to which the file will be written.
+            lines : The lines to write, each ending with a newline.
+        """
+        if _is_url(href):
+            raise NotImplementedError("DefaultStacIO cannot write to urls")
+        href = safe_urlparse(href).path
+        dirname = os.path.dirname(href)
+        if dirname != "" and not os.path.isdir(dirname):
+            os.makedirs(dirname, exist_ok=True)
+        compression = get_compression_from_href(href)
+        if compression is None:
+            with open(href, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+        else:
+            with (
+                open(href, "wb") as dest,
+                io.TextIOWrapper(
+                    open_compressed(dest, compression), encoding="utf-8"
+                ) as f,
+            ):
+                f.writelines(lines)
+
+
+class AsyncStacIO(ABC):
+    """Asynchronous counterpart of :class:`StacIO`, used by the ``async`` methods of
+    PySTAC such as :meth:`Catalog.awalk <pystac.Catalog.awalk>` and
+    :meth:`Catalog.asave <pystac.Catalog.asave>`.
+
+    Subclasses implement :meth:`read_text` and :meth:`write_text` as coroutines, e.g.
+    using an asynchronous HTTP client. Conversion between JSON strings, dictionaries
+    and STAC objects is delegated to a synchronous :class:`StacIO` instance, which is
+    also the instance attached to any object read, so that later synchronous operations
+    on those objects keep working.
+
+    Args:
+        stac_io : Optional :class:`StacIO` instance used to (de)serialize JSON. If not
+            provided, will use :meth:`StacIO.default` to create an instance.
+    """
+
+    def __init__(self, stac_io: StacIO | None = None):
+        self.stac_io = stac_io or StacIO.default()
+        """The :class:`StacIO` instance used to (de)serialize JSON."""
+
+    @abstractmethod
+    async def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+        """Read text from the given URI.
+
+        See :meth:`StacIO.read_text` for usage of str vs Link as a parameter.
+
+        Args:
+            source : The source to read from.
+            *args : Arbitrary positional arguments that may be utilized by the concrete
+                implementation.
+            **kwargs : Arbitrary keyword arguments that may be utilized by the concrete
+                implementation.
+
+        Returns:
+            str: The text contained in the file at the location specified by the uri.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def write_text(
+        self,
+        dest: HREF,
+        txt: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Write the given text to a file at the given URI.
+
+        See :meth:`StacIO.write_text` for usage of str vs Link as a parameter.
+
+        Args:
+            dest : The destination to write to.
+            txt : The text to write.
+        """
+        raise NotImplementedError
+
+    def stac_object_from_dict(
+        self,
+        d: dict[str, Any],
+        href: HREF | None = None,
+        root: Catalog | None = None,
+        preserve_dict: bool = True,
+    ) -> STACObject:
+        """Deserializes a :class:`~pystac.STACObject` subclass instance from a
+        dictionary using :meth:`StacIO.stac_object_from_dict` of :attr:`stac_io`.
+        """
+        return self.stac_io.stac_object_from_dict(
+            d, href=href, root=root, preserve_dict=preserve_dict
+        )
+
+    async def read_json(
+        self, source: HREF, *args: Any, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Read a dict from the given source.
+
+        Args:
+            source : The source from which to read.
+            *args : Additional positional arguments to be passed to
+                :meth:`AsyncStacIO.read_text`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`AsyncStacIO.read_text`.
+
+        Returns:
+            dict: A dict representation of the JSON contained in the file at the
+            given source.
+        """
+        txt = await self.read_text(source, *args, **kwargs)
+        return self.stac_io.json_loads(txt)
+
+    async def read_stac_object(
+        self,
+        source: HREF,
+        root: Catalog | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> STACObject:
+        """Read a STACObject from a JSON file at the given source.
+
+        Args:
+            source : The source from which to read.
+            root : Optional root of the catalog for this object.
+                If provided, the root's resolved object cache can be used to search for
+                previously resolved instances of the STAC object.
+            *args : Additional positional arguments to be passed to
+                :meth:`AsyncStacIO.read_json`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`AsyncStacIO.read_json`.
+
+        Returns:
+            STACObject: The deserialized STACObject from the serialized JSON
+            contained in the file at the given uri.
+        """
+        d = await self.read_json(source, *args, **kwargs)
+        return self.stac_object_from_dict(
+            d, href=source, root=root, preserve_dict=False
+        )
+
+    async def save_json(
+        self,
+        dest: HREF,
+        json_dict: dict[str, Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Write a dict to the given URI as JSON.
+
+        Args:
+            dest : The destination file to write the text to.
+            json_dict : The JSON dict to write.
+            *args : Additional positional arguments to be passed to
+                :meth:`StacIO.json_dumps`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`StacIO.json_dumps`.
+        """
+        txt = self.stac_io.json_dumps(json_dict, *args, **kwargs)
+        await self.write_text(dest, txt)
+
+    @classmethod
+    def default(cls) -> AsyncStacIO:
+        """Returns a :class:`DefaultAsyncStacIO` wrapping :meth:`StacIO.default`."""
+        return DefaultAsyncStacIO()
+
+
+class DefaultAsyncStacIO(AsyncStacIO):
+    """An :class:`AsyncStacIO` that runs the blocking reads and writes of a
+    synchronous :class:`StacIO` in worker threads via :func:`asyncio.to_thread`.
+
+    This lets PySTAC's ``async`` methods be used from an event loop with any existing
+    :class:`StacIO` implementation. The wrapped :class:`StacIO` must be safe to use
+    from multiple threads.
+    """
+
+    async def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+        import asyncio
+
+        return await asyncio.to_thread(self.stac_io.read_text, source, *args, **kwargs)
+
+    async def write_text(
+        self,
+        dest: HREF,
+        txt: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        import asyncio
+
+        await asyncio.to_thread(self.stac_io.write_text, dest, txt, *args, **kwargs)
 
 
 class DuplicateKeyReportingMixin(StacIO):
@@ -371,7 +944,7 @@ class DuplicateKeyReportingMixin(StacIO):
     See https://github.com/stac-utils/pystac/issues/313
     """
 
-    def json_loads(self, txt: str, *_: Any, **__: Any) -> dict[str, Any]:
+    def json_loads(self, txt: str | bytes, *_: Any, **__: Any) -> dict[str, Any]:
         """Overwrites :meth:`StacIO.json_loads <pystac.StacIO.json_loads>` as the
         internal method used by :class:`DuplicateKeyReportingMixin` for deserializing
         a JSON string to a dictionary while checking for duplicate object keys.
@@ -418,8 +991,6 @@ class DuplicateKeyReportingMixin(StacIO):
 
 
 if HAS_URLLIB3:
-    from typing import cast
-
     from urllib3 import PoolManager
     from urllib3.util import Retry
 
@@ -427,8 +998,8 @@ if HAS_URLLIB3:
         """A customized StacIO that retries requests, using
         :py:class:`urllib3.util.retry.Retry`.
 
-        The headers are passed to :py:class:`DefaultStacIO`. If retry is not
-        provided, a default retry is used.
+        The headers and JSON profile are passed to :py:class:`DefaultStacIO`. If
+        retry is not provided, a default retry is used.
 
         To use this class, you'll need to install PySTAC with urllib3:
 
@@ -442,45 +1013,159 @@ if HAS_URLLIB3:
             self,
             headers: dict[str, str] | None = None,
             retry: Retry | None = None,
+            json_profile: JSONProfile | str = JSONProfile.PRETTY,
         ):
-            super().__init__(headers)
+            super().__init__(headers, json_profile)
 
             self.retry = retry or Retry()
             """The :py:class:`urllib3.util.retry.Retry` to use with all reading network
             requests."""
 
-        def read_text_from_href(self, href: str) -> str:
-            """Reads file as a UTF-8 string, with retry support.
+        def read_bytes_from_href(self, href: str) -> bytes:
+            """Reads the contents of a file as bytes, with retry support.
 
             Args:
                 href : The URI of the file to open.
             """
             if _is_url(href):
-                from urllib.error import HTTPError
-
-                # TODO provide a pooled StacIO to enable more efficient network
-                # access (probably named `PooledStacIO`).
-                http = PoolManager()
-                try:
-                    response = http.request(
-                        "GET",
+                with self._open_url(
+                    href,
+                    self._get_pool_manager(),
+                    preload_content=True,
+                    retries=self.retry,
+                ) as f:
+                    return decompress(f.read())
+            else:
+                return super().read_bytes_from_href(href)
+
+        def read_text_lines_from_href(self, href: str) -> Iterator[str]:
+            """Reads the lines of a UTF-8 file as they are iterated over, with retry
+            support for the request.
+
+            Args:
+                href : The URI of the file to open.
+            """
+            if _is_url(href):
+                with (
+                    self._open_url(
                         href,
-                        headers={
-                            "User-Agent": f"pystac/{pystac.__version__}",
-                            **self.headers,
-                        },
-                        retries=self.retry,  # type: ignore
-                    )
-                    if response.status >= 400:
-                        raise HTTPError(
-                            href,
-                            response.status,
-                            response.reason,
-                            response.headers,
-                            None,
-                        )
-                    return cast(str, response.data.decode("utf-8"))
-                except HTTPError as e:
-                    raise Exception(f"Could not read uri {href}") from e
+                        self._get_pool_manager(),
+                        preload_content=False,
+                        retries=self.retry,
+                    ) as f,
+                    io.TextIOWrapper(open_decompressed(f), encoding="utf-8") as text,
+                ):
+                    yield from text
             else:
-                return super().read_text_from_href(href)
+                yield from super().read_text_lines_from_href(href)
+
+    class PooledStacIO(RetryStacIO):
+        """A customized StacIO that keeps a single, long-lived
+        :py:class:`urllib3.PoolManager` for all of its network requests.
+
+        :class:`DefaultStacIO` and :class:`RetryStacIO` open a new connection pool
+        for every read, so each object read over HTTP(S) pays for a new TCP (and
+        TLS) handshake. A ``PooledStacIO`` instance keeps connections to each host
+        alive and reuses them, which makes traversing large remote catalogs much
+        faster. Because :meth:`Catalog.from_file <pystac.Catalog.from_file>` stores
+        the :class:`~pystac.StacIO` instance on the root catalog, every link
+        resolved during a traversal reuses the same pool.
+
+        The underlying :py:class:`urllib3.PoolManager` is thread-safe, so a single
+        instance may be shared between threads. Call :meth:`close` (or use the
+        instance as a context manager) to close all pooled connections.
+
+        To use this class, you'll need to install PySTAC with urllib3:
+
+        .. code-block:: shell
+
+            pip install pystac[urllib3]
+
+        Args:
+            headers : Optional headers to include in every request.
+            retry : Optional :py:class:`urllib3.util.retry.Retry` to use for all
+                reading network requests. If not provided, a default retry is used.
+            maxsize : The maximum number of connections to keep alive per host.
+                Defaults to 10.
+            num_pools : The number of per-host connection pools to cache before
+                discarding the least recently used pool. Defaults to 10.
+            block : If ``True``, requests will block until a connection is free
+                once ``maxsize`` connections to a host are in use, instead of opening
+                additional, non-pooled connections. Defaults to ``False``.
+            json_profile : The :class:`JSONProfile` of the JSON written. Defaults
+                to :attr:`JSONProfile.PRETTY`.
+        """
+
+        def __init__(
+            self,
+            headers: dict[str, str] | None = None,
+            retry: Retry | None = None,
+            maxsize: int = 10,
+            num_pools: int = 10,
+            block: bool = False,
+            json_profile: JSONProfile | str = JSONProfile.PRETTY,
+        ):
+            super().__init__(headers, retry, json_profile)
+
+            self.maxsize = maxsize
+            """The maximum number of connections to keep alive per host."""
+
+            self.num_pools = num_pools
+            """The number of per-host connection pools to cache."""
+
+            self.block = block
+            """Whether to block when no pooled connection to a host is free."""
+
+            self._pool_manager: PoolManager | None = None
+            self._pool_manager_lock = threading.Lock()
+
+        def _get_pool_manager(self) -> PoolManager:
+            pool_manager = self._pool_manager
+            if pool_manager is None:
+                # Threads may read concurrently, and must all share a single pool
+                with self._pool_manager_lock:
+                    if self._pool_manager is None:
+                        self._pool_manager = PoolManager(
+                            num_pools=self.num_pools,
+                            maxsize=self.maxsize,
+                            block=self.block,
+                        )
+                    pool_manager = self._pool_manager
+            return pool_manager
+
+        def close(self) -> None:
+            """Closes all pooled connections.
+
+            The instance can still be used afterwards; a new pool is created on
+            the next network request.
+            """
+            with self._pool_manager_lock:
+                if self._pool_manager is not None:
+                    self._pool_manager.clear()  # type: ignore[no-untyped-call]
+                    self._pool_manager = None
+
+        def __enter__(self) -> PooledStacIO:
+            return self
+
+        def __exit__(self, *_: Any) -> None:
+            self.close()
+
+        def __copy__(self) -> PooledStacIO:
+            """Returns a shallow copy that shares the connection pool of this
+            instance, e.g. for :meth:`~pystac.StacIO.with_json_profile`."""
+            # Create the pool first, so that it is not created separately by each
+            self._get_pool_manager()
+            stac_io = type(self).__new__(type(self))
+            stac_io.__dict__.update(self.__dict__)
+            return stac_io
+
+        def __getstate__(self) -> dict[str, Any]:
+            """Drops the connection pool and its lock, which cannot be pickled"""
+            d = self.__dict__.copy()
+            d["_pool_manager"] = None
+            del d["_pool_manager_lock"]
+            return d
+
+        def __setstate__(self, state: dict[str, Any]) -> None:
+            self.__dict__.update(state)
+            self._pool_manager_lock = threading.Lock()
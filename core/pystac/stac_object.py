@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, cast
 
 import pystac
 from pystac import STACError
-from pystac.link import Link
+from pystac.link import Link, _LinkList, _resolve_links_concurrently
 from pystac.utils import (
     HREF,
     StringEnum,
@@ -56,6 +56,18 @@ class STACObject(ABC):
         self.links = []
         self.stac_extensions = stac_extensions
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Keep links in a list that indexes them by rel for fast lookups
+        if name == "links" and not isinstance(value, _LinkList):
+            value = _LinkList(value)
+        super().__setattr__(name, value)
+
+    def _get_links_with_rel(self, rel: str | pystac.RelType) -> list[Link]:
+        links = self.links
+        if isinstance(links, _LinkList):
+            return links.with_rel(rel)
+        return [link for link in links if link.rel == rel]
+
     def validate(
         self,
         validator: pystac.validation.stac_validator.STACValidator | None = None,
@@ -170,6 +182,20 @@ class STACObject(ABC):
 
         return traverse(self, {self})
 
+    def _get_hierarchy_targets(self) -> set[str | STACObject]:
+        """Returns every target for which :meth:`target_in_hierarchy` is true, found
+        with a single traversal of the hierarchical link tree."""
+        targets: set[str | STACObject] = {self}
+        stack: list[STACObject] = [self]
+        while stack:
+            obj = stack.pop()
+            for link in obj.links:
+                if link.is_hierarchical() and link.target not in targets:
+                    targets.add(link.target)
+                    if not isinstance(link.target, str):
+                        stack.append(link.target)
+        return targets
+
     def get_single_link(
         self,
         rel: str | pystac.RelType | None = None,
@@ -192,17 +218,12 @@ class STACObject(ABC):
         """
         if rel is None and media_type is None:
             return next(iter(self.links), None)
+        links = self.links if rel is None else self._get_links_with_rel(rel)
+        if media_type is None:
+            return links[0] if links else None
         if media_type and isinstance(media_type, (str, pystac.MediaType)):
             media_type = [media_type]
-        return next(
-            (
-                link
-                for link in self.links
-                if (rel is None or link.rel == rel)
-                and (media_type is None or link.media_type in media_type)
-            ),
-            None,
-        )
+        return next((link for link in links if link.media_type in media_type), None)
 
     def get_links(
         self,
@@ -227,11 +248,11 @@ class STACObject(ABC):
             return self.links
         if media_type and isinstance(media_type, (str, pystac.MediaType)):
             media_type = [media_type]
+        links = self.links if rel is None else self._get_links_with_rel(rel)
         return [
             link
-            for link in self.links
-            if (rel is None or link.rel == rel)
-            and (media_type is None or link.media_type in media_type)
+            for link in links
+            if media_type is None or link.media_type in media_type
         ]
 
     def clear_links(self, rel: str | pystac.RelType | None = None) -> None:
@@ -341,20 +362,12 @@ class STACObject(ABC):
             root : The root
                 object to set. Passing in None will clear the root.
         """
-        root_link_index = next(
-            iter(
-                [
-                    i
-                    for i, link in enumerate(self.links)
-                    if link.rel == pystac.RelType.ROOT
-                ]
-            ),
-            None,
-        )
+        root_link = self.get_single_link(pystac.RelType.ROOT)
+        root_link_index = None
 
         # Remove from old root resolution cache
-        if root_link_index is not None:
-            root_link = self.links[root_link_index]
+        if root_link is not None:
+            root_link_index = self.links.index(root_link)
             if root_link.is_resolved():
                 cast(pystac.Catalog, root_link.target)._resolved_objects.remove(self)
 
@@ -403,6 +416,8 @@ class STACObject(ABC):
         rel: str | pystac.RelType,
         typ: type[STACObject] | None = None,
         modify_links: Callable[[list[Link]], list[Link]] | None = None,
+        max_workers: int | None = None,
+        release: bool = False,
     ) -> Iterable[STACObject]:
         """Gets the :class:`STACObject` instances that are linked to
         by links with their ``rel`` property matching the passed in argument.
@@ -415,6 +430,16 @@ class STACObject(ABC):
             modify_links : A function that modifies the list of links before they are
                 iterated over. For instance, this option can be used to sort the list
                 so that links matching a particular pattern are earlier in the iterator.
+            max_workers : If set, the targets of unresolved links are read
+                concurrently using a pool of up to this many threads, ahead of the
+                consumer of this iterator. Objects are still yielded in link order.
+                If ``None`` (the default), links are resolved one at a time.
+            release : If ``True``, once the consumer moves past an object that was
+                resolved from an HREF, its link is unresolved again and the object is
+                evicted from the root's resolved object cache, so that memory use
+                does not grow with the number of objects iterated over. Any
+                in-memory changes to released objects are lost. Defaults to
+                ``False``.
 
         Returns:
             Iterable[STACObject]: A possibly empty iterable of STACObjects that are
@@ -426,14 +451,28 @@ class STACObject(ABC):
             links = modify_links(links)
 
         has_next_link = False
-        for i in range(0, len(links)):
-            link = links[i]
-            if link.rel == rel:
-                link.resolve_stac_object(root=self.get_root())
+        if max_workers is None:
+            for i in range(0, len(links)):
+                link = links[i]
+                if link.rel == rel:
+                    link.resolve_stac_object(root=self.get_root())
+                    if typ is None or isinstance(link.target, typ):
+                        yield cast(STACObject, link.target)
+                    if release:
+                        link._release(root=self.get_root())
+                if link.rel == "next":
+                    has_next_link = True
+        else:
+            has_next_link = any(link.rel == "next" for link in links)
+            for link in _resolve_links_concurrently(
+                (link for link in links if link.rel == rel),
+                root=self.get_root(),
+                max_workers=max_workers,
+            ):
                 if typ is None or isinstance(link.target, typ):
                     yield cast(STACObject, link.target)
-            if link.rel == "next":
-                has_next_link = True
+                if release:
+                    link._release(root=self.get_root())
         if has_next_link:
             warnings.warn(
                 "This STAC object has a 'next' link, but pystac does not support "
@@ -0,0 +1,139 @@
+"""In-memory interval index over the datetimes of STAC Items."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from datetime import datetime as Datetime
+from typing import TYPE_CHECKING
+
+from pystac.spatial_index import DatetimeQuery, SpatialIndexEntry, _get_interval
+
+if TYPE_CHECKING:
+    from pystac.item import Item
+
+
+class TemporalIndex:
+    """An immutable, in-memory interval tree over the time ranges of STAC Items that
+    answers datetime and interval queries without testing every Item.
+
+    The time range of an Item is its ``start_datetime`` to ``end_datetime``, or else
+    its ``datetime``; a missing bound leaves the range open on that side. Ranges are
+    stored as epoch seconds in arrays sorted by start, with each position also
+    holding the maximum end of the implicit balanced subtree rooted at it, so that a
+    query only visits the subtrees that can overlap it.
+
+    The index has the same query interface as
+    :class:`~pystac.spatial_index.SpatialIndex`, and can be passed to
+    :meth:`Catalog.search <pystac.Catalog.search>` and
+    :meth:`ItemCollection.filter <pystac.ItemCollection.filter>` in its place when
+    queries are mostly by time.
+
+    Args:
+        entries : The entries to index.
+    """
+
+    entries: list[SpatialIndexEntry]
+    """The indexed entries, in the order in which they were given."""
+
+    _starts: list[float]
+    _ends: list[float]
+    _max_ends: list[float]
+    _positions: list[int]
+
+    def __init__(self, entries: Iterable[SpatialIndexEntry]):
+        self.entries = list(entries)
+
+        starts = [_to_epoch(e.start_datetime, -math.inf) for e in self.entries]
+        ends = [_to_epoch(e.end_datetime, math.inf) for e in self.entries]
+        self._positions = sorted(range(len(starts)), key=starts.__getitem__)
+        self._starts = [starts[i] for i in self._positions]
+        self._ends = [ends[i] for i in self._positions]
+        self._max_ends = list(self._ends)
+        _fill_max_ends(self._max_ends, 0, len(self._max_ends))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"<TemporalIndex entries={len(self.entries)}>"
+
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> TemporalIndex:
+        """Creates an index over the given Items.
+
+        Args:
+            items : The Items to index.
+        """
+        return cls(map(SpatialIndexEntry.from_item, items))
+
+    def search(
+        self,
+        bbox: Sequence[float] | None = None,
+        datetime: DatetimeQuery | None = None,
+    ) -> list[Item | str]:
+        """Returns the targets of the entries that match the given query, in the
+        order of :attr:`entries`.
+
+        Args:
+            bbox : If set, only match entries whose bounding box intersects this
+                bounding box. This is tested on every entry that matches
+                ``datetime``.
+            datetime : If set, only match entries whose time range overlaps this
+                datetime or interval. See
+                :data:`~pystac.spatial_index.DatetimeQuery`.
+
+        Returns:
+            list[Item | str]: The matching Items or Item HREFs.
+        """
+        if datetime is None:
+            entries = self.entries
+        else:
+            start, end = _get_interval(datetime)
+            entries = [
+                self.entries[i]
+                for i in sorted(
+                    self._overlapping(
+                        _to_epoch(start, -math.inf), _to_epoch(end, math.inf)
+                    )
+                )
+            ]
+        if bbox is not None:
+            entries = [entry for entry in entries if entry.matches(bbox=bbox)]
+        return [entry.target for entry in entries]
+
+    def _overlapping(self, start: float, end: float) -> list[int]:
+        found = []
+        starts, ends, max_ends = self._starts, self._ends, self._max_ends
+        stack = [(0, len(starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if max_ends[mid] < start:
+                # Nothing in this subtree ends after the query starts
+                continue
+            stack.append((lo, mid))
+            if starts[mid] <= end:
+                if ends[mid] >= start:
+                    found.append(self._positions[mid])
+                stack.append((mid + 1, hi))
+        return found
+
+
+def _to_epoch(dt: Datetime | None, default: float) -> float:
+    return default if dt is None else dt.timestamp()
+
+
+def _fill_max_ends(max_ends: list[float], lo: int, hi: int) -> float:
+    # Stores at the middle of [lo, hi) the maximum end of the whole range
+    if lo >= hi:
+        return -math.inf
+    mid = (lo + hi) // 2
+    max_ends[mid] = max(
+        max_ends[mid],
+        _fill_max_ends(max_ends, lo, mid),
+        _fill_max_ends(max_ends, mid + 1, hi),
+    )
+    return max_ends[mid]
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import os
 import posixpath
+import re
 from collections.abc import Callable
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
     TypeAlias,
@@ -259,8 +261,18 @@ def make_relative_href(
     source_href = make_posix_style(source_href)
     start_href = make_posix_style(start_href)
 
-    parsed_source = safe_urlparse(source_href)
-    parsed_start = safe_urlparse(start_href)
+    return _make_relative_href_parsed(
+        source_href, safe_urlparse(source_href), safe_urlparse(start_href), start_is_dir
+    )
+
+
+def _make_relative_href_parsed(
+    source_href: str,
+    parsed_source: URLParseResult,
+    parsed_start: URLParseResult,
+    start_is_dir: bool = False,
+) -> str:
+    # Implementation of make_relative_href for callers that cache parsed HREFs
     if not (
         parsed_source.scheme == parsed_start.scheme
         and parsed_source.netloc == parsed_start.netloc
@@ -393,15 +405,19 @@ def is_absolute_href(href: str, start_href: str | None = None) -> bool:
     Returns:
         bool: ``True`` if the given HREF is absolute, ``False`` if it is relative.
     """
-    parsed = safe_urlparse(href)
+    return _is_absolute_href_parsed(
+        safe_urlparse(href),
+        "" if start_href is None else safe_urlparse(start_href).scheme,
+    )
+
+
+def _is_absolute_href_parsed(parsed: URLParseResult, start_scheme: str = "") -> bool:
+    # Implementation of is_absolute_href for callers that cache parsed HREFs
     # We treat /vsi paths, from GDAL, as absolute
     if parsed.scheme not in ["", "file"] or parsed.path.startswith("/vsi"):
         return True
     else:
-        parsed_start_scheme = (
-            "" if start_href is None else safe_urlparse(start_href).scheme
-        )
-        return parsed_start_scheme in ["", "file"] and os.path.isabs(parsed.path)
+        return start_scheme in ["", "file"] and os.path.isabs(parsed.path)
 
 
 def datetime_to_str(dt: datetime, timespec: str = "auto") -> str:
@@ -431,11 +447,23 @@ def datetime_to_str(dt: datetime, timespec: str = "auto") -> str:
     return timestamp
 
 
+#: The RFC 3339 datetimes required by STAC, which :func:`str_to_datetime` parses
+#: without dateutil
+_RFC3339_DATETIME_REGEX = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?"
+    r"(?:[Zz]|([+-])(\d{2}):(\d{2}))"
+)
+
+
 def str_to_datetime(s: str) -> datetime:
     """Converts a string timestamp to a :class:`datetime.datetime` instance using
-    :meth:`dateutil.parser.parse` under the hood. The input string may be in any
-    format supported by the parser.parser>. This includes many formats including
-    ISO 8601 and RFC 3339.
+    :meth:`dateutil.parser.isoparse` semantics. The input string may be in any
+    format supported by that parser, including ISO 8601 and RFC 3339.
+
+    RFC 3339 timestamps, as required by STAC, are parsed without dateutil, and the
+    results for recently parsed strings are reused, so repeatedly parsing the same
+    timestamp is cheap. The results are the same as those of
+    :meth:`dateutil.parser.isoparse`, including the ``tzinfo``.
 
     Args:
         s (str) : The string to convert to :class:`datetime.datetime`.
@@ -443,11 +471,50 @@ def str_to_datetime(s: str) -> datetime:
     Returns:
         str: The :class:`datetime.datetime` represented the by the string.
     """
+    return _str_to_datetime(s)
+
+
+@lru_cache(maxsize=4096)
+def _str_to_datetime(s: str) -> datetime:
+    match = _RFC3339_DATETIME_REGEX.fullmatch(s)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction, sign, tz_h, tz_m = (
+            match.groups()
+        )
+        try:
+            return datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                # dateutil truncates to microseconds
+                int(fraction[:6].ljust(6, "0")) if fraction else 0,
+                tzinfo=_get_tzinfo(sign, tz_h, tz_m),
+            )
+        except ValueError:
+            # e.g. a 24:00 time, which dateutil reads as midnight of the next day
+            pass
+
     import dateutil.parser
 
     return dateutil.parser.isoparse(s)
 
 
+def _get_tzinfo(sign: str | None, hours: str | None, minutes: str | None) -> Any:
+    import dateutil.tz
+
+    offset = 0
+    if sign is not None:
+        offset = int(hours or 0) * 3600 + int(minutes or 0) * 60
+        if sign == "-":
+            offset = -offset
+    if offset == 0:
+        return dateutil.tz.tzutc()
+    return dateutil.tz.tzoffset(None, offset)
+
+
 def now_in_utc() -> datetime:
     """Returns a datetime value of now with the UTC timezone applied"""
     return datetime.now(timezone.utc)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any, cast
 
 import pystac
-from pystac.serialization.identify import STACVersionID, identify_stac_object
+from pystac.serialization.identify import (
+    STACJSONDescription,
+    STACVersionID,
+    identify_stac_object,
+)
 from pystac.stac_object import STACObjectType
 from pystac.utils import make_absolute_href
 from pystac.validation.schema_uri_map import OldExtensionSchemaUriMap
@@ -15,16 +19,29 @@ if TYPE_CHECKING:
 
 
 # Import after above class definition
+from pystac.validation.compiled_validator import CompiledSTACValidator
+from pystac.validation.report import (
+    ValidationFailure,
+    ValidationReport,
+    _ObjectToValidate,
+    validate_objects,
+)
+from pystac.validation.schema_cache import SchemaCache
 from pystac.validation.stac_validator import JsonSchemaSTACValidator, STACValidator
 
 __all__ = [
+    "CompiledSTACValidator",
     "GetSchemaError",
     "JsonSchemaSTACValidator",
     "RegisteredValidator",
+    "SchemaCache",
+    "ValidationFailure",
+    "ValidationReport",
     "validate",
     "validate_all",
     "validate_dict",
     "validate_all_dict",
+    "validate_all_report",
     "set_validator",
 ]
 
@@ -100,6 +117,23 @@ def validate_dict(
     Raises:
         STACValidationError
     """
+    stac_object_type, stac_version, extensions = _get_validation_args(
+        stac_dict, stac_object_type, stac_version, extensions
+    )
+    validator = validator or RegisteredValidator.get_validator()
+    return validator.validate(
+        stac_dict, stac_object_type, stac_version, extensions, href
+    )
+
+
+def _get_validation_args(
+    stac_dict: dict[str, Any],
+    stac_object_type: STACObjectType | None,
+    stac_version: str | None,
+    extensions: list[str] | None,
+) -> tuple[STACObjectType, str, list[str]]:
+    """Fills in the arguments of :func:`validate_dict` that are not supplied, and
+    maps the short extension IDs of old STAC versions to schema URIs."""
     info = None
     if stac_object_type is None:
         info = identify_stac_object(stac_dict)
@@ -128,10 +162,7 @@ def validate_dict(
 
         extensions = [uri for uri in map(_get_uri, extensions) if uri is not None]
 
-    validator = validator or RegisteredValidator.get_validator()
-    return validator.validate(
-        stac_dict, stac_object_type, stac_version, extensions, href
-    )
+    return stac_object_type, stac_version, extensions
 
 
 def validate_all(
@@ -213,17 +244,87 @@ def validate_all_dict(
     if stac_io is None:
         stac_io = pystac.StacIO.default()
 
-    info = identify_stac_object(stac_dict)
+    for stac_dict, href, info in _walk_dicts(stac_dict, href, stac_io):
+        validate_dict(
+            stac_dict,
+            stac_object_type=info.object_type,
+            stac_version=str(info.version_range.latest_valid_version()),
+            extensions=list(info.extensions),
+            href=href,
+        )
+
+
+def validate_all_report(
+    stac_object: STACObject,
+    stac_io: pystac.StacIO | None = None,
+    validator: STACValidator | None = None,
+    max_workers: int | None = None,
+) -> ValidationReport:
+    """Validate a :class:`~pystac.STACObject` and, if it is a catalog or
+    collection, every child and item linked from it, recursively, collecting all
+    failures instead of raising on the first one.
 
-    # Validate this object
-    validate_dict(
-        stac_dict,
-        stac_object_type=info.object_type,
-        stac_version=str(info.version_range.latest_valid_version()),
-        extensions=list(info.extensions),
-        href=href,
+    Objects are read in the same way as by :func:`validate_all`, and are validated
+    as they are read. Each object is validated against its core schema and every
+    extension schema. A linked object that cannot be read is reported as a failure
+    without a schema URI, and the rest of the objects are still validated.
+
+    Args:
+        stac_object : STAC object to validate.
+        stac_io : Optional StacIO instance to use for reading hrefs. If None,
+            the StacIO.default() instance is used.
+        validator : A custom validator to use. If omitted, the default validator
+            from :class:`~pystac.validation.RegisteredValidator` will be used.
+        max_workers : If set, objects are validated in a pool of up to this many
+            processes, while the calling process reads them. If ``None`` (the
+            default), objects are validated in the calling process.
+
+    Returns:
+        ValidationReport: Every failure (with the HREF and ID of the object, the
+        schema URI and the best matching error) and throughput statistics.
+    """
+    if stac_io is None:
+        stac_io = pystac.StacIO.default()
+    objects = _walk_objects_to_validate(
+        stac_object.to_dict(), stac_object.get_self_href(), stac_io
     )
+    return validate_objects(objects, validator=validator, max_workers=max_workers)
 
+
+def _walk_dicts(
+    stac_dict: dict[str, Any], href: str | None, stac_io: pystac.StacIO
+) -> Iterator[tuple[dict[str, Any], str | None, STACJSONDescription]]:
+    """Yields a STAC object serialized as a dict and, if it represents a catalog or
+    collection, each child and item linked from it, recursively, reading them as
+    they are iterated over."""
+    info = identify_stac_object(stac_dict)
+    yield stac_dict, href, info
+
+    for link_href in _linked_hrefs(stac_dict, href, info):
+        yield from _walk_dicts(stac_io.read_json(link_href), link_href, stac_io)
+
+
+def _walk_objects_to_validate(
+    stac_dict: dict[str, Any], href: str | None, stac_io: pystac.StacIO
+) -> Iterator[_ObjectToValidate]:
+    """Like :func:`_walk_dicts`, but yields a :class:`ValidationFailure` for each
+    linked object that cannot be read, and continues with the next link."""
+    yield stac_dict, href
+
+    for link_href in _linked_hrefs(stac_dict, href, identify_stac_object(stac_dict)):
+        try:
+            link_dict = stac_io.read_json(link_href)
+        except Exception as e:
+            yield ValidationFailure(link_href, None, None, str(e))
+            continue
+        yield from _walk_objects_to_validate(link_dict, link_href, stac_io)
+
+
+def _linked_hrefs(
+    stac_dict: dict[str, Any], href: str | None, info: STACJSONDescription
+) -> Iterator[str]:
+    """Yields the absolute HREFs of the children and items linked from a catalog or
+    collection serialized as a dict."""
     if info.object_type != pystac.STACObjectType.ITEM and "links" in stac_dict:
         links = (
             # Account for 0.6 links
@@ -234,10 +335,7 @@ def validate_all_dict(
 
         for link in cast(Iterable[Mapping[str, Any]], links):
             if link.get("rel") in [pystac.RelType.ITEM, pystac.RelType.CHILD]:
-                link_href = make_absolute_href(
-                    cast(str, link.get("href")), start_href=href
-                )
-                validate_all_dict(stac_io.read_json(link_href), link_href, stac_io)
+                yield make_absolute_href(cast(str, link.get("href")), start_href=href)
 
 
 class RegisteredValidator:
@@ -0,0 +1,311 @@
+"""A :class:`~pystac.validation.stac_validator.STACValidator` that validates with
+Python code generated from JSON schemas.
+
+This requires the `fastjsonschema <https://pypi.org/project/fastjsonschema/>`__
+package.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable
+from copy import deepcopy
+from typing import Any
+
+import pystac
+from pystac.stac_object import STACObjectType
+from pystac.validation.schema_cache import _write_atomically
+from pystac.validation.schema_uri_map import SchemaUriMap
+from pystac.validation.stac_validator import GetSchemaError, JsonSchemaSTACValidator
+from pystac.version import STACVersion
+
+# Is fastjsonschema available?
+try:
+    import fastjsonschema
+    from fastjsonschema.ref_resolver import RefResolver
+
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_DRAFTS = ("draft-04", "draft-06", "draft-07")
+"""The JSON schema drafts that are compiled into Python code. Schemas of other
+drafts are validated with ``jsonschema``."""
+
+_COMPILED_DIR_NAME = "_compiled"
+
+
+class UnsupportedSchemaError(Exception):
+    """Raised when a schema, or a schema it references, cannot be compiled into
+    Python code."""
+
+
+class CompiledSTACValidator(JsonSchemaSTACValidator):
+    """Validate STAC with Python code generated from JSON schemas.
+
+    Each schema, along with the schemas it references, is compiled into a Python
+    validation function by ``fastjsonschema`` the first time it is validated
+    against, which is much faster than validating with ``jsonschema``.
+
+    Validation results are the same as those of
+    :class:`~pystac.validation.JsonSchemaSTACValidator`: objects that fail the
+    generated code are validated again with ``jsonschema``, which raises the
+    :class:`~pystac.STACValidationError`, and schemas that cannot be compiled, such
+    as schemas of drafts newer than draft 7 or schemas that reference a schema of
+    another draft, are always validated with ``jsonschema``.
+
+    Args:
+        schema_uri_map : The :class:`~pystac.validation.schema_uri_map.SchemaUriMap`
+            that defines where the validator will retrieve the JSON schemas for
+            validation. Defaults to an instance of
+            :class:`~pystac.validation.schema_uri_map.DefaultSchemaUriMap`
+        cache_dir : The directory of the
+            :class:`~pystac.validation.schema_cache.SchemaCache`. See
+            :class:`~pystac.validation.JsonSchemaSTACValidator`.
+        offline : Whether to never fetch remote schemas. See
+            :class:`~pystac.validation.JsonSchemaSTACValidator`.
+        code_dir : The directory in which the generated code is cached, so that each
+            schema is only compiled once across processes, and compiled again if
+            a schema it references changes. Defaults to the
+            ``_compiled`` directory within the schema cache directory, if any.
+            Otherwise, generated code is only kept in memory. The code in this
+            directory is executed, so it must not be writable by untrusted users.
+
+    Note:
+    This class requires the ``fastjsonschema`` and ``jsonschema`` libraries to be
+    installed.
+    """
+
+    code_dir: str | None
+    _compiled: dict[str, Callable[[Any], Any] | None]
+
+    def __init__(
+        self,
+        schema_uri_map: SchemaUriMap | None = None,
+        cache_dir: str | os.PathLike[str] | None = None,
+        offline: bool | None = None,
+        code_dir: str | os.PathLike[str] | None = None,
+    ) -> None:
+        if not HAS_FASTJSONSCHEMA:
+            raise ImportError("Cannot instantiate, requires fastjsonschema package")
+
+        super().__init__(schema_uri_map, cache_dir=cache_dir, offline=offline)
+
+        if code_dir is not None:
+            self.code_dir = os.fspath(code_dir)
+        elif self.disk_cache is not None:
+            self.code_dir = os.path.join(self.disk_cache.directory, _COMPILED_DIR_NAME)
+        else:
+            self.code_dir = None
+        self._compiled = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drops the generated functions, which are recreated on first use, e.g. in
+        each process of a pool"""
+        d = super().__getstate__()
+        d["_compiled"] = {}
+        return d
+
+    def precompile(self, schema_uris: Iterable[str] | None = None) -> list[str]:
+        """Compiles schemas ahead of validation, e.g. to populate the code
+        directory before starting validation workers.
+
+        Args:
+            schema_uris : The URIs of the schemas to compile. Defaults to the schemas
+                of the core STAC objects of the latest STAC version, which are
+                bundled with PySTAC, and the current schema URI of every extension
+                whose :class:`~pystac.extensions.hooks.ExtensionHooks` are
+                registered.
+
+        Returns:
+            list[str]: The URIs of the schemas that were compiled into Python code.
+            The others will be validated with ``jsonschema``.
+
+        Raises:
+            GetSchemaError: If a schema cannot be fetched.
+        """
+        if schema_uris is None:
+            stac_version = STACVersion.DEFAULT_STAC_VERSION
+            uris = [
+                self.schema_uri_map.get_object_schema_uri(object_type, stac_version)
+                for object_type in (
+                    STACObjectType.CATALOG,
+                    STACObjectType.COLLECTION,
+                    STACObjectType.ITEM,
+                )
+            ]
+            pystac.EXTENSION_HOOKS._discover()
+            uris.extend(sorted(pystac.EXTENSION_HOOKS.hooks))
+            schema_uris = [uri for uri in uris if uri is not None]
+        return [uri for uri in schema_uris if self._get_compiled(uri) is not None]
+
+    def _validate_from_uri(
+        self,
+        stac_dict: dict[str, Any],
+        stac_object_type: STACObjectType,
+        schema_uri: str,
+        href: str | None = None,
+    ) -> None:
+        validate = self._get_compiled(schema_uri)
+        if validate is not None:
+            try:
+                validate(stac_dict)
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+            else:
+                return
+        # Invalid objects are validated again with jsonschema, so that errors and
+        # results are the same as those of JsonSchemaSTACValidator
+        super()._validate_from_uri(stac_dict, stac_object_type, schema_uri, href)
+
+    def _get_compiled(self, schema_uri: str) -> Callable[[Any], Any] | None:
+        """Returns the generated validation function of the schema at
+        ``schema_uri``, or ``None`` if the schema cannot be compiled."""
+        if schema_uri in self._compiled:
+            return self._compiled[schema_uri]
+
+        schema = self._get_schema(schema_uri)
+        try:
+            code, path = self._read_code(schema_uri, schema)
+            if code is None:
+                code, referenced = self._generate_code(schema)
+                path = self._write_code(schema_uri, schema, referenced, code)
+        except GetSchemaError as e:
+            # Not memoized, so that the schema is compiled once the schemas it
+            # references are available
+            logger.debug(f"Cannot compile schema {schema_uri}: {e}")
+            return None
+
+        namespace: dict[str, Any] = {}
+        exec(compile(code, path or schema_uri, "exec"), namespace)
+        validate: Callable[[Any], Any] | None = namespace["validate"]
+        self._compiled[schema_uri] = validate
+        return validate
+
+    def _get_referenced_schema(self, uri: str) -> dict[str, Any]:
+        # Meta-schemas are bundled with jsonschema, which never fetches them
+        import jsonschema
+
+        meta_schemas = {
+            "draft-04": jsonschema.Draft4Validator.META_SCHEMA,
+            "draft-06": jsonschema.Draft6Validator.META_SCHEMA,
+            "draft-07": jsonschema.Draft7Validator.META_SCHEMA,
+        }
+        meta_schema_draft = _get_draft({"$schema": uri})
+        if meta_schema_draft is not None:
+            return dict(meta_schemas[meta_schema_draft])
+        return self._get_schema(uri)
+
+    def _generate_code(
+        self, schema: dict[str, Any]
+    ) -> tuple[str, dict[str, dict[str, Any]]]:
+        """Returns Python code that defines ``validate``, the validation function of
+        ``schema``, or sets it to ``None`` if the schema cannot be compiled, and the
+        schemas referenced by ``schema`` by URI."""
+        draft = _get_draft(schema)
+        referenced_schemas: dict[str, dict[str, Any]] = {}
+
+        def get_referenced_schema(uri: str) -> dict[str, Any]:
+            referenced = referenced_schemas[uri] = self._get_referenced_schema(uri)
+            if _get_draft(referenced) != draft:
+                raise UnsupportedSchemaError(
+                    f"{uri} is not a {draft} schema, like the schema referencing it"
+                )
+            return deepcopy(referenced)
+
+        # fastjsonschema modifies schemas, which are also used as cache keys
+        schema = deepcopy(schema)
+        try:
+            if draft is None:
+                raise UnsupportedSchemaError(
+                    f"only {', '.join(SUPPORTED_DRAFTS)} schemas are supported"
+                )
+            code: str = fastjsonschema.compile_to_code(
+                schema,
+                handlers={
+                    "http": get_referenced_schema,
+                    "https": get_referenced_schema,
+                },
+                use_default=False,
+                use_formats=False,
+            )
+        except (
+            UnsupportedSchemaError,
+            fastjsonschema.JsonSchemaDefinitionException,
+        ) as e:
+            logger.debug(f"Validating with jsonschema: {e}")
+            return "validate = None\n", referenced_schemas
+        name = RefResolver.from_schema(schema).get_scope_name()
+        return f"{code}\n\nvalidate = {name}\n", referenced_schemas
+
+    def _read_code(
+        self, schema_uri: str, schema: dict[str, Any]
+    ) -> tuple[str | None, str | None]:
+        """Returns the cached code generated from ``schema`` and the schemas it
+        referenced, if they are unchanged, and the path of the code.
+
+        The URIs of the referenced schemas are stored next to the code, keyed on the
+        schema, and the code is keyed on the schema and every referenced schema.
+        """
+        if self.code_dir is None:
+            return None, None
+        references_path = self._get_code_path(schema_uri, schema, None, ".json")
+        if not os.path.exists(references_path):
+            return None, None
+        with open(references_path, encoding="utf-8") as f:
+            referenced = {uri: self._get_referenced_schema(uri) for uri in json.load(f)}
+        path = self._get_code_path(schema_uri, schema, referenced, ".py")
+        if not os.path.exists(path):
+            return None, None
+        with open(path, encoding="utf-8") as f:
+            return f.read(), path
+
+    def _write_code(
+        self,
+        schema_uri: str,
+        schema: dict[str, Any],
+        referenced: dict[str, dict[str, Any]],
+        code: str,
+    ) -> str | None:
+        """Caches code generated by :meth:`_generate_code`, if there is a code
+        directory, and returns its path."""
+        if self.code_dir is None:
+            return None
+        path = self._get_code_path(schema_uri, schema, referenced, ".py")
+        _write_atomically(path, code)
+        # Written last, so that the code exists once it is referred to
+        _write_atomically(
+            self._get_code_path(schema_uri, schema, None, ".json"),
+            json.dumps(sorted(referenced)),
+        )
+        return path
+
+    def _get_code_path(
+        self,
+        schema_uri: str,
+        schema: dict[str, Any],
+        referenced: dict[str, dict[str, Any]] | None,
+        extension: str,
+    ) -> str:
+        assert self.code_dir is not None
+        key = json.dumps(
+            [fastjsonschema.VERSION, schema_uri, schema, referenced], sort_keys=True
+        ).encode("utf-8")
+        return os.path.join(
+            self.code_dir, f"{hashlib.sha256(key).hexdigest()}{extension}"
+        )
+
+
+def _get_draft(schema: Any) -> str | None:
+    meta_schema = schema.get("$schema") if isinstance(schema, dict) else None
+    if not isinstance(meta_schema, str):
+        return None
+    for draft in SUPPORTED_DRAFTS:
+        if meta_schema.rstrip("#").endswith(f"json-schema.org/{draft}/schema"):
+            return draft
+    return None
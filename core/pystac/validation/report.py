@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from itertools import islice
+from typing import Any, TypeAlias
+
+from pystac.errors import STACValidationError
+from pystac.serialization.identify import identify_stac_object
+from pystac.validation.stac_validator import STACValidator
+
+DEFAULT_CHUNKSIZE = 16
+"""The default number of objects sent to a worker process at once."""
+
+
+class ValidationFailure:
+    """A STAC object that failed to validate against a schema, or that could not be
+    validated at all."""
+
+    href: str | None
+    """The HREF of the object, if known."""
+
+    id: str | None
+    """The ID of the object, if it has one."""
+
+    schema_uri: str | None
+    """The URI of the schema the object failed to validate against, or ``None`` if
+    the failure is not tied to a schema (e.g. the schema could not be fetched)."""
+
+    error: str
+    """The message of the best matching validation error, as determined by the
+    validator, or of the exception raised while validating."""
+
+    path: str | None
+    """The JSON path of the invalid value within the object, if known."""
+
+    def __init__(
+        self,
+        href: str | None,
+        id: str | None,
+        schema_uri: str | None,
+        error: str,
+        path: str | None = None,
+    ) -> None:
+        self.href = href
+        self.id = id
+        self.schema_uri = schema_uri
+        self.error = error
+        self.path = path
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns this failure as a JSON-serializable dictionary."""
+        return {
+            "href": self.href,
+            "id": self.id,
+            "schema_uri": self.schema_uri,
+            "error": self.error,
+            "path": self.path,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<ValidationFailure href={self.href} id={self.id} "
+            f"schema_uri={self.schema_uri}>"
+        )
+
+
+class ValidationReport:
+    """The result of validating many STAC objects: every failure, and how fast the
+    objects were validated.
+
+    A report is truthy if no object failed to validate.
+    """
+
+    failures: list[ValidationFailure]
+    """Every failure, in the order in which the objects were read."""
+
+    num_validated: int
+    """The number of objects validated, including those that failed."""
+
+    elapsed: float
+    """The time spent reading and validating the objects, in seconds."""
+
+    def __init__(
+        self,
+        failures: list[ValidationFailure] | None = None,
+        num_validated: int = 0,
+        elapsed: float = 0.0,
+    ) -> None:
+        self.failures = failures or []
+        self.num_validated = num_validated
+        self.elapsed = elapsed
+
+    @property
+    def num_failed(self) -> int:
+        """The number of objects with at least one failure."""
+        return len({(failure.href, failure.id) for failure in self.failures})
+
+    @property
+    def objects_per_second(self) -> float:
+        """The number of objects validated per second."""
+        if self.elapsed == 0:
+            return 0.0
+        return self.num_validated / self.elapsed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns this report as a JSON-serializable dictionary."""
+        return {
+            "num_validated": self.num_validated,
+            "num_failed": self.num_failed,
+            "elapsed": self.elapsed,
+            "objects_per_second": self.objects_per_second,
+            "failures": [failure.to_dict() for failure in self.failures],
+        }
+
+    def __bool__(self) -> bool:
+        return not self.failures
+
+    def __repr__(self) -> str:
+        return (
+            f"<ValidationReport num_validated={self.num_validated} "
+            f"num_failed={self.num_failed} "
+            f"objects_per_second={self.objects_per_second:.1f}>"
+        )
+
+
+#: A ``(stac_dict, href)`` tuple of an object to validate, or the
+#: :class:`ValidationFailure` of an object that could not be read.
+_ObjectToValidate: TypeAlias = tuple[dict[str, Any], str | None] | ValidationFailure
+
+
+def validate_objects(
+    objects: Iterable[_ObjectToValidate],
+    validator: STACValidator | None = None,
+    max_workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> ValidationReport:
+    """Validates STAC objects serialized as JSON into dicts, collecting every
+    failure instead of raising on the first one.
+
+    Unlike :meth:`STACValidator.validate
+    <pystac.validation.stac_validator.STACValidator.validate>`, each object is
+    validated against the core schema and every extension schema, even if an
+    earlier schema fails.
+
+    Args:
+        objects : ``(stac_dict, href)`` tuples of the objects to validate. They are
+            consumed as they are validated, so this can be a generator that reads
+            the objects lazily. A :class:`ValidationFailure` in place of a tuple,
+            e.g. for an object that could not be read, is added to the report as
+            is.
+        validator : The validator to use. If omitted, the validator from
+            :class:`~pystac.validation.RegisteredValidator` is used.
+        max_workers : If set, objects are validated in a pool of up to this many
+            processes. Validation is CPU-bound, so threads would not help. The
+            validator and the objects must be picklable. If ``None`` (the default),
+            objects are validated in the calling process.
+        chunksize : The number of objects sent to a worker process at once.
+
+    Returns:
+        ValidationReport: The failures, and validation throughput.
+    """
+    from pystac.validation import RegisteredValidator
+
+    if validator is None:
+        validator = RegisteredValidator.get_validator()
+
+    report = ValidationReport()
+    start = time.perf_counter()
+    chunks = _chunk(objects, chunksize)
+    if max_workers is None:
+        for chunk in chunks:
+            _add_results(report, _validate_chunk(validator, chunk))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(validator,),
+        ) as executor:
+            # Bound the number of chunks in flight, so that objects are only read as
+            # fast as they are validated
+            pending: deque[Future[tuple[int, list[ValidationFailure]]]] = deque()
+            for chunk in chunks:
+                if len(pending) >= 2 * max_workers:
+                    _add_results(report, pending.popleft().result())
+                pending.append(executor.submit(_validate_chunk_in_worker, chunk))
+            while pending:
+                _add_results(report, pending.popleft().result())
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def validate_object(
+    validator: STACValidator, stac_dict: dict[str, Any], href: str | None
+) -> list[ValidationFailure]:
+    """Validates a single STAC object against its core schema and each of its
+    extension schemas, returning a :class:`ValidationFailure` for each schema the
+    object failed to validate against.
+
+    Args:
+        validator : The validator to use.
+        stac_dict : Dictionary that is the STAC JSON of the object.
+        href : Optional HREF of the STAC object being validated.
+    """
+    from pystac.validation import _get_validation_args
+
+    stac_id = stac_dict.get("id")
+    stac_id = stac_id if isinstance(stac_id, str) else None
+    try:
+        info = identify_stac_object(stac_dict)
+        stac_object_type, stac_version, extensions = _get_validation_args(
+            stac_dict,
+            info.object_type,
+            str(info.version_range.latest_valid_version()),
+            list(info.extensions),
+        )
+        # See STACValidator.validate
+        json_dict = json.loads(json.dumps(stac_dict))
+    except Exception as e:
+        return [ValidationFailure(href, stac_id, None, str(e))]
+
+    failures = []
+    for extension_id in [None, *extensions]:
+        try:
+            if extension_id is None:
+                validator.validate_core(json_dict, stac_object_type, stac_version, href)
+            else:
+                validator.validate_extension(
+                    json_dict, stac_object_type, stac_version, extension_id, href
+                )
+        except STACValidationError as e:
+            best = e.__cause__ if e.__cause__ is not None else e
+            failures.append(
+                ValidationFailure(
+                    href,
+                    stac_id,
+                    e.schema_uri or extension_id,
+                    getattr(best, "message", str(best)),
+                    getattr(best, "json_path", None),
+                )
+            )
+        except Exception as e:
+            failures.append(ValidationFailure(href, stac_id, extension_id, str(e)))
+    return failures
+
+
+_worker_validator: STACValidator | None = None
+
+
+def _initialize_worker(validator: STACValidator) -> None:
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _validate_chunk_in_worker(
+    chunk: list[_ObjectToValidate],
+) -> tuple[int, list[ValidationFailure]]:
+    assert _worker_validator is not None
+    return _validate_chunk(_worker_validator, chunk)
+
+
+def _validate_chunk(
+    validator: STACValidator, chunk: list[_ObjectToValidate]
+) -> tuple[int, list[ValidationFailure]]:
+    failures = []
+    for entry in chunk:
+        if isinstance(entry, ValidationFailure):
+            failures.append(entry)
+        else:
+            failures.extend(validate_object(validator, *entry))
+    return len(chunk), failures
+
+
+def _add_results(
+    report: ValidationReport, results: tuple[int, list[ValidationFailure]]
+) -> None:
+    num_validated, failures = results
+    report.num_validated += num_validated
+    report.failures.extend(failures)
+
+
+def _chunk(
+    objects: Iterable[_ObjectToValidate], chunksize: int
+) -> Iterator[list[_ObjectToValidate]]:
+    iterator = iter(objects)
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
@@ -0,0 +1,216 @@
+"""A persistent, on-disk cache of the JSON schemas used for validation.
+
+:class:`~pystac.validation.JsonSchemaSTACValidator` only bundles the schemas of the
+latest STAC version; other schemas, such as those of extensions, are fetched when
+they are first used. A :class:`SchemaCache` keeps the fetched schemas in a directory,
+so that they can be reused across processes and pre-seeded (see
+:meth:`SchemaCache.seed`) for validation without network access.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote, urldefrag, urljoin, urlsplit
+
+if TYPE_CHECKING:
+    from pystac.stac_io import StacIO
+
+CACHE_DIR_ENV_VAR = "PYSTAC_SCHEMA_CACHE_DIR"
+"""The environment variable holding the directory of the schema cache used by
+default by :class:`~pystac.validation.JsonSchemaSTACValidator`."""
+
+OFFLINE_ENV_VAR = "PYSTAC_SCHEMA_OFFLINE"
+"""The environment variable that, if set to ``1``, ``true`` or ``yes``, makes
+:class:`~pystac.validation.JsonSchemaSTACValidator` never fetch schemas by
+default."""
+
+
+class SchemaCache:
+    """A directory of JSON schemas, keyed by their URI.
+
+    Each schema is stored at a path made from the host and path of its URI, e.g.
+    ``https://stac-extensions.github.io/eo/v1.1.0/schema.json`` is stored at
+    ``stac-extensions.github.io/eo/v1.1.0/schema.json``, so a cache directory can
+    also be populated by copying schema files into it. Schemas are written
+    atomically, so several processes can share a cache directory.
+
+    Only schemas with an ``http`` or ``https`` URI are cached.
+
+    Args:
+        directory : The directory of the cache. It is created when the first schema
+            is written.
+    """
+
+    directory: str
+    """The directory of the cache."""
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = os.fspath(directory)
+
+    @classmethod
+    def from_env(cls) -> SchemaCache | None:
+        """Returns the cache in the directory set by the ``PYSTAC_SCHEMA_CACHE_DIR``
+        environment variable, or ``None`` if it is not set."""
+        directory = os.environ.get(CACHE_DIR_ENV_VAR)
+        if not directory:
+            return None
+        return cls(directory)
+
+    def get_path(self, schema_uri: str) -> str | None:
+        """Returns the path at which the schema at ``schema_uri`` is cached, or
+        ``None`` if that schema is not cached because it is not an ``http`` or
+        ``https`` URI.
+
+        Args:
+            schema_uri : The URI of the schema.
+        """
+        parts = urlsplit(urldefrag(schema_uri).url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            return None
+        segments = [parts.netloc, *(s for s in parts.path.split("/") if s)]
+        if parts.query:
+            segments[-1] += "?" + parts.query
+        return os.path.join(self.directory, *map(_quote_segment, segments))
+
+    def get(self, schema_uri: str) -> dict[str, Any] | None:
+        """Returns the cached schema at ``schema_uri``, or ``None`` if it is not
+        cached.
+
+        Args:
+            schema_uri : The URI of the schema.
+        """
+        path = self.get_path(schema_uri)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                schema: dict[str, Any] = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        return schema
+
+    def put(self, schema_uri: str, schema: dict[str, Any]) -> None:
+        """Caches ``schema`` as the schema at ``schema_uri``. Does nothing if the
+        URI is not an ``http`` or ``https`` URI.
+
+        Args:
+            schema_uri : The URI of the schema.
+            schema : The schema.
+        """
+        path = self.get_path(schema_uri)
+        if path is None:
+            return
+        _write_atomically(path, json.dumps(schema))
+
+    def __contains__(self, schema_uri: object) -> bool:
+        if not isinstance(schema_uri, str):
+            return False
+        path = self.get_path(schema_uri)
+        return path is not None and os.path.exists(path)
+
+    def seed(
+        self,
+        schema_uris: Iterable[str] | None = None,
+        stac_io: StacIO | None = None,
+    ) -> list[str]:
+        """Fetches schemas into the cache, along with every remote schema they
+        reference, so that they can then be used without network access.
+
+        Schemas that are already cached, or that are bundled with PySTAC, are not
+        fetched again.
+
+        Args:
+            schema_uris : The URIs of the schemas to fetch. Defaults to the current
+                schema URI of every extension whose
+                :class:`~pystac.extensions.hooks.ExtensionHooks` are registered,
+                including those of the installed extension packages.
+            stac_io : The :class:`~pystac.StacIO` to fetch schemas with. Defaults
+                to :meth:`StacIO.default() <pystac.StacIO.default>`.
+
+        Returns:
+            list[str]: The URIs of the schemas fetched.
+
+        Raises:
+            GetSchemaError: If a schema cannot be fetched.
+        """
+        import pystac
+        from pystac.validation.local_validator import get_local_schema_cache
+        from pystac.validation.stac_validator import GetSchemaError
+
+        if schema_uris is None:
+            pystac.EXTENSION_HOOKS._discover()
+            schema_uris = sorted(pystac.EXTENSION_HOOKS.hooks)
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+
+        bundled = get_local_schema_cache()
+        fetched = []
+        seen = set()
+        pending = list(schema_uris)
+        while pending:
+            schema_uri = urldefrag(pending.pop()).url
+            if schema_uri in seen or schema_uri in bundled:
+                continue
+            seen.add(schema_uri)
+            if self.get_path(schema_uri) is None:
+                continue
+            schema = self.get(schema_uri)
+            if schema is None:
+                try:
+                    schema = json.loads(stac_io.read_text(schema_uri))
+                except Exception as error:
+                    raise GetSchemaError(schema_uri, error) from error
+                self.put(schema_uri, schema)
+                fetched.append(schema_uri)
+            pending.extend(_get_referenced_uris(schema, schema_uri))
+        return fetched
+
+    def __repr__(self) -> str:
+        return f"<SchemaCache directory={self.directory}>"
+
+
+def is_offline_from_env() -> bool:
+    """Returns whether the ``PYSTAC_SCHEMA_OFFLINE`` environment variable is set to
+    ``1``, ``true`` or ``yes``."""
+    return os.environ.get(OFFLINE_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+def _write_atomically(path: str, text: str) -> None:
+    dirname = os.path.dirname(path)
+    os.makedirs(dirname, exist_ok=True)
+    # Write to a temporary file then rename it, so that other processes never read
+    # a partially written file
+    fd, tmp_path = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _quote_segment(segment: str) -> str:
+    # Quoting keeps each segment a single file name within the cache directory
+    segment = quote(segment, safe="")
+    if segment in (".", ".."):
+        return segment.replace(".", "%2E")
+    return segment
+
+
+def _get_referenced_uris(schema: Any, base_uri: str) -> Iterator[str]:
+    if isinstance(schema, dict):
+        if isinstance(schema.get("$id"), str):
+            base_uri = urljoin(base_uri, schema["$id"])
+        ref = schema.get("$ref")
+        if isinstance(ref, str) and not ref.startswith("#"):
+            yield urljoin(base_uri, ref)
+        for value in schema.values():
+            yield from _get_referenced_uris(value, base_uri)
+    elif isinstance(schema, list):
+        for value in schema:
+            yield from _get_referenced_uris(value, base_uri)
@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 import warnings
 from abc import ABC, abstractmethod
 from typing import Any
@@ -8,6 +9,7 @@ import pystac
 import pystac.utils
 from pystac.errors import STACValidationError
 from pystac.stac_object import STACObjectType
+from pystac.validation.schema_cache import SchemaCache, is_offline_from_env
 from pystac.validation.schema_uri_map import DefaultSchemaUriMap, SchemaUriMap
 
 try:
@@ -142,6 +144,21 @@ class JsonSchemaSTACValidator(STACValidator):
             the validator will retrieve the JSON schemas for validation.
             Defaults to an instance of
             :class:`~pystac.validation.schema_uri_map.DefaultSchemaUriMap`
+        cache_dir : The directory of a
+            :class:`~pystac.validation.schema_cache.SchemaCache` that schemas are
+            read from before being fetched, and that fetched schemas are written to,
+            so that they are fetched once across processes. Defaults to the
+            ``PYSTAC_SCHEMA_CACHE_DIR`` environment variable, if set.
+        offline : If ``True``, remote schemas that are neither bundled with PySTAC
+            nor in the schema cache are never fetched, and validating against them
+            raises a :class:`GetSchemaError`. Defaults to whether the
+            ``PYSTAC_SCHEMA_OFFLINE`` environment variable is set to ``1``,
+            ``true`` or ``yes``.
+
+    Schemas are checked and compiled into ``jsonschema`` validators once per schema
+    URI and draft, and all validators share a single
+    :class:`referencing.Registry`, so validating many objects only pays for
+    fetching and compiling each schema once.
 
     Note:
     This class requires the ``jsonschema`` library to be installed.
@@ -149,8 +166,18 @@ class JsonSchemaSTACValidator(STACValidator):
 
     schema_uri_map: SchemaUriMap
     schema_cache: dict[str, dict[str, Any]]
+    disk_cache: SchemaCache | None
+    offline: bool
+    _registry: Any
+    _resources: dict[str, Any]
+    _validators: dict[tuple[str, type], Any]
 
-    def __init__(self, schema_uri_map: SchemaUriMap | None = None) -> None:
+    def __init__(
+        self,
+        schema_uri_map: SchemaUriMap | None = None,
+        cache_dir: str | os.PathLike[str] | None = None,
+        offline: bool | None = None,
+    ) -> None:
         if not HAS_JSONSCHEMA:
             raise ImportError("Cannot instantiate, requires jsonschema package")
 
@@ -160,27 +187,90 @@ class JsonSchemaSTACValidator(STACValidator):
             self.schema_uri_map = DefaultSchemaUriMap()
 
         self.schema_cache = get_local_schema_cache()
+        if cache_dir is not None:
+            self.disk_cache = SchemaCache(cache_dir)
+        else:
+            self.disk_cache = SchemaCache.from_env()
+        self.offline = is_offline_from_env() if offline is None else offline
+        self._registry = None
+        self._resources = {}
+        self._validators = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drops the registry and compiled validators, which are recreated on
+        first use, e.g. in each process of a pool"""
+        d = self.__dict__.copy()
+        d["_registry"] = None
+        d["_resources"] = {}
+        d["_validators"] = {}
+        return d
 
     def _get_schema(self, schema_uri: str) -> dict[str, Any]:
         if schema_uri not in self.schema_cache:
-            try:
-                s = json.loads(pystac.StacIO.default().read_text(schema_uri))
-            except Exception as error:
-                raise GetSchemaError(schema_uri, error) from error
+            s = self._read_schema(schema_uri)
             self.schema_cache[schema_uri] = s
             id_field = "$id" if "$id" in s else "id"
             if not s[id_field].startswith("http"):
                 s[id_field] = schema_uri
         return self.schema_cache[schema_uri]
 
+    def _read_schema(self, schema_uri: str) -> dict[str, Any]:
+        if self.disk_cache is not None:
+            cached = self.disk_cache.get(schema_uri)
+            if cached is not None:
+                return cached
+        if self.offline and pystac.utils._is_url(schema_uri):
+            raise GetSchemaError(
+                schema_uri,
+                LookupError("the schema is not cached, and the validator is offline"),
+            )
+        try:
+            s: dict[str, Any] = json.loads(
+                pystac.StacIO.default().read_text(schema_uri)
+            )
+        except Exception as error:
+            raise GetSchemaError(schema_uri, error) from error
+        if self.disk_cache is not None:
+            self.disk_cache.put(schema_uri, s)
+        return s
+
+    def _get_resource(self, schema_uri: str) -> Resource[dict[str, Any]]:
+        resource = self._resources.get(schema_uri)
+        if resource is None:
+            resource = Resource.from_contents(self._get_schema(schema_uri))
+            self._resources[schema_uri] = resource
+        return resource
+
     @property
     def registry(self) -> Any:
-        def retrieve(schema_uri: str) -> Resource[dict[str, Any]]:
-            return Resource.from_contents(self._get_schema(schema_uri))
+        """The :class:`referencing.Registry` used to resolve references between
+        schemas.
 
-        return Registry(retrieve=retrieve).with_resources(  # type: ignore
-            [(k, Resource.from_contents(v)) for k, v in self.schema_cache.items()]
-        )
+        It is created once, from the schemas cached when it is first accessed;
+        other schemas are retrieved with the same means as the schemas validated
+        against, and only once.
+        """
+        if self._registry is None:
+            registry = Registry(retrieve=self._get_resource)  # type: ignore
+            self._registry = registry.with_resources(
+                [(k, Resource.from_contents(v)) for k, v in self.schema_cache.items()]
+            )
+        return self._registry
+
+    def _get_validator(self, schema_uri: str) -> Any:
+        """Returns the ``jsonschema`` validator of the schema at ``schema_uri``,
+        checking the schema and creating the validator on first use."""
+        schema = self._get_schema(schema_uri)
+        cls = jsonschema.validators.validator_for(schema)
+        key = (schema_uri, cls)
+        validator = self._validators.get(key)
+        if validator is None:
+            # This block is cribbed (w/ change in error handling) from
+            # jsonschema.validate
+            cls.check_schema(schema)
+            validator = cls(schema, registry=self.registry)
+            self._validators[key] = validator
+        return validator
 
     def get_schema_from_uri(self, schema_uri: str) -> tuple[dict[str, Any], Any]:
         """DEPRECATED"""
@@ -198,12 +288,7 @@ class JsonSchemaSTACValidator(STACValidator):
         href: str | None = None,
     ) -> None:
         try:
-            schema = self._get_schema(schema_uri)
-            # This block is cribbed (w/ change in error handling) from
-            # jsonschema.validate
-            cls = jsonschema.validators.validator_for(schema)
-            cls.check_schema(schema)
-            validator = cls(schema, registry=self.registry)
+            validator = self._get_validator(schema_uri)
             errors = list(validator.iter_errors(stac_dict))
         except Exception as e:
             logger.error(f"Exception while validating {stac_object_type} href: {href}")
@@ -221,7 +306,9 @@ class JsonSchemaSTACValidator(STACValidator):
             best = jsonschema.exceptions.best_match(errors)
             if best:
                 msg += "\n" + str(best)
-            raise STACValidationError(msg, source=errors) from best
+            raise STACValidationError(
+                msg, source=errors, schema_uri=schema_uri
+            ) from best
 
     def validate_core(
         self,
@@ -101,6 +101,17 @@ def test_version_ordering() -> None:
     assert STACVersionID("0.9.0") <= "0.9.0"
     assert STACVersionID("1.0.0-beta.1") <= STACVersionID("1.0.0-beta.2")
     assert not STACVersionID("1.0.0") < STACVersionID("1.0.0-beta.2")
+    assert STACVersionID("1.0.0-rc.1") == "1.0.0-rc.1"
+    assert STACVersionID("1.0.0-rc.1") < "1.0.0-rc.2"
+    assert STACVersionID("1.0.0-") < "1.0.0"
+    assert not STACVersionID("1.0.0-beta.2") < "1.0.0-beta.2"
+
+
+def test_version_id_parts() -> None:
+    version = STACVersionID("1.0.0-beta.2-a")
+    assert version.version_core == "1.0.0"
+    assert version.version_prerelease == "beta.2-a"
+    assert STACVersionID("1.1.0").version_prerelease is None
 
 
 def test_version_range_ordering() -> None:
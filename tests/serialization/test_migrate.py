@@ -1,8 +1,12 @@
+from collections.abc import Generator
+from typing import Any
+
 import pytest
 
 import pystac
 from pystac import ExtensionTypeError
 from pystac.cache import CollectionCache
+from pystac.extensions.hooks import ExtensionHooks
 from pystac.extensions.item_assets import ItemAssetsExtension
 from pystac.extensions.view import ViewExtension
 from pystac.serialization import (
@@ -11,6 +15,7 @@ from pystac.serialization import (
     merge_common_properties,
     migrate_to_latest,
 )
+from pystac.serialization.identify import STACJSONDescription, STACVersionID
 from pystac.utils import get_required, str_to_datetime
 from tests.utils import TestCases
 from tests.utils.test_cases import ExampleInfo
@@ -129,3 +134,85 @@ def test_migrate_updates_license_from_proprietary() -> None:
 
     collection = pystac.Collection.from_file(path)
     assert collection.license == "other"
+
+
+RECORDING_SCHEMA_URI = "https://pystac-extensions.test/recording/v1.0.0/schema.json"
+
+
+class RecordingExtensionHooks(ExtensionHooks):
+    schema_uri = RECORDING_SCHEMA_URI
+    prev_extension_ids = {"recording"}
+    stac_object_types = {pystac.STACObjectType.ITEM}
+
+    def __init__(self) -> None:
+        self.migrated: list[str] = []
+
+    def migrate(
+        self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
+    ) -> None:
+        self.migrated.append(obj["id"])
+        super().migrate(obj, version, info)
+
+
+@pytest.fixture
+def recording_hooks() -> Generator[RecordingExtensionHooks]:
+    hooks = RecordingExtensionHooks()
+    pystac.EXTENSION_HOOKS.add_extension_hooks(hooks)
+    yield hooks
+    pystac.EXTENSION_HOOKS.remove_extension_hooks(RECORDING_SCHEMA_URI)
+
+
+def test_current_version_only_migrated_by_listed_extensions(
+    sample_item: pystac.Item, recording_hooks: RecordingExtensionHooks
+) -> None:
+    d = sample_item.to_dict(include_self_link=False)
+    d["stac_extensions"] = ["https://stac-extensions.github.io/eo/v2.0.0/schema.json"]
+    migrated = migrate_to_latest(d, identify_stac_object(d))
+    assert recording_hooks.migrated == []
+    assert migrated == d
+    assert migrated is not d
+
+    d["stac_extensions"].append("recording")
+    migrated = migrate_to_latest(d, identify_stac_object(d))
+    assert recording_hooks.migrated == [sample_item.id]
+    assert migrated["stac_extensions"][-1] == RECORDING_SCHEMA_URI
+
+
+def test_previous_version_migrated_by_all_extensions(
+    sample_item: pystac.Item, recording_hooks: RecordingExtensionHooks
+) -> None:
+    d = sample_item.to_dict(include_self_link=False)
+    d["stac_version"] = "1.0.0"
+    migrate_to_latest(d, identify_stac_object(d))
+    assert recording_hooks.migrated == [sample_item.id]
+
+
+def test_claiming_hooks_cache_is_cleared(sample_item: pystac.Item) -> None:
+    d = sample_item.to_dict(include_self_link=False)
+    d["stac_extensions"] = ["recording"]
+    migrate_to_latest(d, identify_stac_object(d))
+
+    hooks = RecordingExtensionHooks()
+    pystac.EXTENSION_HOOKS.add_extension_hooks(hooks)
+    try:
+        migrated = migrate_to_latest(d, identify_stac_object(d))
+    finally:
+        pystac.EXTENSION_HOOKS.remove_extension_hooks(RECORDING_SCHEMA_URI)
+    assert hooks.migrated == [sample_item.id]
+    assert migrated["stac_extensions"] == [RECORDING_SCHEMA_URI]
+
+    migrated = migrate_to_latest(d, identify_stac_object(d))
+    assert migrated["stac_extensions"] == ["recording"]
+
+
+def test_from_dict_does_not_modify_dict(sample_item: pystac.Item) -> None:
+    d = sample_item.to_dict(include_self_link=False)
+    d["stac_version"] = "1.0.0"
+    d["properties"]["license"] = "various"
+    expected = sample_item.to_dict(include_self_link=False)
+    expected["stac_version"] = "1.0.0"
+    expected["properties"]["license"] = "various"
+
+    pystac.read_dict(d)
+    pystac.Item.from_dict(d)
+    assert d == expected
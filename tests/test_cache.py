@@ -1,7 +1,14 @@
+import gc
+from datetime import datetime
 from typing import Any
 
 import pystac
-from pystac.cache import ResolvedObjectCache, ResolvedObjectCollectionCache
+from pystac.cache import (
+    LRUCachePolicy,
+    ResolvedObjectCache,
+    ResolvedObjectCollectionCache,
+    WeakRefCachePolicy,
+)
 from pystac.utils import get_opt
 from tests.utils import TestCases
 
@@ -77,3 +84,88 @@ def test_ResolvedObjectCollectionCache_cache() -> None:
     cached = cache.get_by_id(collection.id)
     assert isinstance(cached, dict)
     assert cached["id"] == collection.id
+
+
+def create_item(suffix: Any) -> pystac.Item:
+    return pystac.Item(
+        id=f"item {suffix}",
+        geometry=None,
+        bbox=None,
+        datetime=datetime(2000, 1, 1),
+        properties={},
+        href=f"http://example.com/item_{suffix}.json",
+    )
+
+
+def test_ResolvedObjectCache_lru_policy_evicts_items_only() -> None:
+    cache = ResolvedObjectCache(policy=LRUCachePolicy(max_items=2))
+    cat = create_catalog(1)
+    cache.cache(cat)
+    items = [create_item(i) for i in range(3)]
+    cache.cache(items[0])
+    cache.cache(items[1])
+    assert cache.get(items[0]) is items[0]
+    cache.cache(items[2])
+
+    assert cache.get(cat) is cat
+    assert cache.get(items[0]) is items[0]
+    assert items[1] not in cache
+    assert cache.get(items[2]) is items[2]
+    assert len(cache.hrefs_to_objects) == 3
+    assert cache.stats.evictions == 1
+
+
+def test_ResolvedObjectCache_weakref_policy() -> None:
+    cache = ResolvedObjectCache(policy=WeakRefCachePolicy())
+    cat = create_catalog(1)
+    cache.cache(cat)
+    item = create_item(1)
+    cache.cache(item)
+    assert cache.get_by_href("http://example.com/item_1.json") is item
+
+    del item
+    gc.collect()
+    assert cache.get_by_href("http://example.com/item_1.json") is None
+    assert cache.get_by_href("http://example.com/catalog_1.json") is cat
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+
+
+def test_ResolvedObjectCache_get_or_cache_counts_hits_and_misses() -> None:
+    cache = ResolvedObjectCache()
+    cache.get_or_cache(create_catalog(1))
+    cache.get_or_cache(create_catalog(1))
+    cache.get_or_cache(create_catalog(2))
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_ResolvedObjectCache_merge_keeps_first_policy() -> None:
+    policy = LRUCachePolicy(max_items=1)
+    first = ResolvedObjectCache(policy=policy)
+    first.cache(create_item(1))
+    second = ResolvedObjectCache()
+    second.cache(create_item(2))
+
+    merged = ResolvedObjectCache.merge(first, second)
+    assert merged.policy is policy
+    assert merged.stats is first.stats
+    assert len(merged.hrefs_to_objects) == 1
+
+
+def test_catalog_set_cache_policy() -> None:
+    catalog = TestCases.case_1()
+    catalog.set_cache_policy(LRUCachePolicy(max_items=3))
+    item_ids = [item.id for item in catalog.get_items(recursive=True)]
+    assert len(item_ids) > 3
+
+    cache = catalog._resolved_objects
+    cached_items = [
+        obj for obj in cache.hrefs_to_objects.values() if isinstance(obj, pystac.Item)
+    ]
+    assert len(cached_items) == 3
+    assert catalog.get_cache_stats().evictions == len(item_ids) - 3
+    assert all(
+        isinstance(child, pystac.Catalog) and child in cache
+        for child in catalog.get_children()
+    )
@@ -5,7 +5,7 @@ import os
 import posixpath
 import tempfile
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
@@ -23,6 +23,7 @@ from pystac import (
     Item,
     Link,
     MediaType,
+    StacIO,
 )
 from pystac.errors import STACError
 from pystac.layout import (
@@ -31,7 +32,9 @@ from pystac.layout import (
     HrefLayoutStrategy,
     TemplateLayoutStrategy,
 )
+from pystac.stac_io import DefaultStacIO, JSONProfile
 from pystac.utils import (
+    HREF,
     is_absolute_href,
     make_absolute_href,
     make_posix_style,
@@ -2037,3 +2040,385 @@ def test_warn_if_next_link_present(catalog: Catalog) -> None:
     catalog.links.append(Link(rel="next", target="./next.json"))
     with pytest.warns(UserWarning):
         _ = list(catalog.get_children())
+
+
+def test_walk_with_max_workers(test_case_1_catalog: Catalog) -> None:
+    expected = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in TestCases.case_1().walk()
+    ]
+    actual = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in test_case_1_catalog.walk(max_workers=4)
+    ]
+    assert actual == expected
+
+    item_links = [
+        link
+        for root, _, _ in test_case_1_catalog.walk()
+        for link in root.get_item_links()
+    ]
+    assert item_links
+    for link in item_links:
+        assert link.is_resolved()
+        item = cast(pystac.Item, link.target)
+        assert item in test_case_1_catalog._resolved_objects
+        assert item.get_root() is test_case_1_catalog
+        assert item.get_parent() is link.owner
+
+
+def test_get_items_with_max_workers(test_case_1_catalog: Catalog) -> None:
+    expected = [item.id for item in TestCases.case_1().get_items(recursive=True)]
+    items = list(test_case_1_catalog.get_items(recursive=True, max_workers=2))
+    assert [item.id for item in items] == expected
+    assert items[0] is next(test_case_1_catalog.get_items(recursive=True))
+
+
+def test_get_items_with_max_workers_raises_on_missing_target(
+    tmp_path: Path,
+) -> None:
+    catalog = Catalog("test", "a catalog")
+    catalog.add_item(Item("an-item", None, None, datetime.now(), {}))
+    catalog.normalize_and_save(str(tmp_path), CatalogType.SELF_CONTAINED)
+    os.remove(tmp_path / "an-item" / "an-item.json")
+
+    read_catalog = Catalog.from_file(str(tmp_path / "catalog.json"))
+    with pytest.raises(pystac.STACError, match="does not resolve to a STAC object"):
+        list(read_catalog.get_items(max_workers=2))
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_walk_with_release(
+    test_case_1_catalog: Catalog, max_workers: int | None
+) -> None:
+    import gc
+    import weakref
+
+    expected = [
+        (root.id, [i.id for i in items]) for root, _, items in TestCases.case_1().walk()
+    ]
+    actual = []
+    item_refs: list[weakref.ref[pystac.Item]] = []
+    for root, _, items in test_case_1_catalog.walk(
+        max_workers=max_workers, release=True
+    ):
+        item_ids = []
+        for item in items:
+            item_ids.append(item.id)
+            item_refs.append(weakref.ref(item))
+        actual.append((root.id, item_ids))
+    del item
+    gc.collect()
+
+    assert actual == expected
+    assert item_refs
+    assert all(ref() is None for ref in item_refs)
+    for link in test_case_1_catalog.links:
+        if link.rel in (pystac.RelType.CHILD, pystac.RelType.ITEM):
+            assert not link.is_resolved()
+    assert not any(
+        isinstance(obj, pystac.Item)
+        for obj in test_case_1_catalog._resolved_objects.hrefs_to_objects.values()
+    )
+
+    # Released objects are read again on the next traversal
+    assert [item.id for item in test_case_1_catalog.get_items(recursive=True)] == [
+        item_id for _, item_ids in expected for item_id in item_ids
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_get_items_recursive_with_release_walks_children_lazily(
+    test_case_1_catalog: Catalog, max_workers: int | None
+) -> None:
+    items = test_case_1_catalog.get_items(
+        recursive=True, max_workers=max_workers, release=True
+    )
+    item = next(items)
+    assert item.id == "area-1-1-imagery"
+
+    # The ancestors of the item are still linked from the root
+    parent = item.get_parent()
+    assert parent is not None and parent.id == "area-1-1"
+    country = parent.get_parent()
+    assert country is not None and country.id == "country-1"
+    assert country.get_root() is test_case_1_catalog
+    country_links = country.get_child_links()
+    assert country_links[0].is_resolved()
+    assert country_links[0].target is parent
+    root_links = test_case_1_catalog.get_child_links()
+    assert root_links[0].is_resolved()
+    assert root_links[0].target is country
+
+    next(items)
+    item = next(items)
+    assert item.id == "area-1-2-imagery"
+    # The first area has been released once its items were walked
+    assert not country_links[0].is_resolved()
+    assert root_links[0].target is country
+
+    assert [i.id for i in items] == [
+        "area-1-2-labels",
+        "area-2-1-imagery",
+        "area-2-1-labels",
+        "area-2-2-imagery",
+        "area-2-2-labels",
+    ]
+    assert not any(link.is_resolved() for link in root_links)
+
+
+def test_get_items_with_release_keeps_in_memory_items() -> None:
+    catalog = TestCases.case_1()
+    item = pystac.Item("in-memory", None, None, datetime(2000, 1, 1), {})
+    catalog.add_item(item)
+    assert [i.id for i in catalog.get_items(release=True)] == ["in-memory"]
+    assert next(catalog.get_items()) is item
+
+
+def test_id_index_lookups_match_walk(test_case_1_catalog: Catalog) -> None:
+    catalog = TestCases.case_1()
+    catalog.enable_id_index()
+    child_ids = [
+        child.id for _, children, _ in test_case_1_catalog.walk() for child in children
+    ]
+    item_ids = [item.id for item in test_case_1_catalog.get_items(recursive=True)]
+
+    for child_id in child_ids:
+        child = catalog.get_child(child_id, recursive=True)
+        expected = test_case_1_catalog.get_child(child_id, recursive=True)
+        assert child is not None and expected is not None
+        assert child.get_self_href() == expected.get_self_href()
+    assert catalog.get_child("not-a-child", recursive=True) is None
+
+    with pytest.warns(DeprecationWarning):
+        item = catalog.get_item(item_ids[-1], recursive=True)
+    assert item is not None and item.id == item_ids[-1]
+
+    ids = [item_ids[-1], item_ids[0]]
+    assert [i.get_self_href() for i in catalog.get_items(*ids, recursive=True)] == [
+        i.get_self_href() for i in test_case_1_catalog.get_items(*ids, recursive=True)
+    ]
+
+
+def test_id_index_is_built_once_and_invalidated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    catalog = TestCases.case_1()
+    catalog.enable_id_index()
+    walks = 0
+    walk = Catalog.walk
+
+    def counting_walk(
+        self: Catalog, *args: Any, **kwargs: Any
+    ) -> Iterable[tuple[Catalog, Iterable[Catalog], Iterable[Item]]]:
+        nonlocal walks
+        if self is catalog:
+            walks += 1
+        return walk(self, *args, **kwargs)
+
+    monkeypatch.setattr(Catalog, "walk", counting_walk)
+
+    item_ids = [item.id for item in catalog.get_items(recursive=True)]
+    walks = 0
+    for item_id in item_ids:
+        assert next(catalog.get_items(item_id, recursive=True)).id == item_id
+    assert walks == 1
+
+    subcatalog = next(iter(catalog.get_children()))
+    new_item = Item("new-item", None, None, datetime(2000, 1, 1), {})
+    subcatalog.add_item(new_item)
+    assert next(catalog.get_items("new-item", recursive=True)) is new_item
+    assert walks == 2
+
+    subcatalog.remove_item("new-item")
+    assert list(catalog.get_items("new-item", recursive=True)) == []
+    assert walks == 3
+
+    catalog.enable_id_index(False)
+    assert list(catalog.get_items(item_ids[0], recursive=True))
+    assert walks == 3
+
+
+def test_awalk(test_case_1_catalog: Catalog) -> None:
+    import asyncio
+
+    async def awalk() -> list[tuple[str, list[str], list[str]]]:
+        return [
+            (root.id, [c.id for c in children], [i.id for i in items])
+            async for root, children, items in test_case_1_catalog.awalk(
+                max_concurrency=2
+            )
+        ]
+
+    expected = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in TestCases.case_1().walk()
+    ]
+    assert asyncio.run(awalk()) == expected
+    item = next(test_case_1_catalog.get_items(recursive=True))
+    assert item in test_case_1_catalog._resolved_objects
+    assert item.get_root() is test_case_1_catalog
+
+
+def test_aget_items_with_custom_async_stac_io(test_case_1_catalog: Catalog) -> None:
+    import asyncio
+
+    from pystac.stac_io import AsyncStacIO
+
+    class CountingAsyncStacIO(AsyncStacIO):
+        def __init__(self) -> None:
+            super().__init__()
+            self.reads = 0
+
+        async def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+            self.reads += 1
+            with open(os.fspath(source)) as f:
+                return f.read()
+
+        async def write_text(
+            self, dest: HREF, txt: str, *args: Any, **kwargs: Any
+        ) -> None:
+            raise NotImplementedError
+
+    stac_io = CountingAsyncStacIO()
+
+    async def aget_items() -> list[str]:
+        return [
+            item.id
+            async for item in test_case_1_catalog.aget_items(
+                "area-2-1-imagery", "area-1-1-labels", recursive=True, stac_io=stac_io
+            )
+        ]
+
+    assert sorted(asyncio.run(aget_items())) == ["area-1-1-labels", "area-2-1-imagery"]
+    assert stac_io.reads == 14
+    # Everything is resolved, so nothing else is read
+    asyncio.run(aget_items())
+    assert stac_io.reads == 14
+
+
+@pytest.mark.parametrize("catalog_type", list(CatalogType))
+def test_asave_matches_save(tmp_path: Path, catalog_type: CatalogType) -> None:
+    import asyncio
+
+    def read_all(path: Path) -> dict[str, Any]:
+        return {
+            str(p.relative_to(path)): json.loads(p.read_text())
+            for p in sorted(path.glob("**/*.json"))
+        }
+
+    catalog = TestCases.case_1()
+    catalog.fully_resolve()
+    catalog.save(catalog_type, dest_href=str(tmp_path / "sync"))
+    asyncio.run(
+        catalog.asave(
+            catalog_type, dest_href=str(tmp_path / "async"), max_concurrency=3
+        )
+    )
+    expected = read_all(tmp_path / "sync")
+    assert len(expected) == 15
+    assert read_all(tmp_path / "async") == expected
+
+
+@pytest.mark.parametrize("catalog_type", list(CatalogType))
+def test_save_with_max_workers_matches_save(
+    tmp_path: Path, catalog_type: CatalogType
+) -> None:
+    def read_all(path: Path) -> dict[str, Any]:
+        return {
+            str(p.relative_to(path)): json.loads(p.read_text())
+            for p in sorted(path.glob("**/*.json"))
+        }
+
+    catalog = TestCases.case_1()
+    catalog.fully_resolve()
+    catalog.save(catalog_type, dest_href=str(tmp_path / "serial"))
+    catalog.save(catalog_type, dest_href=str(tmp_path / "parallel"), max_workers=4)
+    expected = read_all(tmp_path / "serial")
+    assert len(expected) == 15
+    assert read_all(tmp_path / "parallel") == expected
+
+
+def test_save_with_max_workers_skips_directory_checks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    catalog = TestCases.case_1()
+    catalog.fully_resolve()
+
+    def write_text_to_href(self: DefaultStacIO, href: str, txt: str) -> None:
+        raise AssertionError("directories were created before writing")
+
+    monkeypatch.setattr(DefaultStacIO, "write_text_to_href", write_text_to_href)
+    catalog.save(
+        CatalogType.SELF_CONTAINED,
+        dest_href=str(tmp_path),
+        stac_io=DefaultStacIO(),
+        max_workers=4,
+    )
+    assert len(list(tmp_path.glob("**/*.json"))) == 15
+
+
+def test_save_with_max_workers_uses_overridden_write(tmp_path: Path) -> None:
+    class RecordingStacIO(DefaultStacIO):
+        def __init__(self) -> None:
+            super().__init__()
+            self.hrefs: list[str] = []
+
+        def write_text_to_href(self, href: str, txt: str) -> None:
+            self.hrefs.append(href)
+            super().write_text_to_href(href, txt)
+
+    catalog = TestCases.case_1()
+    catalog.fully_resolve()
+    stac_io = RecordingStacIO()
+    catalog.save(
+        CatalogType.SELF_CONTAINED,
+        dest_href=str(tmp_path),
+        stac_io=stac_io,
+        max_workers=4,
+    )
+    assert len(stac_io.hrefs) == 15
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_save_with_json_profile(tmp_path: Path, max_workers: int | None) -> None:
+    catalog = TestCases.case_1()
+    catalog.fully_resolve()
+    catalog.save(
+        CatalogType.SELF_CONTAINED, dest_href=str(tmp_path / "pretty"), max_workers=4
+    )
+    stac_io = StacIO.default()
+    catalog.save(
+        dest_href=str(tmp_path / "compact"),
+        stac_io=stac_io,
+        max_workers=max_workers,
+        json_profile="compact",
+    )
+    assert stac_io.json_profile == JSONProfile.PRETTY
+
+    pretty = sorted((tmp_path / "pretty").glob("**/*.json"))
+    compact = sorted((tmp_path / "compact").glob("**/*.json"))
+    assert len(compact) == len(pretty) == 15
+    for pretty_path, compact_path in zip(pretty, compact):
+        text = compact_path.read_text()
+        assert "\n" not in text
+        assert json.loads(text) == json.loads(pretty_path.read_text())
+        assert len(text) < len(pretty_path.read_text())
+
+
+def test_normalize_and_save_with_max_workers(tmp_path: Path) -> None:
+    catalog = Catalog("test", "a catalog")
+    for i in range(3):
+        collection = Collection(f"collection-{i}", "a collection", ARBITRARY_EXTENT)
+        for j in range(10):
+            collection.add_item(Item(f"item-{i}-{j}", None, None, datetime.now(), {}))
+        catalog.add_child(collection)
+    stac_io = MockStacIO()
+    catalog.normalize_and_save(
+        str(tmp_path), CatalogType.SELF_CONTAINED, stac_io=stac_io, max_workers=4
+    )
+    assert stac_io.mock.write_text.call_count == 34
+    assert len(list(tmp_path.glob("**/*.json"))) == 34
+
+    read_catalog = Catalog.from_file(str(tmp_path / "catalog.json"))
+    assert len(list(read_catalog.get_items(recursive=True))) == 30
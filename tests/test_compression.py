@@ -0,0 +1,152 @@
+import gzip
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+import pystac
+from pystac import Catalog, CatalogType, ItemCollection
+from pystac.compression import (
+    Compression,
+    compress,
+    decompress,
+    get_compression_from_bytes,
+    get_compression_from_href,
+)
+from pystac.stac_io import DefaultStacIO
+from tests.utils import MockStacIO, TestCases
+
+COMPRESSIONS = [
+    Compression.GZIP,
+    pytest.param(
+        Compression.ZSTD,
+        marks=pytest.mark.skipif(
+            not pystac.compression.HAS_ZSTANDARD, reason="requires zstandard"
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_compress_round_trip(compression: Compression) -> None:
+    data = b'{"id": "an-id"}' * 100
+    compressed = compress(data, compression)
+    assert len(compressed) < len(data)
+    assert get_compression_from_bytes(compressed) == compression
+    assert decompress(compressed) == data
+
+
+def test_decompress_uncompressed() -> None:
+    data = b'{"id": "an-id"}'
+    assert get_compression_from_bytes(data) is None
+    assert decompress(data) is data
+
+
+def test_gzip_is_deterministic() -> None:
+    data = b'{"id": "an-id"}'
+    assert compress(data, "gzip") == compress(data, "gzip")
+
+
+def test_get_compression_from_href() -> None:
+    assert get_compression_from_href("catalog.json.gz") == Compression.GZIP
+    assert get_compression_from_href("catalog.json.zst") == Compression.ZSTD
+    assert get_compression_from_href("catalog.json") is None
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_stac_io_round_trip(tmp_path: Path, compression: Compression) -> None:
+    item = pystac.Item.from_file(TestCases.get_path("data-files/item/sample-item.json"))
+    href = str(tmp_path / f"item.json{pystac.compression.EXTENSIONS[compression]}")
+    stac_io = DefaultStacIO()
+    stac_io.save_json(href, item.to_dict(include_self_link=False))
+
+    with open(href, "rb") as f:
+        assert get_compression_from_bytes(f.read()) == compression
+    assert stac_io.read_text(href) == stac_io.json_dumps(
+        item.to_dict(include_self_link=False)
+    )
+    assert stac_io.read_json(href) == item.to_dict(include_self_link=False)
+
+
+def test_read_by_magic_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "catalog.json"
+    catalog = Catalog("an-id", "a description")
+    path.write_bytes(gzip.compress(json.dumps(catalog.to_dict()).encode("utf-8")))
+    assert Catalog.from_file(str(path)).id == "an-id"
+
+
+def test_ndjson_round_trip(tmp_path: Path) -> None:
+    item_collection = ItemCollection.from_file(
+        TestCases.get_path("data-files/item-collection/sample-item-collection.json")
+    )
+    href = str(tmp_path / "items.ndjson.gz")
+    ItemCollection.write_ndjson(href, item_collection)
+
+    with open(href, "rb") as f:
+        assert get_compression_from_bytes(f.read()) == Compression.GZIP
+    assert [item.id for item in ItemCollection.iter_file(href)] == [
+        item.id for item in item_collection
+    ]
+
+
+@pytest.mark.parametrize("compression", [None, *COMPRESSIONS])
+def test_read_text_lines_over_http(
+    monkeypatch: pytest.MonkeyPatch, compression: Compression | None
+) -> None:
+    urllib3 = pytest.importorskip("urllib3")
+    lines = [json.dumps({"id": str(i)}) + "\n" for i in range(100)]
+    data = "".join(lines).encode("utf-8")
+    if compression is not None:
+        data = compress(data, compression)
+
+    class FakeResponse(io.BytesIO):
+        status = 200
+
+        def seekable(self) -> bool:
+            return False
+
+    def request(self: object, method: str, url: str, **kwargs: object) -> FakeResponse:
+        assert kwargs["preload_content"] is False
+        return FakeResponse(data)
+
+    monkeypatch.setattr(urllib3.PoolManager, "request", request)
+    read_lines = DefaultStacIO().read_text_lines("http://pystac.test/items.ndjson")
+    assert list(read_lines) == lines
+
+
+def test_catalog_save_with_compression(tmp_path: Path) -> None:
+    catalog = TestCases.case_1()
+    catalog.normalize_and_save(
+        str(tmp_path), CatalogType.SELF_CONTAINED, compression="gzip"
+    )
+
+    assert not list(tmp_path.glob("**/*.json"))
+    paths = sorted(tmp_path.glob("**/*.json.gz"))
+    assert len(paths) == 15
+    for path in paths:
+        d = json.loads(gzip.decompress(path.read_bytes()))
+        for link in d["links"]:
+            if link["rel"] in ("child", "item", "parent", "root"):
+                assert link["href"].endswith(".json.gz")
+
+    read_catalog = Catalog.from_file(str(tmp_path / "catalog.json.gz"))
+    assert len(list(read_catalog.get_items(recursive=True))) == len(
+        list(catalog.get_items(recursive=True))
+    )
+
+    # Compression only applies to the save it was passed to
+    assert catalog.self_href == str(tmp_path / "catalog.json")
+    catalog.save()
+    assert len(list(tmp_path.glob("**/*.json"))) == 15
+
+
+def test_catalog_save_with_compression_warns_for_other_stac_io(
+    tmp_path: Path,
+) -> None:
+    catalog = TestCases.case_1()
+    catalog.normalize_hrefs(str(tmp_path))
+    with pytest.warns(UserWarning, match="DefaultStacIO"):
+        catalog.save(
+            CatalogType.SELF_CONTAINED, stac_io=MockStacIO(), compression="gzip"
+        )
@@ -48,6 +48,44 @@ def test_to_from_dict(sample_item_dict: dict[str, Any]) -> None:
     assert param_dict == sample_item_dict
 
 
+def test_from_dict_copy_on_write(sample_item_dict: dict[str, Any]) -> None:
+    param_dict = deepcopy(sample_item_dict)
+    item = Item.from_dict_copy_on_write(param_dict)
+    clone = item.clone()
+
+    # The geometry is shared until it is accessed through Item.geometry
+    assert item._geometry is param_dict["geometry"]
+    assert clone._geometry is param_dict["geometry"]
+    assert item.geometry is not param_dict["geometry"]
+    assert item.geometry == param_dict["geometry"]
+    assert item.geometry is not None
+    item.geometry["coordinates"][0][0][0] = 0.0
+    assert param_dict == sample_item_dict
+    assert clone.geometry == sample_item_dict["geometry"]
+    assert item.to_dict()["geometry"] is item.geometry
+
+    item.properties["foo"] = "bar"
+    assert param_dict == sample_item_dict
+
+    # Pickled and deep-copied items keep working
+    assert pickle.loads(pickle.dumps(clone)).geometry == clone.geometry
+    shared = Item.from_dict_copy_on_write(param_dict)
+    assert copy.deepcopy(shared).geometry == param_dict["geometry"]
+
+
+def test_from_dict_copy_on_write_to_dict(sample_item_dict: dict[str, Any]) -> None:
+    param_dict = deepcopy(sample_item_dict)
+    item = Item.from_dict_copy_on_write(param_dict)
+    clone = item.clone()
+
+    d = item.to_dict()
+    assert d["geometry"] is not param_dict["geometry"]
+    d["geometry"]["coordinates"][0][0][0] = 0.0
+    assert param_dict == sample_item_dict
+    assert clone.geometry == sample_item_dict["geometry"]
+    assert clone.to_dict()["geometry"] == sample_item_dict["geometry"]
+
+
 def test_from_dict_set_root(sample_item_dict: dict[str, Any]) -> None:
     catalog = pystac.Catalog(id="test", description="test desc")
     item = Item.from_dict(sample_item_dict, root=catalog)
@@ -683,3 +721,118 @@ def test_clone_extra_fields(item: Item) -> None:
     item.extra_fields["foo"] = "bar"
     cloned = item.clone()
     assert cloned.extra_fields["foo"] == "bar"
+
+
+def test_lazy_item_from_dict(sample_item_dict: dict[str, Any]) -> None:
+    param_dict = deepcopy(sample_item_dict)
+    item = pystac.LazyItem.from_dict(param_dict)
+    assert item.id == "CS3-20160503_132131_05"
+    assert item.bbox == sample_item_dict["bbox"]
+    assert item.properties["title"] == "A CS3 item"
+    assert "links" not in item.__dict__
+    assert "assets" not in item.__dict__
+    assert "datetime" not in item.__dict__
+
+    # An untouched item is serialized from its dict
+    assert item.to_dict() == Item.from_dict(sample_item_dict).to_dict()
+    assert item.to_dict()["properties"]["datetime"] == "2016-05-03T13:22:30.040000Z"
+    assert "links" not in item.__dict__
+    assert param_dict == sample_item_dict
+
+    assert item.datetime == str_to_datetime("2016-05-03T13:22:30.040Z")
+    assert item.assets["analytic"].owner is item
+    assert item.assets["analytic"].extra_fields["product"] == (
+        "http://cool-sat.com/catalog/products/analytic.json"
+    )
+    assert item.get_single_link("collection") is not None
+    assert item.get_single_link("collection").owner is item  # type: ignore[union-attr]
+    assert item.to_dict() == Item.from_dict(sample_item_dict).to_dict()
+
+
+@pytest.mark.parametrize("include_self_link", [True, False])
+def test_lazy_item_to_dict_self_link(
+    sample_item_dict: dict[str, Any], include_self_link: bool
+) -> None:
+    sample_item_dict["links"].append(
+        {"rel": "self", "href": "http://pystac.test/item.json"}
+    )
+    lazy_item = pystac.LazyItem.from_dict(sample_item_dict)
+    d = lazy_item.to_dict(include_self_link=include_self_link)
+    assert "links" not in lazy_item.__dict__
+    assert d == Item.from_dict(sample_item_dict).to_dict(
+        include_self_link=include_self_link
+    )
+    assert lazy_item.__geo_interface__ == Item.from_dict(sample_item_dict).to_dict(
+        include_self_link=False
+    )
+
+
+def test_lazy_item_to_dict_windows_hrefs() -> None:
+    path = TestCases.get_path(
+        "data-files/windows_hrefs/test-collection/test-item/test-item.json"
+    )
+    with open(path) as f:
+        item_dict = json.load(f)
+    lazy_item = pystac.LazyItem.from_dict(item_dict)
+    d = lazy_item.to_dict()
+    assert "links" not in lazy_item.__dict__
+    assert "assets" not in lazy_item.__dict__
+    assert d == Item.from_dict(item_dict).to_dict()
+    assert d["links"][0]["href"] == "../../catalog.json"
+    assert d["assets"]["test-asset"]["href"] == "./test-asset.txt"
+    assert pystac.LazyItem.from_dict(d).to_dict() == d
+    # The dict the item was read from is not modified
+    assert item_dict["links"][0]["href"] == "..\\..\\catalog.json"
+
+
+def test_lazy_item_from_file() -> None:
+    path = TestCases.get_path("data-files/item/sample-item.json")
+    lazy_item = pystac.LazyItem.from_file(path)
+    item = Item.from_file(path)
+
+    assert isinstance(lazy_item, pystac.LazyItem)
+    assert lazy_item.get_self_href() == item.get_self_href()
+    assert [link.rel for link in lazy_item.links] == [link.rel for link in item.links]
+    assert lazy_item.to_dict() == item.to_dict()
+    assert lazy_item.assets["analytic"].get_absolute_href() == (
+        item.assets["analytic"].get_absolute_href()
+    )
+
+
+def test_lazy_item_modified(sample_item_dict: dict[str, Any]) -> None:
+    item = pystac.LazyItem.from_dict(sample_item_dict)
+    item.datetime = None
+    item.common_metadata.start_datetime = str_to_datetime("2016-05-01T00:00:00Z")
+    item.common_metadata.end_datetime = str_to_datetime("2016-05-02T00:00:00Z")
+    item.add_asset("new", Asset("./new.tif"))
+    item.links = []
+
+    d = item.to_dict()
+    assert d["properties"]["datetime"] is None
+    assert d["links"] == []
+    assert set(d["assets"]) == {*sample_item_dict["assets"], "new"}
+
+
+def test_lazy_item_set_root(sample_item_dict: dict[str, Any]) -> None:
+    catalog = pystac.Catalog(id="test", description="test desc")
+    item = pystac.LazyItem.from_dict(sample_item_dict, root=catalog)
+    assert item.get_root() is catalog
+
+
+def test_lazy_item_clone_and_pickle(sample_item_dict: dict[str, Any]) -> None:
+    item = pystac.LazyItem.from_dict(sample_item_dict)
+    expected = item.to_dict()
+
+    clone = item.clone()
+    assert isinstance(clone, pystac.LazyItem)
+    assert clone.to_dict() == expected
+
+    unpickled = pickle.loads(pickle.dumps(pystac.LazyItem.from_dict(sample_item_dict)))
+    assert unpickled.to_dict() == expected
+    assert copy.deepcopy(item).to_dict() == expected
+
+
+def test_lazy_item_from_invalid_dict_raises_useful_error() -> None:
+    item_dict = {"type": "Feature", "stac_version": "1.1.0", "id": "lalalalala"}
+    with pytest.raises(pystac.STACError, match="Invalid Item: "):
+        pystac.LazyItem.from_dict(item_dict)
@@ -1,6 +1,8 @@
 import json
+from collections.abc import Iterator
 from copy import deepcopy
 from os.path import relpath
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
@@ -204,3 +206,99 @@ def test_to_dict_does_not_read_root_link_of_items() -> None:
         item_collection.to_dict()
 
         assert mock_stac_io.mock.read_text.call_count == 1
+
+
+def test_write_ndjson_and_iter_file(
+    item_collection_dict: dict[str, Any], tmp_path: Path
+) -> None:
+    item_collection = ItemCollection.from_dict(item_collection_dict)
+    path = tmp_path / "items.ndjson"
+    ItemCollection.write_ndjson(path, item_collection)
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == len(item_collection)
+    assert json.loads(lines[0])["id"] == item_collection[0].id
+
+    items = ItemCollection.iter_file(str(path))
+    assert isinstance(items, Iterator)
+    assert [item.to_dict(transform_hrefs=False) for item in items] == [
+        item.to_dict(transform_hrefs=False) for item in item_collection
+    ]
+
+
+def test_write_ndjson_consumes_items_lazily(
+    item_collection_dict: dict[str, Any], tmp_path: Path
+) -> None:
+    path = tmp_path / "items.ndjson"
+    features = item_collection_dict["features"] * 50
+    sizes = []
+
+    def generate() -> Iterator[dict[str, Any]]:
+        for feature in features:
+            sizes.append(path.stat().st_size)
+            yield feature
+
+    ItemCollection.write_ndjson(path, generate())
+    # Items were written while later items were still being produced
+    assert sizes[-1] > 0
+    assert len(list(ItemCollection.iter_file(str(path)))) == len(features)
+
+
+def test_iter_file_with_read_text_only_stac_io(
+    item_collection_dict: dict[str, Any],
+) -> None:
+    features = item_collection_dict["features"]
+
+    class TextStacIO(StacIO):
+        def read_text(self, source: Any, *args: Any, **kwargs: Any) -> str:
+            return "\n".join(json.dumps(f) for f in features) + "\n\n"
+
+        def write_text(self, dest: Any, txt: str, *args: Any, **kwargs: Any) -> None:
+            raise NotImplementedError
+
+    items = list(ItemCollection.iter_file("/items.ndjson", stac_io=TextStacIO()))
+    assert [item.id for item in items] == [f["id"] for f in features]
+
+
+def test_ndjson_with_default_stac_io_overriding_text_methods(
+    item_collection_dict: dict[str, Any],
+) -> None:
+    files: dict[str, str] = {}
+
+    class MemoryStacIO(pystac.stac_io.DefaultStacIO):
+        def read_text(self, source: Any, *args: Any, **kwargs: Any) -> str:
+            return files[str(source)]
+
+        def write_text(self, dest: Any, txt: str, *args: Any, **kwargs: Any) -> None:
+            files[str(dest)] = txt
+
+    item_collection = ItemCollection.from_dict(item_collection_dict)
+    stac_io = MemoryStacIO()
+    ItemCollection.write_ndjson(
+        "s3://bucket/items.ndjson", item_collection, stac_io=stac_io
+    )
+    assert len(files["s3://bucket/items.ndjson"].splitlines()) == len(item_collection)
+
+    items = ItemCollection.iter_file("s3://bucket/items.ndjson", stac_io=stac_io)
+    assert [item.id for item in items] == [item.id for item in item_collection]
+
+
+def test_ndjson_with_default_stac_io_overriding_href_methods(
+    item_collection_dict: dict[str, Any],
+) -> None:
+    files: dict[str, str] = {}
+
+    class MemoryStacIO(pystac.stac_io.DefaultStacIO):
+        def read_text_from_href(self, href: str) -> str:
+            return files[href]
+
+        def write_text_to_href(self, href: str, txt: str) -> None:
+            files[href] = txt
+
+    item_collection = ItemCollection.from_dict(item_collection_dict)
+    stac_io = MemoryStacIO()
+    ItemCollection.write_ndjson(
+        "s3://bucket/items.ndjson", item_collection, stac_io=stac_io
+    )
+    items = ItemCollection.iter_file("s3://bucket/items.ndjson", stac_io=stac_io)
+    assert [item.id for item in items] == [item.id for item in item_collection]
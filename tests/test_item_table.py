@@ -0,0 +1,216 @@
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from pystac import Extent, Item, ItemCollection
+from pystac.spatial_index import SpatialIndexEntry
+from tests.utils import TestCases
+
+np = pytest.importorskip("numpy")
+
+from pystac.item_table import ItemTable  # noqa: E402
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+ITEM_COLLECTION = TestCases.get_path(
+    "data-files/item-collection/sample-item-collection.json"
+)
+
+
+def make_item(
+    id: str,
+    bbox: list[float] | None,
+    dt: datetime | None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    properties: dict[str, Any] | None = None,
+    collection: str | None = None,
+) -> Item:
+    item = Item(
+        id,
+        geometry=None if bbox is None else {"type": "Point", "coordinates": bbox[:2]},
+        bbox=bbox,
+        datetime=START,
+        properties=properties or {},
+        collection=collection,
+    )
+    item.datetime = dt
+    item.common_metadata.start_datetime = start
+    item.common_metadata.end_datetime = end
+    return item
+
+
+@pytest.fixture
+def random_items() -> list[Item]:
+    rng = random.Random(42)
+    items = []
+    for i in range(500):
+        x, y = rng.uniform(-180, 170), rng.uniform(-90, 80)
+        bbox: list[float] | None = [x, y, x + rng.uniform(0, 10), y + rng.uniform(0, 9)]
+        if i % 50 == 0:
+            bbox = None
+        elif i % 50 == 1:
+            bbox = [175.0, y, -175.0, y + 1]
+        start = START + timedelta(hours=rng.uniform(0, 24 * 365))
+        properties = {"eo:cloud_cover": rng.uniform(0, 100)} if i % 3 else {}
+        collection = rng.choice(["a", "b", None])
+        if i % 2:
+            items.append(
+                make_item(f"item-{i}", bbox, start, None, None, properties, collection)
+            )
+        else:
+            end = start + timedelta(hours=rng.uniform(0, 24 * 60))
+            items.append(
+                make_item(f"item-{i}", bbox, None, start, end, properties, collection)
+            )
+    return items
+
+
+def test_from_items_columns(random_items: list[Item]) -> None:
+    table = ItemTable.from_items(random_items, properties=["eo:cloud_cover"])
+
+    assert len(table) == len(random_items)
+    assert table.ids.tolist() == [item.id for item in random_items]
+    assert table.collection_ids.tolist() == [
+        item.collection_id for item in random_items
+    ]
+    assert table.bboxes.shape == (len(random_items), 4)
+    assert np.isnan(table.bboxes[0]).all()
+    assert table.bboxes[2].tolist() == random_items[2].bbox
+    assert table.datetimes.dtype == np.dtype("datetime64[us]")
+    assert np.isnat(table.datetimes[0])
+    dt = random_items[1].datetime
+    assert dt is not None
+    assert table.datetimes[1].item() == dt.replace(tzinfo=None)
+    cloud_cover = table.properties["eo:cloud_cover"]
+    assert cloud_cover.dtype == np.float64
+    assert np.isnan(cloud_cover[0])
+    assert cloud_cover[1] == random_items[1].properties["eo:cloud_cover"]
+
+
+def test_from_dicts_matches_from_items(random_items: list[Item]) -> None:
+    from_items = ItemTable.from_items(random_items, properties=["eo:cloud_cover"])
+    from_dicts = ItemTable.from_items(
+        [item.to_dict() for item in random_items], properties=["eo:cloud_cover"]
+    )
+    for name in ("id", "collection", "datetime", "start_datetime", "end_datetime"):
+        np.testing.assert_array_equal(from_items.column(name), from_dicts.column(name))
+    np.testing.assert_array_equal(from_items.bboxes, from_dicts.bboxes)
+    np.testing.assert_array_equal(
+        from_items.properties["eo:cloud_cover"],
+        from_dicts.properties["eo:cloud_cover"],
+    )
+
+
+def test_filter_matches_entries(random_items: list[Item]) -> None:
+    table = ItemTable.from_items(random_items)
+    rng = random.Random(0)
+    for _ in range(50):
+        x = rng.uniform(-190, 180)
+        y = rng.uniform(-90, 80)
+        bbox = [x, y, x + rng.uniform(0, 40), y + rng.uniform(0, 20)]
+        start = START + timedelta(hours=rng.uniform(-24 * 30, 24 * 400))
+        for query in (
+            {"bbox": bbox},
+            {"datetime": start},
+            {"datetime": (start, start + timedelta(days=10))},
+            {"datetime": (None, start)},
+            {"bbox": [170.0, -90.0, -170.0, 90.0], "datetime": (start, None)},
+        ):
+            expected = [
+                item.id
+                for item in random_items
+                if SpatialIndexEntry.from_item(item).matches(**query)
+            ]
+            assert table.filter(**query).ids.tolist() == expected
+
+
+def test_filter_with_interval_string(random_items: list[Item]) -> None:
+    table = ItemTable.from_items(random_items)
+    query = "2020-03-01T00:00:00Z/.."
+    expected = ItemCollection(random_items, clone_items=False).filter(datetime=query)
+    assert table.filter(datetime=query).to_items() == expected.items
+
+
+def test_3d_bbox() -> None:
+    item = make_item("3d", [0, 0, -10, 1, 1, 10], START)
+    table = ItemTable.from_items([item])
+    assert table.bboxes.tolist() == [[0, 0, 1, 1]]
+    assert len(table.filter(bbox=[0.5, 0.5, 2, 2])) == 1
+
+
+def test_take_with_mask(random_items: list[Item]) -> None:
+    table = ItemTable.from_items(random_items, properties=["eo:cloud_cover"])
+    cloud_cover = table.properties["eo:cloud_cover"]
+    clear = table.take(cloud_cover < 10)
+    assert clear.ids.tolist() == [
+        item.id
+        for item in random_items
+        if item.properties.get("eo:cloud_cover", 100) < 10
+    ]
+    assert (clear.properties["eo:cloud_cover"] < 10).all()
+
+
+def test_sort(random_items: list[Item]) -> None:
+    table = ItemTable.from_items(random_items, properties=["eo:cloud_cover"])
+
+    by_datetime = table.sort("datetime")
+    datetimes = by_datetime.datetimes[~np.isnat(by_datetime.datetimes)]
+    assert (np.diff(datetimes.view(np.int64)) >= 0).all()
+    assert np.isnat(by_datetime.datetimes[len(datetimes) :]).all()
+
+    by_id = table.sort("id", reverse=True)
+    assert by_id.ids.tolist() == sorted(table.ids.tolist(), reverse=True)
+
+    by_collection = table.sort("collection")
+    collections = by_collection.collection_ids.tolist()
+    assert collections == sorted(collections, key=lambda c: (c is None, c))
+
+
+def test_groupby(random_items: list[Item]) -> None:
+    table = ItemTable.from_items(random_items)
+    groups = table.groupby("collection")
+    assert list(groups) == ["a", "b", None]
+    for key, group in groups.items():
+        assert group.ids.tolist() == [
+            item.id for item in random_items if item.collection_id == key
+        ]
+
+
+def test_extent_matches_extent_from_items(random_items: list[Item]) -> None:
+    table = ItemTable.from_items(random_items)
+    assert table.extent().to_dict() == Extent.from_items(random_items).to_dict()
+
+
+def test_to_items_from_dicts() -> None:
+    with open(ITEM_COLLECTION) as f:
+        d = json.load(f)
+    table = ItemTable.from_items(d["features"])
+    items = table.to_items()
+    assert [item.id for item in items] == [f["id"] for f in d["features"]]
+    assert [item.to_dict(transform_hrefs=False) for item in items] == [
+        Item.from_dict(f).to_dict(transform_hrefs=False) for f in d["features"]
+    ]
+    assert isinstance(table.to_item_collection(), ItemCollection)
+
+
+def test_item_collection_to_table() -> None:
+    item_collection = ItemCollection.from_file(ITEM_COLLECTION)
+    table = item_collection.to_table(properties=["eo:cloud_cover"])
+    assert len(table) == len(item_collection)
+    assert table.to_items() == item_collection.items
+
+
+def test_empty() -> None:
+    table = ItemTable.from_items([])
+    assert len(table) == 0
+    assert len(table.filter(bbox=[0, 0, 1, 1], datetime=START)) == 0
+    assert table.groupby("id") == {}
+
+
+def test_mismatched_columns() -> None:
+    with pytest.raises(ValueError, match="'id'"):
+        ItemTable([], ["a"], [], [], [], [], [])
@@ -10,8 +10,9 @@ import pytest
 import pystac
 from pystac import Collection, Item, Link
 from pystac.errors import STACError
-from pystac.link import HIERARCHICAL_LINKS
+from pystac.link import HIERARCHICAL_LINKS, _href_context_scope, _LinkList
 from pystac.utils import make_posix_style
+from tests.utils import TestCases
 from tests.utils.test_cases import ARBITRARY_EXTENT
 
 TEST_DATETIME: datetime = datetime(2020, 3, 14, 16, 32)
@@ -343,3 +344,68 @@ def test_item_link_type(item: Item) -> None:
     # https://github.com/stac-utils/pystac/issues/1494
     link = Link.item(item)
     assert link.media_type == "application/geo+json"
+
+
+def test_links_by_rel_index_stays_in_sync(item: Item) -> None:
+    assert isinstance(item.links, _LinkList)
+    assert item.get_links("via") == []
+
+    via = Link("via", "http://example.com/via.json")
+    item.add_link(via)
+    assert item.get_links("via") == [via]
+
+    item.links += [Link("via", "http://example.com/other.json")]
+    assert len(item.get_links("via")) == 2
+
+    item.links.remove(via)
+    assert [link.get_href() for link in item.get_links("via")] == [
+        "http://example.com/other.json"
+    ]
+
+    alternate = Link("alternate", "http://example.com/alternate.json")
+    item.links[item.links.index(item.get_links("via")[0])] = alternate
+    assert item.get_links("via") == []
+    assert item.get_single_link(pystac.RelType.ALTERNATE) is alternate
+
+    item.links = [via]
+    assert isinstance(item.links, _LinkList)
+    assert item.get_single_link("via") is via
+    assert item.get_self_href() is None
+
+    item.clear_links("via")
+    assert item.get_single_link("via") is None
+
+
+def test_links_by_rel_index_survives_copy_and_pickle(item: Item) -> None:
+    import copy
+    import pickle
+
+    item.set_self_href("http://example.com/item.json")
+    assert item.get_self_href() == "http://example.com/item.json"
+
+    for copied in [copy.deepcopy(item), item.clone(), pickle.loads(pickle.dumps(item))]:
+        assert isinstance(copied.links, _LinkList)
+        assert copied.get_self_href() == "http://example.com/item.json"
+        self_link = copied.get_single_link("self")
+        assert self_link is not None
+        assert self_link in copied.links
+        assert len(copied.get_links("self")) == 1
+
+
+def test_href_context_scope_matches_uncached_hrefs() -> None:
+    catalog = TestCases.case_1()
+    catalog.normalize_hrefs("http://example.com/catalog")
+    catalog.catalog_type = pystac.CatalogType.SELF_CONTAINED
+    objects: list[pystac.STACObject] = [catalog]
+    for _, children, items in catalog.walk():
+        objects.extend(children)
+        objects.extend(items)
+
+    links = [link for obj in objects for link in obj.links]
+    expected = [link.get_href() for link in links]
+    with _href_context_scope() as context:
+        with _href_context_scope() as nested:
+            assert nested is context
+        assert [link.get_href() for link in links] == expected
+        assert set(context.roots.values()) == {catalog}
+    assert any(href and href.startswith("./") for href in expected)
@@ -0,0 +1,202 @@
+import json
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pystac import Item, ItemCollection, STACError
+from pystac.spatial_index import SpatialIndexEntry
+from tests.utils import TestCases
+
+pytest.importorskip("pyarrow")
+
+import pyarrow.parquet as pq  # noqa: E402
+
+from pystac import parquet  # noqa: E402
+
+ITEM_COLLECTION = TestCases.get_path(
+    "data-files/item-collection/sample-item-collection.json"
+)
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def make_item(i: int) -> Item:
+    x, y = -180 + (i * 7) % 350, -80 + (i * 3) % 160
+    return Item(
+        f"item-{i}",
+        geometry={
+            "type": "Polygon",
+            "coordinates": [[[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]]],
+        },
+        bbox=[x, y, x + 1, y + 1],
+        datetime=START + timedelta(days=i),
+        properties={"eo:cloud_cover": i % 100},
+    )
+
+
+@pytest.fixture
+def item_collection() -> ItemCollection:
+    return ItemCollection.from_file(ITEM_COLLECTION)
+
+
+def test_round_trip(item_collection: ItemCollection, tmp_path: Path) -> None:
+    path = tmp_path / "items.parquet"
+    parquet.write_items(path, item_collection)
+
+    items = list(parquet.read_items(path))
+    assert len(items) == len(item_collection)
+    for item, expected in zip(items, item_collection):
+        d = item.to_dict(transform_hrefs=False)
+        expected_d = expected.to_dict(transform_hrefs=False)
+        # Datetimes are written as timestamps and may be formatted differently
+        properties = d.pop("properties")
+        expected_properties = expected_d.pop("properties")
+        assert d == expected_d
+        assert properties.keys() == expected_properties.keys()
+        assert item.datetime == expected.datetime
+        for name in ("start_datetime", "end_datetime"):
+            assert getattr(item.common_metadata, name) == getattr(
+                expected.common_metadata, name
+            )
+
+
+def test_layout(item_collection: ItemCollection, tmp_path: Path) -> None:
+    path = tmp_path / "items.parquet"
+    parquet.write_items(path, item_collection)
+
+    schema = pq.read_schema(path)
+    for name in ("type", "stac_version", "id", "geometry", "bbox", "links", "assets"):
+        assert name in schema.names
+    assert "properties" not in schema.names
+    assert "eo:cloud_cover" in schema.names
+    assert str(schema.field("datetime").type) == "timestamp[us, tz=UTC]"
+    assert schema.field("bbox").type.names == ["xmin", "ymin", "xmax", "ymax"]
+
+    assert schema.metadata is not None
+    geo = json.loads(schema.metadata[b"geo"])
+    assert geo["primary_column"] == "geometry"
+    assert geo["columns"]["geometry"]["encoding"] == "WKB"
+    stac_geoparquet = json.loads(schema.metadata[b"stac-geoparquet"])
+    assert stac_geoparquet["version"] == parquet.STAC_GEOPARQUET_VERSION
+
+
+def test_write_generator_in_row_groups(tmp_path: Path) -> None:
+    path = tmp_path / "items.parquet"
+    parquet.write_items(path, (make_item(i) for i in range(100)), row_group_size=10)
+
+    assert pq.ParquetFile(path).metadata.num_row_groups == 10
+    assert [item.id for item in parquet.read_items(path)] == [
+        f"item-{i}" for i in range(100)
+    ]
+
+
+def test_write_generator_with_new_field_raises(tmp_path: Path) -> None:
+    def generate() -> Iterator[Item]:
+        for i in range(20):
+            item = make_item(i)
+            if i == 15:
+                item.properties["new"] = "value"
+            yield item
+
+    with pytest.raises(STACError, match="infer_schema"):
+        parquet.write_items(tmp_path / "items.parquet", generate(), row_group_size=10)
+
+    items = [make_item(i) for i in range(20)]
+    items[15].properties["new"] = "value"
+    schema = parquet.infer_schema(items)
+    parquet.write_items(
+        tmp_path / "items.parquet", iter(items), schema=schema, row_group_size=10
+    )
+    read = list(parquet.read_items(tmp_path / "items.parquet"))
+    assert read[15].properties["new"] == "value"
+    assert "new" not in read[14].properties
+
+
+def test_read_columns(item_collection: ItemCollection, tmp_path: Path) -> None:
+    path = tmp_path / "items.parquet"
+    parquet.write_items(path, item_collection)
+
+    items = list(parquet.read_items(path, columns=["eo:cloud_cover"]))
+    assert [item.id for item in items] == [item.id for item in item_collection]
+    assert items[0].geometry is None
+    assert items[0].assets == {}
+    assert items[0].datetime == item_collection[0].datetime
+    assert set(items[0].properties) == {
+        "datetime",
+        "start_datetime",
+        "end_datetime",
+        "eo:cloud_cover",
+    }
+
+
+def test_read_filters(tmp_path: Path) -> None:
+    items = [make_item(i) for i in range(200)]
+    path = tmp_path / "items.parquet"
+    parquet.write_items(path, items, row_group_size=20)
+
+    for query in (
+        {"datetime": (START + timedelta(days=30), START + timedelta(days=45))},
+        {"datetime": "2020-06-01T00:00:00Z/.."},
+        {"bbox": [0, 0, 50, 50]},
+        {"bbox": [170, -90, -170, 90], "datetime": (None, START + timedelta(days=90))},
+    ):
+        expected = [
+            item.id
+            for item in items
+            if SpatialIndexEntry.from_item(item).matches(**query)
+        ]
+        assert [item.id for item in parquet.read_items(path, **query)] == expected
+
+
+def test_row_groups_are_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "items.parquet"
+    parquet.write_items(path, [make_item(i) for i in range(200)], row_group_size=20)
+
+    metadata = pq.ParquetFile(path).metadata
+    query = (START + timedelta(days=30), START + timedelta(days=45))
+    matching = [
+        i
+        for i in range(metadata.num_row_groups)
+        if parquet._may_match(metadata.row_group(i), None, query)
+    ]
+    assert matching == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        {"type": "Point", "coordinates": [1.5, -2.0]},
+        {"type": "Point", "coordinates": [1.5, -2.0, 3.0]},
+        {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+        {
+            "type": "Polygon",
+            "coordinates": [
+                [[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 0.0]],
+                [[1.0, 1.0], [2.0, 1.0], [2.0, 2.0], [1.0, 1.0]],
+            ],
+        },
+        {"type": "MultiPoint", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+        {"type": "MultiLineString", "coordinates": [[[0.0, 0.0], [1.0, 1.0]]]},
+        {
+            "type": "MultiPolygon",
+            "coordinates": [[[[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [0.0, 0.0, 1.0]]]],
+        },
+        {
+            "type": "GeometryCollection",
+            "geometries": [
+                {"type": "Point", "coordinates": [0.0, 0.0]},
+                {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+            ],
+        },
+    ],
+)
+def test_wkb_round_trip(geometry: dict[str, Any]) -> None:
+    assert parquet._from_wkb(parquet._to_wkb(geometry)) == geometry
+
+
+def test_wkb_big_endian() -> None:
+    wkb = bytes.fromhex("00000000013ff00000000000004000000000000000")
+    assert parquet._from_wkb(wkb) == {"type": "Point", "coordinates": [1.0, 2.0]}
@@ -0,0 +1,232 @@
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+import pystac
+from pystac import Catalog, Item, ItemCollection, STACError
+from pystac.spatial_index import SpatialIndex, SpatialIndexEntry
+from tests.utils import TestCases
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def make_item(id: str, bbox: list[float] | None, dt: datetime) -> Item:
+    return Item(id, geometry=None, bbox=bbox, datetime=dt, properties={})
+
+
+@pytest.fixture
+def random_items() -> list[Item]:
+    rng = random.Random(42)
+    items = []
+    for i in range(500):
+        x = rng.uniform(-180, 170)
+        y = rng.uniform(-90, 80)
+        bbox = [x, y, x + rng.uniform(0, 10), y + rng.uniform(0, 10)]
+        items.append(make_item(f"item-{i}", bbox, START + timedelta(days=i)))
+    return items
+
+
+@pytest.mark.parametrize("node_capacity", [2, 4, 16])
+def test_search_matches_brute_force(
+    random_items: list[Item], node_capacity: int
+) -> None:
+    index = SpatialIndex.from_items(random_items, node_capacity=node_capacity)
+    rng = random.Random(0)
+    for _ in range(50):
+        x = rng.uniform(-180, 150)
+        y = rng.uniform(-90, 60)
+        bbox = [x, y, x + 30, y + 30]
+        expected = [
+            item
+            for item in random_items
+            if SpatialIndexEntry.from_item(item).matches(bbox=bbox)
+        ]
+        assert index.search(bbox=bbox) == expected
+
+
+def test_search_without_bbox_returns_all_in_order(random_items: list[Item]) -> None:
+    index = SpatialIndex.from_items(random_items)
+    assert index.search() == random_items
+
+
+def test_search_antimeridian() -> None:
+    east = make_item("east", [170, 0, 179, 10], START)
+    west = make_item("west", [-179, 0, -170, 10], START)
+    middle = make_item("middle", [0, 0, 10, 10], START)
+    crossing = make_item("crossing", [175, 20, -175, 30], START)
+    index = SpatialIndex.from_items([east, west, middle, crossing])
+
+    assert index.search(bbox=[178, -5, -178, 40]) == [east, west, crossing]
+    assert index.search(bbox=[-176, 25, -174, 26]) == [crossing]
+    assert index.search(bbox=[-10, -10, 5, 5]) == [middle]
+
+
+def test_search_3d_bbox() -> None:
+    item = make_item("3d", [0, 0, -100, 10, 10, 100], START)
+    index = SpatialIndex.from_items([item])
+    assert index.search(bbox=[5, 5, 0, 6, 6, 1]) == [item]
+    assert index.search(bbox=[20, 20, 30, 30]) == []
+
+
+def test_search_item_without_bbox() -> None:
+    item = make_item("no-bbox", None, START)
+    index = SpatialIndex.from_items([item])
+    assert index.search() == [item]
+    assert index.search(bbox=[-180, -90, 180, 90]) == []
+
+
+def test_search_datetime() -> None:
+    instant = make_item("instant", [0, 0, 1, 1], START)
+    ranged = make_item("ranged", [0, 0, 1, 1], START)
+    ranged.datetime = None
+    ranged.common_metadata.start_datetime = START + timedelta(days=10)
+    ranged.common_metadata.end_datetime = START + timedelta(days=20)
+    index = SpatialIndex.from_items([instant, ranged])
+
+    assert index.search(datetime=START) == [instant]
+    assert index.search(datetime=START + timedelta(days=15)) == [ranged]
+    assert index.search(datetime=(START, START + timedelta(days=10))) == [
+        instant,
+        ranged,
+    ]
+    assert index.search(datetime="2020-01-05T00:00:00Z/..") == [ranged]
+    assert index.search(datetime="../2020-01-05T00:00:00Z") == [instant]
+    assert index.search(datetime=(None, None)) == [instant, ranged]
+    # Naive datetimes are treated as UTC
+    assert index.search(datetime=datetime(2020, 1, 1)) == [instant]
+
+
+def test_save_and_from_file(tmp_path: Path, random_items: list[Item]) -> None:
+    catalog = Catalog("test", "test")
+    catalog.add_items(random_items)
+    catalog.normalize_hrefs(str(tmp_path / "catalog"))
+    catalog.save(catalog_type=pystac.CatalogType.SELF_CONTAINED)
+
+    index = catalog.build_spatial_index()
+    index_href = str(tmp_path / "catalog" / "spatial-index.json")
+    index.save(index_href)
+    saved = pystac.StacIO.default().read_json(index_href)
+    assert saved["entries"][0]["href"] == "./item-0/item-0.json"
+
+    read_index = SpatialIndex.from_file(index_href)
+    assert len(read_index) == len(index)
+    bbox = [0, 0, 40, 40]
+    expected = [item.get_self_href() for item in index.search(bbox=bbox)]  # type: ignore[union-attr]
+    assert expected
+    assert read_index.search(bbox=bbox) == expected
+
+    read_catalog = Catalog.from_file(catalog.get_self_href())  # type: ignore[arg-type]
+    found = list(read_catalog.search(bbox=bbox, index=read_index))
+    assert [item.id for item in found] == [
+        item.id  # type: ignore[union-attr]
+        for item in index.search(bbox=bbox)
+    ]
+    assert all(item.get_root() is read_catalog for item in found)
+
+    # Items read for a search are resolved from their parent's links
+    resolved = [
+        link.target for link in read_catalog.get_item_links() if link.is_resolved()
+    ]
+    assert {id(item) for item in resolved} == {id(item) for item in found}
+    again = list(read_catalog.search(bbox=bbox, index=read_index))
+    assert all(a is b for a, b in zip(again, found))
+    items = {item.id: item for item in read_catalog.get_items()}
+    assert all(items[item.id] is item for item in found)
+    assert all(item.get_parent() is read_catalog for item in found)
+
+
+def test_search_reuses_item_link_index(
+    tmp_path: Path, random_items: list[Item]
+) -> None:
+    catalog = Catalog("test", "test")
+    catalog.add_items(random_items)
+    catalog.normalize_hrefs(str(tmp_path / "catalog"))
+    catalog.save(catalog_type=pystac.CatalogType.SELF_CONTAINED)
+    index_href = str(tmp_path / "catalog" / "spatial-index.json")
+    catalog.build_spatial_index().save(index_href)
+    index = SpatialIndex.from_file(index_href)
+
+    read_catalog = Catalog.from_file(catalog.get_self_href())  # type: ignore[arg-type]
+    first = list(read_catalog.search(bbox=[0, 0, 40, 40], index=index))
+    item_link_index = read_catalog._item_link_index
+    assert item_link_index is not None
+    second = list(read_catalog.search(bbox=[-100, -60, -60, -20], index=index))
+    assert first and second
+    assert read_catalog._item_link_index is item_link_index
+    resolved = [
+        link.target for link in read_catalog.get_item_links() if link.is_resolved()
+    ]
+    assert {id(item) for item in resolved} == {id(item) for item in first + second}
+
+    # The index is rebuilt once the item links change
+    new_item = make_item("new", [175, 85, 176, 86], START)
+    catalog.add_item(new_item)
+    catalog.normalize_hrefs(str(tmp_path / "catalog"))
+    catalog.save(catalog_type=pystac.CatalogType.SELF_CONTAINED)
+    catalog.build_spatial_index().save(index_href)
+    read_catalog.add_link(
+        pystac.Link(
+            pystac.RelType.ITEM,
+            new_item.get_self_href(),  # type: ignore[arg-type]
+            media_type=pystac.MediaType.JSON,
+        )
+    )
+    found = list(
+        read_catalog.search(
+            bbox=[175, 85, 176, 86], index=SpatialIndex.from_file(index_href)
+        )
+    )
+    assert [item.id for item in found] == ["new"]
+    assert read_catalog._item_link_index is not item_link_index
+    assert read_catalog.get_item_links()[-1].target is found[0]
+
+
+def test_to_dict_requires_self_href() -> None:
+    index = SpatialIndex.from_items([make_item("a", [0, 0, 1, 1], START)])
+    with pytest.raises(STACError):
+        index.to_dict()
+
+
+def test_from_dict_checks_type() -> None:
+    with pytest.raises(STACError):
+        SpatialIndex.from_dict({"type": "FeatureCollection", "entries": []})
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_catalog_search(use_index: bool) -> None:
+    catalog = TestCases.case_1()
+    items = list(catalog.get_items(recursive=True))
+    bbox = items[0].bbox
+    assert bbox is not None
+    index = catalog.build_spatial_index() if use_index else None
+
+    found = list(catalog.search(bbox=bbox, index=index))
+    assert items[0] in found
+    assert found == [
+        item for item in items if SpatialIndexEntry.from_item(item).matches(bbox=bbox)
+    ]
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_item_collection_filter(random_items: list[Item], use_index: bool) -> None:
+    item_collection = ItemCollection(random_items, clone_items=False)
+    index = SpatialIndex.from_items(random_items) if use_index else None
+    bbox = [0, 0, 40, 40]
+    interval = (START, START + timedelta(days=250))
+
+    filtered = item_collection.filter(bbox=bbox, datetime=interval, index=index)
+    expected = [
+        item
+        for item in random_items
+        if SpatialIndexEntry.from_item(item).matches(bbox=bbox, datetime=interval)
+    ]
+    assert expected
+    assert filtered.items == expected
+
+
+def test_item_collection_filter_requires_item_index() -> None:
+    index = SpatialIndex([SpatialIndexEntry("./item.json", [0, 0, 1, 1], START, START)])
+    with pytest.raises(STACError):
+        ItemCollection([]).filter(index=index)
@@ -1,15 +1,22 @@
 import json
 import os
 import tempfile
+import threading
 import unittest
 from pathlib import Path
+from typing import Any
 
 import pytest
 from pytest import MonkeyPatch
 
 import pystac
-from pystac.stac_io import DefaultStacIO, DuplicateKeyReportingMixin, StacIO
-from tests.utils import TestCases
+from pystac.stac_io import (
+    DefaultStacIO,
+    DuplicateKeyReportingMixin,
+    JSONProfile,
+    StacIO,
+)
+from tests.utils import MockStacIO, TestCases
 
 
 def test_read_write_collection() -> None:
@@ -84,6 +91,37 @@ def test_read_catalog_dict() -> None:
     assert isinstance(catalog, pystac.Catalog)
 
 
+def test_read_json_reads_bytes(monkeypatch: MonkeyPatch) -> None:
+    path = TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    with open(path, encoding="utf-8") as f:
+        expected = json.load(f)
+
+    def fail(*args: object) -> str:
+        raise AssertionError("read_text should not be called")
+
+    stac_io = DefaultStacIO()
+    assert stac_io.read_bytes(path) == Path(path).read_bytes()
+    monkeypatch.setattr(stac_io, "read_text", fail)
+    assert stac_io.read_json(path) == expected
+
+
+def test_read_json_reads_text_if_overridden() -> None:
+    path = TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+
+    class TextStacIO(DefaultStacIO):
+        def read_text_from_href(self, href: str) -> str:
+            return super().read_text_from_href(href).replace("test", "text")
+
+    class TextJSONStacIO(DefaultStacIO):
+        def json_loads(self, txt: str | bytes, *_: Any, **__: Any) -> dict[str, Any]:
+            assert isinstance(txt, str)
+            return super().json_loads(txt)
+
+    assert TextStacIO().read_json(path)["id"] == "text"
+    assert TextJSONStacIO().read_json(path)["id"] == "test"
+    assert MockStacIO().read_json(path)["id"] == "test"
+
+
 def test_read_from_stac_object() -> None:
     catalog = pystac.STACObject.from_file(
         TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
@@ -202,6 +240,12 @@ def test_retry_stac_io_raises_on_429(monkeypatch: MonkeyPatch) -> None:
         headers: dict[str, str] = {}
         data = b'{"error": "Nope!"}'
 
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, *args: object) -> None:
+            pass
+
     def fake_request(
         self: PoolManager, *args: object, **kwargs: object
     ) -> FakeResponse:
@@ -210,7 +254,7 @@ def test_retry_stac_io_raises_on_429(monkeypatch: MonkeyPatch) -> None:
     monkeypatch.setattr(PoolManager, "request", fake_request)
 
     stac_io = RetryStacIO()
-    with pytest.raises(Exception):
+    with pytest.raises(Exception, match="Could not read uri"):
         stac_io.read_text("http://localhost:5000")
 
 
@@ -264,3 +308,150 @@ def test_custom_stac_io() -> None:
     assert link
     link.get_href()
     assert stac_io.calls == 2
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_profile(monkeypatch: MonkeyPatch, use_orjson: bool) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(pystac.stac_io, "orjson", None)
+    json_dict = {"b": [1, 2], "a": {"d": None, "c": "x"}}
+
+    stac_io = DefaultStacIO()
+    assert stac_io.json_profile == JSONProfile.PRETTY
+    assert stac_io.json_dumps(json_dict) == json.dumps(json_dict, indent=2)
+
+    compact = DefaultStacIO(json_profile="compact")
+    assert compact.json_dumps(json_dict) == '{"b":[1,2],"a":{"d":null,"c":"x"}}'
+
+    sorted_ = stac_io.with_json_profile(JSONProfile.SORTED)
+    assert sorted_.json_dumps(json_dict) == json.dumps(
+        json_dict, indent=2, sort_keys=True
+    )
+    assert stac_io.json_profile == JSONProfile.PRETTY
+
+
+def test_with_json_profile_copies_settings() -> None:
+    stac_io = DefaultStacIO(headers={"a": "b"})
+    compact = stac_io.with_json_profile("compact")
+    assert compact is not stac_io
+    assert isinstance(compact, DefaultStacIO)
+    assert compact.headers is stac_io.headers
+    with pytest.raises(ValueError):
+        stac_io.with_json_profile("tiny")
+
+
+def test_pooled_stac_io_reuses_pool_manager(monkeypatch: MonkeyPatch) -> None:
+    pytest.importorskip("urllib3")
+    from urllib3 import PoolManager
+
+    from pystac.stac_io import PooledStacIO
+
+    catalog = pystac.Catalog("an-id", "a description")
+    catalog.add_child(pystac.Catalog("child", "a child"))
+    catalog.normalize_hrefs("http://pystac.test/")
+    bodies = {
+        obj.self_href: json.dumps(obj.to_dict()).encode("utf-8")
+        for obj in [catalog, *catalog.get_children()]
+    }
+    managers: list[PoolManager] = []
+
+    class FakeResponse:
+        status = 200
+        reason = "OK"
+        headers: dict[str, str] = {}
+
+        def __init__(self, data: bytes) -> None:
+            self.data = data
+
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, *_: object) -> None:
+            pass
+
+    def fake_request(
+        self: PoolManager, method: str, url: str, **kwargs: object
+    ) -> FakeResponse:
+        managers.append(self)
+        return FakeResponse(bodies[url])
+
+    monkeypatch.setattr(PoolManager, "request", fake_request)
+
+    with PooledStacIO(maxsize=4) as stac_io:
+        read_catalog = pystac.Catalog.from_file(
+            "http://pystac.test/catalog.json", stac_io=stac_io
+        )
+        assert [child.id for child in read_catalog.get_children()] == ["child"]
+        assert len(managers) == 2
+        assert managers[0] is managers[1]
+        assert managers[0].connection_pool_kw["maxsize"] == 4
+    assert stac_io._pool_manager is None
+
+
+def test_pooled_stac_io_shares_pool_manager_between_threads() -> None:
+    pytest.importorskip("urllib3")
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pystac.stac_io import PooledStacIO
+
+    stac_io = PooledStacIO()
+    barrier = threading.Barrier(8)
+
+    def get_pool_manager(_: int) -> object:
+        barrier.wait()
+        return stac_io._get_pool_manager()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        managers = list(executor.map(get_pool_manager, range(8)))
+    assert all(manager is managers[0] for manager in managers)
+    stac_io.close()
+
+
+def test_pooled_stac_io_with_json_profile_shares_pool_manager() -> None:
+    pytest.importorskip("urllib3")
+    from pystac.stac_io import PooledStacIO
+
+    stac_io = PooledStacIO(maxsize=3)
+    compact = stac_io.with_json_profile("compact")
+    assert isinstance(compact, PooledStacIO)
+    assert compact.json_profile == JSONProfile.COMPACT
+    assert stac_io.json_profile == JSONProfile.PRETTY
+    assert compact.maxsize == 3
+    assert compact._get_pool_manager() is stac_io._get_pool_manager()
+    stac_io.close()
+
+
+def test_pooled_stac_io_pickle() -> None:
+    pytest.importorskip("urllib3")
+    import pickle
+
+    from pystac.stac_io import PooledStacIO
+
+    stac_io = PooledStacIO(headers={"a": "b"}, maxsize=3)
+    stac_io._get_pool_manager()
+    unpickled = pickle.loads(pickle.dumps(stac_io))
+    assert unpickled.headers == {"a": "b"}
+    assert unpickled.maxsize == 3
+    assert unpickled._pool_manager is None
+
+
+def test_default_async_stac_io_round_trip(tmp_path: Path) -> None:
+    import asyncio
+
+    from pystac.stac_io import AsyncStacIO, DefaultAsyncStacIO
+
+    stac_io = AsyncStacIO.default()
+    assert isinstance(stac_io, DefaultAsyncStacIO)
+    item = pystac.Item.from_file(TestCases.get_path("data-files/item/sample-item.json"))
+    dest_href = str(tmp_path / "item.json")
+
+    async def round_trip() -> pystac.STACObject:
+        await stac_io.save_json(dest_href, item.to_dict(include_self_link=False))
+        return await stac_io.read_stac_object(dest_href)
+
+    read_item = asyncio.run(round_trip())
+    assert isinstance(read_item, pystac.Item)
+    assert read_item.id == item.id
+    assert read_item._stac_io is stac_io.stac_io
@@ -0,0 +1,108 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pystac import Item, ItemCollection
+from pystac.spatial_index import SpatialIndexEntry
+from pystac.temporal_index import TemporalIndex
+from tests.utils import TestCases
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def make_item(
+    id: str,
+    dt: datetime | None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> Item:
+    item = Item(id, geometry=None, bbox=[0, 0, 1, 1], datetime=START, properties={})
+    item.datetime = dt
+    item.common_metadata.start_datetime = start
+    item.common_metadata.end_datetime = end
+    return item
+
+
+@pytest.fixture
+def random_items() -> list[Item]:
+    rng = random.Random(42)
+    items = []
+    for i in range(500):
+        start = START + timedelta(hours=rng.uniform(0, 24 * 365))
+        kind = rng.random()
+        if kind < 0.5:
+            items.append(make_item(f"item-{i}", start))
+        elif kind < 0.9:
+            end = start + timedelta(hours=rng.uniform(0, 24 * 60))
+            items.append(make_item(f"item-{i}", None, start, end))
+        else:
+            # Open-ended on one side
+            if rng.random() < 0.5:
+                items.append(make_item(f"item-{i}", None, start, None))
+            else:
+                items.append(make_item(f"item-{i}", None, None, start))
+    return items
+
+
+def test_search_matches_brute_force(random_items: list[Item]) -> None:
+    index = TemporalIndex.from_items(random_items)
+    rng = random.Random(0)
+    queries: list[datetime | tuple[datetime | None, datetime | None]] = []
+    for _ in range(50):
+        start = START + timedelta(hours=rng.uniform(-24 * 30, 24 * 400))
+        queries.append(start)
+        queries.append((start, start + timedelta(hours=rng.uniform(0, 24 * 30))))
+        queries.append((start, None))
+        queries.append((None, start))
+    for query in queries:
+        expected = [
+            item
+            for item in random_items
+            if SpatialIndexEntry.from_item(item).matches(datetime=query)
+        ]
+        assert index.search(datetime=query) == expected
+
+
+def test_search_boundaries_are_inclusive() -> None:
+    item = make_item("ranged", None, START, START + timedelta(days=1))
+    index = TemporalIndex.from_items([item])
+    assert index.search(datetime=START) == [item]
+    assert index.search(datetime=START + timedelta(days=1)) == [item]
+    assert index.search(datetime=(None, START - timedelta(seconds=1))) == []
+    assert index.search(datetime="2020-01-02T00:00:01Z/..") == []
+
+
+def test_search_with_bbox() -> None:
+    inside = make_item("inside", START)
+    outside = make_item("outside", START)
+    outside.bbox = [10, 10, 11, 11]
+    index = TemporalIndex.from_items([inside, outside])
+    assert index.search(bbox=[0, 0, 2, 2], datetime=START) == [inside]
+    assert index.search(bbox=[0, 0, 2, 2]) == [inside]
+
+
+def test_empty_index() -> None:
+    index = TemporalIndex([])
+    assert len(index) == 0
+    assert index.search(datetime=START) == []
+
+
+def test_catalog_search() -> None:
+    catalog = TestCases.case_1()
+    items = list(catalog.get_items(recursive=True))
+    dt = items[0].datetime
+    assert dt is not None
+
+    found = list(catalog.search(datetime=dt, index=catalog.build_temporal_index()))
+    assert items[0] in found
+    assert found == list(catalog.search(datetime=dt))
+
+
+def test_item_collection_filter(random_items: list[Item]) -> None:
+    item_collection = ItemCollection(random_items, clone_items=False)
+    interval = (START + timedelta(days=100), START + timedelta(days=120))
+    filtered = item_collection.filter(
+        datetime=interval, index=TemporalIndex.from_items(random_items)
+    )
+    assert filtered.items == item_collection.filter(datetime=interval).items
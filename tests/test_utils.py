@@ -3,6 +3,7 @@ import os
 import time
 from datetime import datetime, timedelta, timezone
 
+import dateutil.parser
 import pytest
 from dateutil import tz
 
@@ -411,6 +412,32 @@ def test_parse_valid_iso8601_str_to_datetime(datetime: str) -> None:
     assert str_to_datetime(datetime)
 
 
+@pytest.mark.parametrize(
+    "datetime",
+    [
+        "1985-04-12T23:20:50.52Z",
+        "1996-12-19T16:39:57-00:00",
+        "1996-12-19T16:39:57+00:00",
+        "1996-12-19T16:39:57-08:00",
+        "1937-01-01T12:00:27.8710+01:00",
+        "1985-04-12t23:20:50.000z",
+        "1985-04-12 23:20:50Z",
+        "2020-07-23T00:00:00.012345678Z",
+        "2020-12-31T24:00:00Z",
+        "2020-07-23T00:00:00+23:59",
+        "1985-04-12",
+        "1985-12-12T23:20:50.52",
+        "1985-04-12T23:20:50,52Z",
+    ],
+)
+def test_str_to_datetime_matches_dateutil(datetime: str) -> None:
+    expected = dateutil.parser.isoparse(datetime)
+    actual = str_to_datetime(datetime)
+    assert actual == expected
+    assert repr(actual) == repr(expected)
+    assert str_to_datetime(datetime) is actual
+
+
 def test_now_functions() -> None:
     now1 = now_in_utc()
     time.sleep(1)
@@ -0,0 +1,224 @@
+import json
+import pickle
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import pystac
+from pystac.validation import GetSchemaError, JsonSchemaSTACValidator, SchemaCache
+from tests.utils import TestCases
+
+fastjsonschema = pytest.importorskip("fastjsonschema")
+yaml = pytest.importorskip("yaml")
+
+from pystac.validation.compiled_validator import CompiledSTACValidator  # noqa: E402
+
+ITEM_SCHEMA_URI = "https://schemas.stacspec.org/v1.1.0/item-spec/json-schema/item.json"
+EXTENSION_URI = "http://pystac-extensions.test/ext/v1.0.0/schema.json"
+
+DATA_FILES = sorted(Path(TestCases.get_path("data-files")).glob("**/*.json"))
+
+
+@pytest.fixture(scope="module")
+def cassette_schema_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A schema cache holding every schema recorded in the test cassettes."""
+    directory = tmp_path_factory.mktemp("schemas")
+    cache = SchemaCache(directory)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    for path in Path(TestCases.get_path(".")).glob("**/cassettes/**/*.yaml"):
+        with open(path) as f:
+            cassette = yaml.load(f, Loader=loader)
+        for interaction in cassette["interactions"]:
+            if interaction["response"]["status"]["code"] != 200:
+                continue
+            try:
+                schema = json.loads(interaction["response"]["body"]["string"])
+            except ValueError:
+                continue
+            if isinstance(schema, dict) and "$schema" in schema:
+                cache.put(interaction["request"]["uri"], schema)
+    return directory
+
+
+@pytest.fixture(scope="module")
+def validators(
+    cassette_schema_dir: Path,
+) -> tuple[JsonSchemaSTACValidator, CompiledSTACValidator]:
+    return (
+        JsonSchemaSTACValidator(cache_dir=cassette_schema_dir, offline=True),
+        CompiledSTACValidator(cache_dir=cassette_schema_dir, offline=True),
+    )
+
+
+def get_outcome(validator: JsonSchemaSTACValidator, stac_dict: dict[str, Any]) -> str:
+    try:
+        pystac.validation.validate_dict(stac_dict, validator=validator)
+    except pystac.STACValidationError:
+        return "invalid"
+    except GetSchemaError:
+        return "missing schema"
+    except Exception as e:
+        return type(e).__name__
+    return "valid"
+
+
+@pytest.mark.block_network
+@pytest.mark.parametrize(
+    "path", DATA_FILES, ids=lambda p: str(p.relative_to(TestCases.get_path(".")))
+)
+def test_same_results_as_jsonschema(
+    path: Path, validators: tuple[JsonSchemaSTACValidator, CompiledSTACValidator]
+) -> None:
+    with open(path, encoding="utf-8") as f:
+        stac_dict = json.load(f)
+    if not isinstance(stac_dict, dict):
+        pytest.skip("not a JSON object")
+    json_schema_validator, compiled_validator = validators
+    assert get_outcome(compiled_validator, stac_dict) == get_outcome(
+        json_schema_validator, stac_dict
+    )
+
+
+@pytest.mark.block_network
+def test_invalid_object_raises_jsonschema_errors(item: pystac.Item) -> None:
+    validator = CompiledSTACValidator()
+    assert item.validate(validator=validator) == [ITEM_SCHEMA_URI]
+    assert validator._compiled[ITEM_SCHEMA_URI] is not None
+
+    item.properties["gsd"] = -1
+    with pytest.raises(pystac.STACValidationError) as e:
+        item.validate(validator=validator)
+    assert e.value.schema_uri == ITEM_SCHEMA_URI
+    assert e.value.__cause__ is not None
+    assert getattr(e.value.__cause__, "json_path") == "$.properties.gsd"
+
+
+@pytest.mark.block_network
+def test_generated_code_is_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, item: pystac.Item
+) -> None:
+    assert CompiledSTACValidator(code_dir=tmp_path).precompile([ITEM_SCHEMA_URI]) == [
+        ITEM_SCHEMA_URI
+    ]
+    assert len(list(tmp_path.glob("*.py"))) == 1
+
+    def compile_to_code(*args: Any, **kwargs: Any) -> str:
+        raise AssertionError("the generated code should be read from the cache")
+
+    monkeypatch.setattr(fastjsonschema, "compile_to_code", compile_to_code)
+    validator = CompiledSTACValidator(code_dir=tmp_path)
+    item.validate(validator=validator)
+    assert validator._compiled[ITEM_SCHEMA_URI] is not None
+
+
+@pytest.mark.block_network
+def test_code_dir_defaults_to_schema_cache(tmp_path: Path) -> None:
+    assert CompiledSTACValidator().code_dir is None
+    validator = CompiledSTACValidator(cache_dir=tmp_path)
+    assert validator.code_dir == str(tmp_path / "_compiled")
+
+
+@pytest.mark.block_network
+def test_unsupported_schema_falls_back_to_jsonschema(
+    tmp_path: Path, item: pystac.Item
+) -> None:
+    SchemaCache(tmp_path).put(
+        EXTENSION_URI,
+        {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "$id": EXTENSION_URI,
+            "type": "object",
+            "properties": {
+                "properties": {
+                    "type": "object",
+                    "properties": {"ext:value": {"type": "integer"}},
+                }
+            },
+        },
+    )
+    item.stac_extensions.append(EXTENSION_URI)
+    item.properties["ext:value"] = 42
+    validator = CompiledSTACValidator(cache_dir=tmp_path, offline=True)
+
+    item.validate(validator=validator)
+    assert validator._compiled[ITEM_SCHEMA_URI] is not None
+    assert validator._compiled[EXTENSION_URI] is None
+
+    item.properties["ext:value"] = "not an integer"
+    with pytest.raises(pystac.STACValidationError):
+        item.validate(validator=validator)
+
+
+REFERENCED_URI = "http://pystac-extensions.test/ext/v1.0.0/definitions.json"
+
+
+def put_extension_schemas(cache_dir: Path, value_type: str | None) -> None:
+    cache = SchemaCache(cache_dir)
+    cache.put(
+        EXTENSION_URI,
+        {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": EXTENSION_URI,
+            "type": "object",
+            "properties": {"properties": {"$ref": REFERENCED_URI}},
+        },
+    )
+    if value_type is not None:
+        cache.put(
+            REFERENCED_URI,
+            {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "$id": REFERENCED_URI,
+                "type": "object",
+                "properties": {"ext:value": {"type": value_type}},
+            },
+        )
+
+
+@pytest.mark.block_network
+def test_schema_with_missing_reference_is_compiled_once_available(
+    tmp_path: Path,
+) -> None:
+    put_extension_schemas(tmp_path, None)
+    validator = CompiledSTACValidator(cache_dir=tmp_path, offline=True)
+
+    assert validator.precompile([EXTENSION_URI]) == []
+    assert EXTENSION_URI not in validator._compiled
+
+    put_extension_schemas(tmp_path, "integer")
+    assert validator.precompile([EXTENSION_URI]) == [EXTENSION_URI]
+    assert validator._compiled[EXTENSION_URI] is not None
+
+
+@pytest.mark.block_network
+def test_generated_code_is_keyed_on_referenced_schemas(tmp_path: Path) -> None:
+    put_extension_schemas(tmp_path, "integer")
+    validator = CompiledSTACValidator(cache_dir=tmp_path, offline=True)
+    assert validator.precompile([EXTENSION_URI]) == [EXTENSION_URI]
+    code_dir = tmp_path / "_compiled"
+    assert len(list(code_dir.glob("*.py"))) == 1
+
+    put_extension_schemas(tmp_path, "string")
+    validator = CompiledSTACValidator(cache_dir=tmp_path, offline=True)
+    assert validator.precompile([EXTENSION_URI]) == [EXTENSION_URI]
+    assert len(list(code_dir.glob("*.py"))) == 2
+    validate = validator._compiled[EXTENSION_URI]
+    assert validate is not None
+    validate({"properties": {"ext:value": "a string"}})
+    with pytest.raises(fastjsonschema.JsonSchemaValueException):
+        validate({"properties": {"ext:value": 42}})
+
+    # Unchanged schemas are read from the cache
+    validator = CompiledSTACValidator(cache_dir=tmp_path, offline=True)
+    assert validator.precompile([EXTENSION_URI]) == [EXTENSION_URI]
+    assert len(list(code_dir.glob("*.py"))) == 2
+
+
+@pytest.mark.block_network
+def test_pickle(item: pystac.Item) -> None:
+    validator = CompiledSTACValidator()
+    item.validate(validator=validator)
+    unpickled = pickle.loads(pickle.dumps(validator))
+    assert unpickled._compiled == {}
+    item.validate(validator=unpickled)
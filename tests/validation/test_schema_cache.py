@@ -0,0 +1,177 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import pystac
+from pystac.extensions.eo import EOExtension
+from pystac.validation import GetSchemaError, JsonSchemaSTACValidator, SchemaCache
+from pystac.validation.schema_cache import CACHE_DIR_ENV_VAR, OFFLINE_ENV_VAR
+
+EXTENSION_URI = "http://pystac-extensions.test/ext/v1.0.0/schema.json"
+DEFINITIONS_URI = "http://pystac-extensions.test/ext/v1.0.0/definitions.json"
+ITEM_SCHEMA_URI = "https://schemas.stacspec.org/v1.1.0/item-spec/json-schema/item.json"
+
+SCHEMAS: dict[str, dict[str, Any]] = {
+    EXTENSION_URI: {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "$id": EXTENSION_URI,
+        "allOf": [
+            {"$ref": ITEM_SCHEMA_URI},
+            {"$ref": "definitions.json#/definitions/fields"},
+        ],
+    },
+    DEFINITIONS_URI: {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "$id": DEFINITIONS_URI,
+        "definitions": {
+            "fields": {
+                "type": "object",
+                "properties": {
+                    "properties": {
+                        "type": "object",
+                        "properties": {"ext:value": {"type": "integer"}},
+                    }
+                },
+            }
+        },
+    },
+}
+
+
+class SchemaStacIO(pystac.StacIO):
+    """Serves schemas from memory, recording the HREFs read."""
+
+    def __init__(self, schemas: dict[str, dict[str, Any]] | None = None) -> None:
+        self.schemas = SCHEMAS if schemas is None else schemas
+        self.hrefs: list[str] = []
+
+    def read_text(self, source: Any, *args: Any, **kwargs: Any) -> str:
+        self.hrefs.append(str(source))
+        return json.dumps(self.schemas.get(str(source), {}))
+
+    def write_text(self, dest: Any, txt: str, *args: Any, **kwargs: Any) -> None:
+        raise NotImplementedError
+
+
+@pytest.fixture
+def extension_item(item: pystac.Item) -> pystac.Item:
+    item.stac_extensions.append(EXTENSION_URI)
+    item.properties["ext:value"] = 42
+    return item
+
+
+def test_get_path(tmp_path: Path) -> None:
+    cache = SchemaCache(tmp_path)
+    assert cache.get_path(
+        "https://stac-extensions.github.io/eo/v1.1.0/schema.json#/definitions"
+    ) == str(tmp_path / "stac-extensions.github.io" / "eo" / "v1.1.0" / "schema.json")
+    assert cache.get_path("/a/local/schema.json") is None
+    assert cache.get_path("file:///a/local/schema.json") is None
+
+    path = cache.get_path("https://example.test/a/../../../schema.json?version=1")
+    assert path is not None
+    assert os.path.abspath(path).startswith(str(tmp_path / "example.test" / "a"))
+
+
+def test_put_and_get(tmp_path: Path) -> None:
+    cache = SchemaCache(tmp_path / "cache")
+    assert cache.get(EXTENSION_URI) is None
+    assert EXTENSION_URI not in cache
+
+    cache.put(EXTENSION_URI, SCHEMAS[EXTENSION_URI])
+    assert EXTENSION_URI in cache
+    assert cache.get(EXTENSION_URI) == SCHEMAS[EXTENSION_URI]
+    assert SchemaCache(tmp_path / "cache").get(EXTENSION_URI) == SCHEMAS[EXTENSION_URI]
+    assert [p.name for p in (tmp_path / "cache").glob("**/*") if p.is_file()] == [
+        "schema.json"
+    ]
+
+
+def test_seed_follows_references(tmp_path: Path) -> None:
+    cache = SchemaCache(tmp_path)
+    stac_io = SchemaStacIO()
+    assert sorted(cache.seed([EXTENSION_URI], stac_io=stac_io)) == [
+        DEFINITIONS_URI,
+        EXTENSION_URI,
+    ]
+    # The core item schema is bundled with PySTAC, so it is not fetched
+    assert ITEM_SCHEMA_URI not in stac_io.hrefs
+    assert cache.get(DEFINITIONS_URI) == SCHEMAS[DEFINITIONS_URI]
+
+    assert cache.seed([EXTENSION_URI], stac_io=stac_io) == []
+    assert len(stac_io.hrefs) == 2
+
+
+def test_seed_defaults_to_registered_extensions(tmp_path: Path) -> None:
+    fetched = SchemaCache(tmp_path).seed(stac_io=SchemaStacIO({}))
+    assert EOExtension.get_schema_uri() in fetched
+
+
+def test_seed_raises_get_schema_error(tmp_path: Path) -> None:
+    class FailingStacIO(SchemaStacIO):
+        def read_text(self, source: Any, *args: Any, **kwargs: Any) -> str:
+            raise OSError("network is unreachable")
+
+    with pytest.raises(GetSchemaError, match="network is unreachable"):
+        SchemaCache(tmp_path).seed([EXTENSION_URI], stac_io=FailingStacIO())
+
+
+@pytest.mark.block_network
+def test_offline_validation_from_seeded_cache(
+    tmp_path: Path, extension_item: pystac.Item
+) -> None:
+    SchemaCache(tmp_path).seed([EXTENSION_URI], stac_io=SchemaStacIO())
+
+    validator = JsonSchemaSTACValidator(cache_dir=tmp_path, offline=True)
+    assert extension_item.validate(validator=validator) == [
+        ITEM_SCHEMA_URI,
+        EXTENSION_URI,
+    ]
+
+    extension_item.properties["ext:value"] = "not an integer"
+    with pytest.raises(pystac.STACValidationError):
+        extension_item.validate(validator=validator)
+
+
+@pytest.mark.block_network
+def test_offline_validation_without_cached_schema(
+    extension_item: pystac.Item,
+) -> None:
+    validator = JsonSchemaSTACValidator(offline=True)
+    with pytest.raises(GetSchemaError, match="offline"):
+        extension_item.validate(validator=validator)
+
+
+def test_fetched_schemas_are_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, extension_item: pystac.Item
+) -> None:
+    stac_io = SchemaStacIO()
+    monkeypatch.setattr(pystac.StacIO, "_default_io", lambda: stac_io)
+
+    extension_item.validate(validator=JsonSchemaSTACValidator(cache_dir=tmp_path))
+    assert sorted(stac_io.hrefs) == [DEFINITIONS_URI, EXTENSION_URI]
+
+    # Another validator, e.g. in another process, reads the schemas from the cache
+    extension_item.validate(validator=JsonSchemaSTACValidator(cache_dir=tmp_path))
+    assert len(stac_io.hrefs) == 2
+
+
+def test_cache_and_offline_from_env(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+    monkeypatch.delenv(OFFLINE_ENV_VAR, raising=False)
+    validator = JsonSchemaSTACValidator()
+    assert validator.disk_cache is None
+    assert not validator.offline
+
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    monkeypatch.setenv(OFFLINE_ENV_VAR, "true")
+    validator = JsonSchemaSTACValidator()
+    assert validator.disk_cache is not None
+    assert validator.disk_cache.directory == str(tmp_path)
+    assert validator.offline
+    assert not JsonSchemaSTACValidator(offline=False).offline
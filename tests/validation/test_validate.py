@@ -2,7 +2,9 @@ import json
 import os
 import shutil
 import tempfile
+import unittest.mock
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, cast
 
 import jsonschema
@@ -259,3 +261,127 @@ def test_404_schema_url(requests_mock: Mocker, item: pystac.Item) -> None:
         GetSchemaError, match="http://pystac-extensions.test/a-fake.schema.json"
     ):
         item.validate()
+
+
+@pytest.mark.block_network
+def test_validators_are_compiled_once(
+    monkeypatch: pytest.MonkeyPatch, item: pystac.Item
+) -> None:
+    validator = JsonSchemaSTACValidator()
+    check_schema = unittest.mock.Mock(wraps=jsonschema.Draft7Validator.check_schema)
+    monkeypatch.setattr(jsonschema.Draft7Validator, "check_schema", check_schema)
+
+    registry = validator.registry
+    for _ in range(3):
+        item.validate(validator=validator)
+    assert check_schema.call_count == 1
+    assert validator.registry is registry
+
+    item.properties["gsd"] = -1
+    with pytest.raises(pystac.STACValidationError):
+        item.validate(validator=validator)
+    assert check_schema.call_count == 1
+
+
+def make_catalog_with_invalid_items(tmp_path: Path) -> pystac.Catalog:
+    catalog = pystac.Catalog("test", "a catalog")
+    collection = pystac.Collection(
+        "collection",
+        "a collection",
+        pystac.Extent(
+            pystac.SpatialExtent([[-180.0, -90.0, 180.0, 90.0]]),
+            pystac.TemporalExtent([[datetime(2020, 1, 1, tzinfo=timezone.utc), None]]),
+        ),
+    )
+    catalog.add_child(collection)
+    for i in range(10):
+        item = pystac.Item(
+            f"item-{i}", None, None, datetime(2020, 1, 1, tzinfo=timezone.utc), {}
+        )
+        if i % 4 == 1:
+            item.properties["gsd"] = -1
+        collection.add_item(item)
+    catalog.normalize_and_save(str(tmp_path), pystac.CatalogType.SELF_CONTAINED)
+    return catalog
+
+
+@pytest.mark.block_network
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_validate_all_report(tmp_path: Path, max_workers: int | None) -> None:
+    catalog = make_catalog_with_invalid_items(tmp_path)
+
+    report = pystac.validation.validate_all_report(catalog, max_workers=max_workers)
+    assert not report
+    assert report.num_validated == 12
+    assert report.num_failed == 3
+    assert [failure.id for failure in report.failures] == [
+        "item-1",
+        "item-5",
+        "item-9",
+    ]
+    failure = report.failures[0]
+    assert failure.href == str(tmp_path / "collection" / "item-1" / "item-1.json")
+    assert failure.schema_uri is not None
+    assert failure.schema_uri.endswith("item-spec/json-schema/item.json")
+    assert failure.path == "$.properties.gsd"
+    assert "-1" in failure.error
+    assert report.objects_per_second > 0
+    json.dumps(report.to_dict())
+
+
+@pytest.mark.block_network
+def test_validate_all_report_collects_schema_errors(tmp_path: Path) -> None:
+    catalog = make_catalog_with_invalid_items(tmp_path)
+    item = next(iter(catalog.get_items(recursive=True)))
+    extension_uri = "http://pystac-extensions.test/a-fake-schema.json"
+    item.stac_extensions.append(extension_uri)
+    item.properties["gsd"] = -1
+
+    report = catalog.validate_all_report()
+    assert report.num_validated == 12
+    assert report.num_failed == 4
+    item_failures = [f for f in report.failures if f.id == "item-0"]
+    assert len(item_failures) == 2
+    core_schema_uri = item_failures[0].schema_uri
+    assert core_schema_uri is not None
+    assert core_schema_uri.endswith("item.json")
+    assert item_failures[1].schema_uri == extension_uri
+    assert extension_uri in item_failures[1].error
+
+
+@pytest.mark.block_network
+def test_catalog_validate_all_report_max_items(tmp_path: Path) -> None:
+    catalog = make_catalog_with_invalid_items(tmp_path)
+
+    report = catalog.validate_all_report(max_items=2, max_workers=2)
+    assert report.num_validated == 4
+    assert [failure.id for failure in report.failures] == ["item-1"]
+
+    report = catalog.validate_all_report(recursive=False)
+    assert report.num_validated == 2
+    assert report
+
+
+@pytest.mark.block_network
+@pytest.mark.parametrize("from_catalog", [False, True])
+def test_validate_all_report_missing_item(tmp_path: Path, from_catalog: bool) -> None:
+    make_catalog_with_invalid_items(tmp_path)
+    missing_href = str(tmp_path / "collection" / "item-2" / "item-2.json")
+    os.remove(missing_href)
+    catalog = pystac.Catalog.from_file(str(tmp_path / "catalog.json"))
+
+    if from_catalog:
+        report = catalog.validate_all_report()
+    else:
+        report = pystac.validation.validate_all_report(catalog)
+    assert report.num_validated == 12
+    assert [failure.id for failure in report.failures] == [
+        "item-1",
+        None,
+        "item-5",
+        "item-9",
+    ]
+    failure = report.failures[1]
+    assert failure.href == missing_href
+    assert failure.schema_uri is None
+    assert failure.error